@@ -0,0 +1,154 @@
+"""
+Braking and traction forces as per IRC:6-2017 Clause 211, evaluated in closed form
+for arrays of bridges (spans, lane counts and vehicle mixes).
+"""
+
+import numpy as np
+from common import *
+from vehicle_arrays import axle_arrays
+
+
+def train_spacing(vehicle):
+    """
+    Returns the clear spacing between successive vehicles of a train, read from the
+    'spacing_...' entry of the vehicle dictionary, or None for a single vehicle.
+    """
+    for key, value in vehicle.items():
+        if key.startswith('spacing_'):
+            return value
+    return None
+
+
+def vehicle_length(vehicle):
+    """
+    Returns the overall length of a vehicle, nose to tail, from its 'length' entry,
+    or the position of its last load where the vehicle dictionary gives none.
+    """
+    if 'length' in vehicle:
+        return float(vehicle['length'])
+    return float(np.max(vehicle['x']))
+
+
+def train_load_on_span(vehicle, span):
+    """
+    Load of a vehicle train standing on a span with the first vehicle entering at
+    one end and succeeding vehicles following at the clear train spacing, measured
+    from the tail of one vehicle to the nose of the next.
+
+    The pitch is the vehicle length plus the clear spacing. The number of positions
+    k >= 0 with x_i + k * pitch <= span is counted per axle,
+    so no vehicle is rebuilt and no lane or vehicle loop is needed.
+
+    Args:
+        vehicle (dict): vehicle from the IRC6_2017 vehicle functions
+        span (float or array): loaded length in metres
+
+    Returns:
+        tuple: (first, succeeding) arrays with the shape of `span`, the load of the
+            first vehicle on the span and of the succeeding vehicles or part thereof
+    """
+    x, loads = axle_arrays(vehicle)
+    span = np.asarray(span, dtype=float)
+    on_span = x <= span[..., None]
+    first = np.sum(np.where(on_span, loads, 0.0), axis=-1)
+
+    spacing = train_spacing(vehicle)
+    if spacing is None:
+        return first, np.zeros_like(first)
+
+    pitch = vehicle_length(vehicle) + spacing
+    count = np.where(on_span, np.floor((span[..., None] - x) / pitch) + 1, 0.0)
+    total = np.sum(count * loads, axis=-1)
+    return first, total - first
+
+
+def braking_force(design_lanes, span, vehicles, lead_vehicle=0, excess_vehicle=0):
+    """
+    Computes the Clause 211.2 braking force for many bridges at once.
+
+    (a) single or two lane bridges: 20 % of the first train load plus 10 % of the
+        succeeding trains or part thereof, the train in one lane only;
+    (b) more than two lanes: as in (a) plus 5 % of the loads on the lanes in
+        excess of two.
+
+    Args:
+        design_lanes (int or array): number of lanes for design purposes
+        span (float or array): span in metres
+        vehicles (list): vehicle dictionaries making up the vehicle mixes
+        lead_vehicle (int or array): index into `vehicles` of the train in the first lane
+        excess_vehicle (int or array): index into `vehicles` of the train in each
+            lane in excess of two
+
+    Returns:
+        dict: {
+            'first': 20 % of the first train,
+            'succeeding': 10 % of the succeeding trains,
+            'excess_lanes': 5 % of the loads on the lanes in excess of two,
+            'braking_force': total braking force
+        } as arrays broadcast over the inputs
+    """
+    design_lanes, span, lead_vehicle, excess_vehicle = np.broadcast_arrays(
+        np.asarray(design_lanes), np.asarray(span, dtype=float),
+        np.asarray(lead_vehicle), np.asarray(excess_vehicle))
+    if np.any(design_lanes < 1):
+        raise ValueError("design_lanes must be at least 1")
+
+    # One evaluation per vehicle type, gathered per bridge
+    loads = np.array([train_load_on_span(vehicle, span) for vehicle in vehicles])
+    first = np.take_along_axis(loads[:, 0], lead_vehicle[None, ...], 0)[0]
+    succeeding = np.take_along_axis(loads[:, 1], lead_vehicle[None, ...], 0)[0]
+    excess_train = np.take_along_axis(loads[:, 0] + loads[:, 1], excess_vehicle[None, ...], 0)[0]
+
+    force_first = 0.20 * first
+    force_succeeding = 0.10 * succeeding
+    force_excess = 0.05 * excess_train * np.maximum(design_lanes - 2, 0)
+
+    return {
+        'first': force_first,
+        'succeeding': force_succeeding,
+        'excess_lanes': force_excess,
+        'braking_force': force_first + force_succeeding + force_excess,
+    }
+
+
+def bearing_forces(force, span, dead_load_reaction, live_load_reaction, bearing_level=0.0,
+                   mu=KEY_BEARING_FRICTION):
+    """
+    Distributes the braking force of a simply supported span on one fixed and one
+    free bearing line as per Clause 211.3 and 211.5.
+
+    The force acts 1.2 m above the roadway; its moment about the bearings changes
+    the vertical reactions by +-F (1.2 + e) / L. The free bearing resists
+    mu (Rg + Rq) and the fixed bearing the larger of Fh - mu (Rg + Rq) and
+    Fh / 2 + mu (Rg + Rq).
+
+    Args:
+        force (float or array): braking force Fh
+        span (float or array): span L in metres
+        dead_load_reaction, live_load_reaction (float or array): Rg and Rq at the
+            free bearing line
+        bearing_level (float or array): depth e of the bearings below the roadway (m)
+        mu (float or array): coefficient of friction at the free bearings
+
+    Returns:
+        dict: {
+            'height': lever arm of the force above the bearings (m),
+            'delta_reaction': change in vertical reaction at each end,
+            'free': horizontal force on the free bearing line,
+            'fixed': horizontal force on the fixed bearing line
+        }
+    """
+    force = np.asarray(force, dtype=float)
+    height = KEY_BRAKING_FORCE_HEIGHT + np.asarray(bearing_level, dtype=float)
+    delta_reaction = force * height / np.asarray(span, dtype=float)
+
+    friction = mu * (np.asarray(dead_load_reaction, dtype=float) + np.asarray(live_load_reaction, dtype=float))
+    free = friction
+    fixed = np.maximum(force - friction, force / 2.0 + friction)
+
+    return {
+        'height': height,
+        'delta_reaction': delta_reaction,
+        'free': free,
+        'fixed': fixed,
+    }
@@ -0,0 +1,86 @@
+"""
+Centrifugal forces on curved decks as per IRC:6-2017 Clause 212, evaluated in
+closed form for arrays of design speeds, radii, spans and lane counts.
+"""
+
+import numpy as np
+from common import *
+from braking import train_load_on_span
+
+
+def centrifugal_force(live_load, design_speed, radius):
+    """
+    Vectorized Clause 212.2 centrifugal force C = W V^2 / (127 R)
+    (see IRC6_2017.cl_212_2_centrifugal_force).
+
+    Args:
+        live_load (float or array): live load W, without impact
+        design_speed (float or array): design speed V in km/h
+        radius (float or array): radius of curvature R in metres
+
+    Returns:
+        array: C in the units of W, broadcast over the inputs
+    """
+    radius = np.asarray(radius, dtype=float)
+    if np.any(radius <= 0.0):
+        raise ValueError("Radius of curvature must be positive")
+    design_speed = np.asarray(design_speed, dtype=float)
+    return np.asarray(live_load, dtype=float) * design_speed ** 2 / (127.0 * radius)
+
+
+def curved_deck_forces(design_lanes, span, design_speed, radius, vehicles, lead_vehicle=0, other_vehicle=0,
+                       bearing_level=0.0, bearing_spacing=None):
+    """
+    Centrifugal force of the vehicle trains on a curved span, with its line of
+    action and overturning effect, for whole families of ramps at once.
+
+    The live load W is the train load standing on the span in every design lane,
+    the first lane carrying trains of `lead_vehicle` and the others trains of
+    `other_vehicle`. The force acts 1.2 m above the carriageway (Clause 212.3) and
+    its overturning moment about the bearings is C (1.2 + e) (Clause 212.5).
+
+    Args:
+        design_lanes (int or array): number of lanes for design purposes
+        span (float or array): loaded length along the curve in metres
+        design_speed (float or array): design speed V in km/h
+        radius (float or array): radius of curvature R in metres
+        vehicles (list): vehicle dictionaries making up the vehicle mixes
+        lead_vehicle, other_vehicle (int or array): indices into `vehicles`
+        bearing_level (float or array): depth e of the bearings below the carriageway (m)
+        bearing_spacing (float or array, optional): transverse distance between the
+            outer bearings (m) for the change in bearing reactions
+
+    Returns:
+        dict: {
+            'live_load': W,
+            'centrifugal_force': C,
+            'height': lever arm of C above the bearings (m),
+            'overturning_moment': C times the lever arm,
+            'delta_reaction': +- change in the outer bearing reactions (only with bearing_spacing)
+        } as arrays broadcast over the inputs
+    """
+    design_lanes, span, lead_vehicle, other_vehicle = np.broadcast_arrays(
+        np.asarray(design_lanes), np.asarray(span, dtype=float),
+        np.asarray(lead_vehicle), np.asarray(other_vehicle))
+    if np.any(design_lanes < 1):
+        raise ValueError("design_lanes must be at least 1")
+
+    # One train evaluation per vehicle type, gathered per case
+    trains = np.array([np.sum(train_load_on_span(vehicle, span), axis=0) for vehicle in vehicles])
+    lead = np.take_along_axis(trains, lead_vehicle[None, ...], 0)[0]
+    other = np.take_along_axis(trains, other_vehicle[None, ...], 0)[0]
+    live_load = lead + other * (design_lanes - 1)
+
+    force = centrifugal_force(live_load, design_speed, radius)
+    height = KEY_CENTRIFUGAL_FORCE_HEIGHT + np.asarray(bearing_level, dtype=float)
+    moment = force * height
+
+    result = {
+        'live_load': np.broadcast_to(live_load, force.shape),
+        'centrifugal_force': force,
+        'height': height,
+        'overturning_moment': moment,
+    }
+    if bearing_spacing is not None:
+        result['delta_reaction'] = moment / np.asarray(bearing_spacing, dtype=float)
+    return result
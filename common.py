@@ -21,9 +21,16 @@ KEY_FOOTPATH_CLEAR_MIN_WIDTH = 1500  # in mm
 KEY_RAILING_MIN_HEIGHT = [1100, 1250] # in mm
 KEY_CYCLE_TRACK = ['None', 'Single', 'Both Sides'] 
 KEY_MIN_SKEW_ANGLE = 30  # in degrees
+KEY_MAX_SKEW_ANGLE = 60  # in degrees, range of the skew correction factors below
+KEY_SKEW_MOMENT_REDUCTION = (1.05, 0.25)  # r = 1.05 - 0.25 tan(skew) <= 1.0 for slabs (AASHTO LRFD 4.6.2.3)
+KEY_SKEW_SHEAR_COEFFICIENT = 0.20  # obtuse corner 1 + c tan(skew) (AASHTO LRFD Table 4.6.2.2.3c-1)
 KEY_WEARING_COAT = ['bituminous', 'concrete']
 KEY_CRASH_BARRIER_TYPE = ['Flexible', 'Semi-Rigid', 'Rigid']
 KEY_RAILING_TYPE = ['RCC', 'steel']
+KEY_FOOTWAY_LOAD = {'footway': 400, 'crowd': 500}  # in kg/m2 (IRC:6-2017 Clause 206.1)
+KEY_KERB_LATERAL_LOAD = 750  # in kg/m, horizontal at top of kerb (IRC:6-2017 Clause 206.2)
+KEY_MIN_LOADED_KERB_WIDTH = 600  # in mm, narrower kerbs carry no footway load (IRC:6-2017 Clause 206.2)
+KEY_RAILING_LOAD = 150  # in kg/m, horizontal and vertical at top of railing (IRC:6-2017 Clause 206.5)
 KEY_MIN_LOGITUDINAL_GRADIENT = 0.3  # in percent
 KEY_MAX_BRIDGE_LENGTH_SINGLE_CURVE = 30  # in meters
 KEY_RIGID_CRASH_BARRIER_TYPE = ['IRC-5R', 'High Containment']
@@ -38,3 +45,37 @@ KEY_MEDIAN_TYPE = [
     'RCC Crash Barrier',
     'Metallic Crash Barrier'
 ]
+
+# Class A tyre contact area, axle load (t) -> (B, W) in mm (IRC:6-2017 Fig. 3)
+KEY_CLASS_A_CONTACT_AREA = {
+    11.4: (250, 500),
+    6.8: (200, 380),
+    2.7: (150, 200),
+}
+
+# Effective width of slabs, constant alpha against b / l0 (IRC:112-2011 Annex B3)
+KEY_EFFECTIVE_WIDTH_B_L0 = [0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0,
+                            1.1, 1.2, 1.3, 1.4, 1.5, 1.6, 1.7, 1.8, 1.9, 2.0]
+KEY_EFFECTIVE_WIDTH_ALPHA = {
+    'simply_supported': [0.40, 0.80, 1.16, 1.48, 1.72, 1.96, 2.12, 2.24, 2.36, 2.48,
+                         2.60, 2.64, 2.72, 2.80, 2.84, 2.88, 2.92, 2.96, 3.00, 3.00],
+    'continuous': [0.40, 0.80, 1.16, 1.44, 1.68, 1.84, 1.96, 2.08, 2.16, 2.24,
+                   2.28, 2.36, 2.40, 2.48, 2.48, 2.52, 2.56, 2.60, 2.60, 2.60],
+}
+
+KEY_BRAKING_FORCE_HEIGHT = 1.2  # in meters above roadway (IRC:6-2017 Clause 211.3)
+KEY_CENTRIFUGAL_FORCE_HEIGHT = 1.2  # in meters above carriageway (IRC:6-2017 Clause 212.3)
+KEY_BEARING_FRICTION = 0.05  # coefficient of friction at free bearings (IRC:6-2017 Clause 211.5)
+KEY_GIRDER_SECTION = ['plate', 'rolled']
+KEY_TERRAIN = ['plain', 'obstructed']
+
+# Response spectrum (IRC:6-2017 Clause 219), soil types I, II and III
+KEY_SPECTRUM_CORNER_PERIOD = [0.40, 0.55, 0.67]  # in seconds
+KEY_SPECTRUM_COEFFICIENT = [1.00, 1.36, 1.67]
+
+KEY_THERMAL_EXPANSION_COEFFICIENT = 12 * 1.0e-6  # per °C (IRC:6-2017 Clause 215.4)
+
+# Temperature differences in concrete superstructures, 50 mm surfacing (IRC:6-2017 Clause 215.3, Fig. 10)
+KEY_POSITIVE_TEMPERATURE_DIFFERENCE = (17.8, 4.0, 2.1)  # T1, T2, T3 in °C, heating
+KEY_REVERSE_TEMPERATURE_DIFFERENCE = (10.6, 0.7, 0.8, 6.6)  # T1 to T4 in °C, cooling
+KEY_TEMPERATURE_MODULUS_FACTOR = 0.5  # modulus of concrete for temperature stresses, times Ec
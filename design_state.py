@@ -0,0 +1,196 @@
+"""
+Persistent design state for exploring many design variants.
+
+A `DesignState` is an immutable mapping. Setting entries returns a new version
+that stores only the changed entries and points at its parent, so variants
+derived from a common base share every unchanged entry instead of copying the
+whole design dictionary. Versions with a common ancestor are diffed by walking
+their change layers only.
+
+The IRC5_2015 clauses that take a `design_dict` accept either a plain dict
+(previous behaviour) or a `DesignState`, which they return a new version of.
+"""
+
+from collections.abc import Mapping
+
+import numpy as np
+
+_DELETED = object()
+
+
+def _same(a, b):
+    """Equal values of the same type (1, 1.0 and True count as changes)."""
+    if a is b:
+        return True
+    if type(a) is not type(b):
+        return False
+    if isinstance(a, np.ndarray):
+        return a.dtype == b.dtype and np.array_equal(a, b)
+    try:
+        return bool(a == b)
+    except (TypeError, ValueError):  # e.g. containers holding arrays
+        return False
+
+
+class DesignState(Mapping):
+    """
+    Immutable, structurally shared design dictionary.
+
+    Args:
+        data (mapping, optional): initial entries of a root version
+    """
+    __slots__ = ('_parent', '_delta', '_depth', '_len')
+
+    # Chains longer than this are flattened into a new root on the next change
+    MAX_DEPTH = 64
+
+    def __init__(self, data=None):
+        self._parent = None
+        self._delta = dict(data or {})
+        self._depth = 0
+        self._len = len(self._delta)
+
+    @classmethod
+    def _child(cls, parent, delta, length):
+        state = cls.__new__(cls)
+        state._parent = parent
+        state._delta = delta
+        state._depth = parent._depth + 1
+        state._len = length
+        return state
+
+    def _lookup(self, key):
+        node = self
+        while node is not None:
+            if key in node._delta:
+                return node._delta[key]
+            node = node._parent
+        return _DELETED
+
+    def __getitem__(self, key):
+        value = self._lookup(key)
+        if value is _DELETED:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key):
+        return self._lookup(key) is not _DELETED
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self):
+        return iter(self.to_dict())
+
+    def __repr__(self):
+        return f"DesignState({self.to_dict()!r})"
+
+    def _chain(self):
+        chain = []
+        node = self
+        while node is not None:
+            chain.append(node)
+            node = node._parent
+        return chain
+
+    def to_dict(self):
+        """Plain dict of the current entries."""
+        data = {}
+        for node in reversed(self._chain()):
+            data.update(node._delta)
+        return {key: value for key, value in data.items() if value is not _DELETED}
+
+    def copy(self):
+        return self
+
+    @property
+    def parent(self):
+        return self._parent
+
+    def _evolve(self, delta):
+        delta = {key: value for key, value in delta.items() if not _same(self._lookup(key), value)}
+        if not delta:
+            return self
+        length = self._len
+        for key, value in delta.items():
+            present = self._lookup(key) is not _DELETED
+            length += (value is not _DELETED) - present
+        if self._depth >= self.MAX_DEPTH:
+            data = self.to_dict()
+            data.update(delta)
+            return DesignState({key: value for key, value in data.items() if value is not _DELETED})
+        return DesignState._child(self, delta, length)
+
+    def set(self, key, value):
+        """New version with `key` set to `value`."""
+        return self._evolve({key: value})
+
+    def with_entries(self, entries=None, **kwargs):
+        """New version with the entries of `entries` and keyword arguments set."""
+        delta = dict(entries or {})
+        delta.update(kwargs)
+        return self._evolve(delta)
+
+    def without(self, *keys):
+        """New version with `keys` removed; missing keys are ignored."""
+        return self._evolve({key: _DELETED for key in keys if key in self})
+
+    def _common_ancestor(self, other):
+        ancestors = {id(node): node for node in self._chain()}
+        node = other
+        while node is not None:
+            if id(node) in ancestors:
+                return node
+            node = node._parent
+        return None
+
+    def diff(self, other):
+        """
+        Changes from this version to `other`.
+
+        Only the change layers down to the common ancestor are compared; unrelated
+        versions are compared in full.
+
+        Returns:
+            dict: {
+                'added': {key: value in other},
+                'removed': {key: value in self},
+                'changed': {key: (value in self, value in other)}
+            }
+        """
+        ancestor = self._common_ancestor(other)
+        if ancestor is None:
+            keys = set(self.to_dict()) | set(other.to_dict())
+        else:
+            keys = set()
+            for state in (self, other):
+                node = state
+                while node is not ancestor:
+                    keys.update(node._delta)
+                    node = node._parent
+
+        result = {'added': {}, 'removed': {}, 'changed': {}}
+        for key in keys:
+            old, new = self._lookup(key), other._lookup(key)
+            if old is _DELETED and new is not _DELETED:
+                result['added'][key] = new
+            elif new is _DELETED and old is not _DELETED:
+                result['removed'][key] = old
+            elif not _same(old, new):
+                result['changed'][key] = (old, new)
+        return result
+
+
+def with_entries(design, entries, in_place=False):
+    """
+    Adds `entries` to a design dictionary or design state.
+
+    A `DesignState` always yields a new version. A plain dict is updated in place
+    if `in_place`, otherwise copied first.
+    """
+    if isinstance(design, DesignState):
+        return design.with_entries(entries)
+    if not in_place:
+        design = design.copy()
+    design.update(entries)
+    return design
@@ -0,0 +1,306 @@
+"""
+Dual numbers for forward-mode derivatives through the vectorized clause
+functions and the moving-load engine.
+
+A Dual carries an array of values and, along one extra trailing axis, their
+partial derivatives with respect to a few seeded parameters. It implements the
+NumPy ufunc and array-function protocols for the operations those modules use,
+so passing Duals in place of spans, widths, heights or wind speeds returns
+values and sensitivities from one evaluation:
+
+    span, speed = variables(span=[20.0, 30.0], speed=44.0)
+    Pz = wind.table_12(12.0, 'plain', speed)['Pz']
+    derivatives(Pz, ['span', 'speed'])  # {'span': zeros, 'speed': dPz/dVb}
+
+Piecewise functions take the derivative of the branch selected by the value,
+so at table breakpoints it is one-sided; `piecewise` gives the derivative for
+increasing parameters at the kinks of continuous functions. Results that are
+flags or indices (comparisons, argmax) are plain arrays.
+"""
+
+import numpy as np
+from numpy.lib.mixins import NDArrayOperatorsMixin
+
+
+class Dual(NDArrayOperatorsMixin):
+    """
+    Values with partial derivatives.
+
+    Args:
+        value (array): values, shape (...)
+        grad (array): partial derivatives, shape (..., n_partials)
+    """
+
+    __slots__ = ('value', 'grad')
+
+    def __init__(self, value, grad):
+        self.value = np.asarray(value, dtype=float)
+        self.grad = np.asarray(grad, dtype=float)
+        if self.grad.shape[:-1] != self.value.shape:
+            self.grad = np.broadcast_to(self.grad, self.value.shape + self.grad.shape[-1:])
+
+    @property
+    def shape(self):
+        return self.value.shape
+
+    @property
+    def ndim(self):
+        return self.value.ndim
+
+    @property
+    def size(self):
+        return self.value.size
+
+    @property
+    def partials(self):
+        return self.grad.shape[-1]
+
+    def __len__(self):
+        return len(self.value)
+
+    def __repr__(self):
+        return f"Dual(value={self.value!r}, grad={self.grad!r})"
+
+    def __array__(self, dtype=None, copy=None):
+        raise TypeError("A Dual cannot be converted to a plain array; use its .value")
+
+    def __getitem__(self, key):
+        key = key if isinstance(key, tuple) else (key,)
+        return Dual(self.value[key], self.grad[key + (slice(None),)])
+
+    def reshape(self, *shape):
+        shape = shape[0] if len(shape) == 1 and isinstance(shape[0], (tuple, list)) else shape
+        value = self.value.reshape(shape)
+        return Dual(value, self.grad.reshape(value.shape + (self.partials,)))
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        if method != '__call__' or 'out' in kwargs:
+            return NotImplemented
+        values = [x.value if isinstance(x, Dual) else np.asarray(x) for x in inputs]
+        if ufunc in _PLAIN:
+            return ufunc(*values, **kwargs)
+        value = ufunc(*values, **kwargs)
+        if ufunc in _UNARY and len(inputs) == 1:
+            return Dual(value, _UNARY[ufunc](values[0], value)[..., None] * inputs[0].grad)
+        if ufunc in _BINARY:
+            a, b = inputs
+            da, db = _BINARY[ufunc](values[0], values[1], value)
+            return Dual(value, _chain(value, (a, da), (b, db)))
+        if ufunc is np.matmul and isinstance(inputs[0], Dual) and not isinstance(inputs[1], Dual):
+            grad = np.moveaxis(np.moveaxis(inputs[0].grad, -1, 0) @ values[1], 0, -1)
+            return Dual(value, grad)
+        return NotImplemented
+
+    def __array_function__(self, func, types, args, kwargs):
+        if func not in _FUNCTIONS:
+            return NotImplemented
+        return _FUNCTIONS[func](*args, **kwargs)
+
+
+def _chain(value, *terms):
+    """Sum of d(result)/d(operand) x d(operand) over the Dual operands."""
+    grad = None
+    for operand, derivative in terms:
+        if isinstance(operand, Dual):
+            term = np.asarray(derivative)[..., None] * operand.grad
+            grad = term if grad is None else grad + term
+    return np.broadcast_to(grad, np.shape(value) + grad.shape[-1:])
+
+
+def _power(a, b, y):
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return b * np.power(a, b - 1.0), np.where(a > 0.0, y * np.log(np.where(a > 0.0, a, 1.0)), 0.0)
+
+
+_UNARY = {
+    np.negative: lambda x, y: -np.ones_like(x, dtype=float),
+    np.positive: lambda x, y: np.ones_like(x, dtype=float),
+    np.absolute: lambda x, y: np.sign(x),
+    np.sqrt: lambda x, y: 0.5 / y,
+    np.square: lambda x, y: 2.0 * x,
+    np.reciprocal: lambda x, y: -y * y,
+    np.exp: lambda x, y: y,
+    np.log: lambda x, y: 1.0 / x,
+    np.sin: lambda x, y: np.cos(x),
+    np.cos: lambda x, y: -np.sin(x),
+    np.tan: lambda x, y: 1.0 + y * y,
+    np.arctan: lambda x, y: 1.0 / (1.0 + x * x),
+}
+
+_BINARY = {
+    np.add: lambda a, b, y: (1.0, 1.0),
+    np.subtract: lambda a, b, y: (1.0, -1.0),
+    np.multiply: lambda a, b, y: (b, a),
+    np.true_divide: lambda a, b, y: (1.0 / b, -y / b),
+    np.power: _power,
+    np.minimum: lambda a, b, y: (a <= b, a > b),
+    np.maximum: lambda a, b, y: (a >= b, a < b),
+    np.fmin: lambda a, b, y: (a <= b, a > b),
+    np.fmax: lambda a, b, y: (a >= b, a < b),
+}
+
+# Ufuncs whose results are flags or piecewise constant: evaluated on the values
+_PLAIN = {
+    np.less, np.less_equal, np.greater, np.greater_equal, np.equal, np.not_equal,
+    np.logical_and, np.logical_or, np.logical_not, np.logical_xor,
+    np.isfinite, np.isnan, np.isinf, np.sign, np.floor, np.ceil, np.rint, np.trunc,
+}
+
+
+def _value(x):
+    return x.value if isinstance(x, Dual) else x
+
+
+def _as_dual(x, partials):
+    if isinstance(x, Dual):
+        return x
+    value = np.asarray(x, dtype=float)
+    return Dual(value, np.zeros(value.shape + (partials,)))
+
+
+def _grad_axis(axis):
+    # Value axes keep their index in the gradient except from the end
+    return axis - 1 if axis < 0 else axis
+
+
+def _where(condition, x, y):
+    condition = np.asarray(_value(condition), dtype=bool)
+    value = np.where(condition, _value(x), _value(y))
+    n = partials(x, y)
+    gx, gy = (_as_dual(v, n).grad for v in (x, y))
+    return Dual(value, np.where(condition[..., None], gx, gy))
+
+
+def _clip(a, a_min=None, a_max=None, **kwargs):
+    if a_min is not None:
+        a = np.maximum(a, a_min)
+    if a_max is not None:
+        a = np.minimum(a, a_max)
+    return a
+
+
+def _interp(x, xp, fp, left=None, right=None, period=None):
+    if isinstance(xp, Dual) or isinstance(fp, Dual) or period is not None:
+        raise TypeError("interp differentiates with respect to x only")
+    xp, fp = np.asarray(xp, dtype=float), np.asarray(fp, dtype=float)
+    value = np.interp(x.value, xp, fp, left, right)
+    i = np.clip(np.searchsorted(xp, x.value, side='right') - 1, 0, xp.size - 2)
+    slope = np.where((x.value >= xp[0]) & (x.value <= xp[-1]), (np.diff(fp) / np.diff(xp))[i], 0.0)
+    return Dual(value, slope[..., None] * x.grad)
+
+
+def _broadcast_to(array, shape, **kwargs):
+    if not isinstance(array, Dual):
+        return np.broadcast_to(array, shape)
+    shape = tuple(shape)
+    return Dual(np.broadcast_to(array.value, shape), np.broadcast_to(array.grad, shape + (array.partials,)))
+
+
+def _broadcast_arrays(*args, **kwargs):
+    shape = np.broadcast_shapes(*(np.shape(_value(a)) for a in args))
+    return [_broadcast_to(a if isinstance(a, Dual) else np.asarray(a), shape) for a in args]
+
+
+def _take_along_axis(arr, indices, axis):
+    axis = axis % arr.ndim
+    return Dual(np.take_along_axis(arr.value, indices, axis), np.take_along_axis(arr.grad, indices[..., None], axis))
+
+
+def _concatenate(arrays, axis=0, **kwargs):
+    n = partials(*arrays)
+    arrays = [_as_dual(a, n) for a in arrays]
+    return Dual(np.concatenate([a.value for a in arrays], axis),
+                np.concatenate([a.grad for a in arrays], _grad_axis(axis)))
+
+
+def _stack(arrays, axis=0, **kwargs):
+    n = partials(*arrays)
+    arrays = [_as_dual(a, n) for a in arrays]
+    return Dual(np.stack([a.value for a in arrays], axis), np.stack([a.grad for a in arrays], _grad_axis(axis)))
+
+
+def _sum(a, axis=None, **kwargs):
+    axes = tuple(range(a.ndim)) if axis is None else axis
+    axes = tuple(_grad_axis(ax) for ax in np.atleast_1d(axes))
+    return Dual(np.sum(a.value, axis), np.sum(a.grad, axes))
+
+
+_FUNCTIONS = {
+    np.where: _where,
+    np.clip: _clip,
+    np.interp: _interp,
+    np.broadcast_to: _broadcast_to,
+    np.broadcast_arrays: _broadcast_arrays,
+    np.take_along_axis: _take_along_axis,
+    np.concatenate: _concatenate,
+    np.stack: _stack,
+    np.sum: _sum,
+    np.reshape: lambda a, shape, **kwargs: a.reshape(shape),
+    np.shape: lambda a: a.shape,
+    np.ndim: lambda a: a.ndim,
+    np.size: lambda a, axis=None: a.size if axis is None else a.shape[axis],
+    np.argmax: lambda a, axis=None, **kwargs: np.argmax(a.value, axis, **kwargs),
+    np.argmin: lambda a, axis=None, **kwargs: np.argmin(a.value, axis, **kwargs),
+    np.zeros_like: lambda a, **kwargs: np.zeros(a.shape),
+    np.ones_like: lambda a, **kwargs: np.ones(a.shape),
+}
+
+
+def as_float(x):
+    """Float array of x, Duals passing through unchanged."""
+    return x if isinstance(x, Dual) else np.asarray(x, dtype=float)
+
+
+def partials(*values):
+    """Number of partial derivatives carried by the Duals among values (0 if none)."""
+    return max((v.partials for v in values if isinstance(v, Dual)), default=0)
+
+
+def variables(**values):
+    """
+    Duals seeded for differentiation with respect to each keyword, in order.
+
+    Returns:
+        tuple: one Dual per keyword, with unit derivative along its own partial
+    """
+    n = len(values)
+    seeded = []
+    for i, value in enumerate(values.values()):
+        value = np.asarray(value, dtype=float)
+        grad = np.zeros(value.shape + (n,))
+        grad[..., i] = 1.0
+        seeded.append(Dual(value, grad))
+    return tuple(seeded)
+
+
+def piecewise(gap, below, above, tol=1e-9):
+    """
+    np.where(gap <= 0, below, above) for a function continuous at gap = 0. For
+    Duals at the kink (|gap| <= tol, absorbing rounding) each partial derivative
+    is taken from the branch that gap moves into as that parameter increases.
+    """
+    value = np.where(gap <= 0.0, below, above)
+    if not isinstance(value, Dual) or not isinstance(gap, Dual):
+        return value
+    shape = value.grad.shape
+    g_below, g_above = (np.broadcast_to(_as_dual(v, value.partials).grad, shape) for v in (below, above))
+    velocity = np.broadcast_to(gap.grad, shape)
+    at_kink = np.broadcast_to(np.abs(gap.value) <= tol, value.shape)[..., None]
+    return Dual(value.value, np.where(at_kink, np.where(velocity > 0.0, g_above, g_below), value.grad))
+
+
+def value_of(x):
+    """Values of a Dual (plain arrays and numbers pass through)."""
+    return _value(x)
+
+
+def derivatives(x, names):
+    """
+    Partial derivatives of a result by parameter name, the names in the order
+    given to `variables`. Results that do not depend on the parameters give zeros.
+    """
+    if not isinstance(x, Dual):
+        return {name: np.zeros(np.shape(x)) for name in names}
+    if x.partials != len(names):
+        raise ValueError(f"Result carries {x.partials} partial derivatives, {len(names)} names given")
+    return {name: x.grad[..., i] for i, name in enumerate(names)}
@@ -0,0 +1,213 @@
+"""
+Influence-surface evaluation of vehicle wheel loads on slab and solid-slab decks.
+
+The influence surface is supplied as ordinates on a regular (x, z) grid, x along
+the span and z across the deck. A vehicle placed at (X, Z) puts each wheel at
+(X + x_wheel, Z + z_wheel); ordinates are taken as zero beyond the grid.
+"""
+
+import numpy as np
+from vehicle_arrays import wheel_arrays
+
+
+def wheel_samples(wheel_x, wheel_z, wheel_loads, contact_length=0.0, contact_width=0.0, n_sub=3):
+    """
+    Splits every wheel into a grid of sample points over its contact area.
+
+    Args:
+        wheel_x, wheel_z (array): wheel positions relative to the vehicle origin (m)
+        wheel_loads (array): load carried by each wheel
+        contact_length (float or array): contact length B along x (m), 0 for a point load
+        contact_width (float or array): contact width W along z (m), 0 for a point load
+        n_sub (int): sample points per side of each contact area (midpoint rule)
+
+    Returns:
+        tuple: (x, z, w) flat arrays of sample offsets and sample loads
+    """
+    wheel_x = np.asarray(wheel_x, dtype=float)
+    wheel_z = np.asarray(wheel_z, dtype=float)
+    wheel_loads = np.asarray(wheel_loads, dtype=float)
+    B = np.broadcast_to(np.asarray(contact_length, dtype=float), wheel_x.shape)
+    W = np.broadcast_to(np.asarray(contact_width, dtype=float), wheel_x.shape)
+
+    # Midpoints of n_sub equal strips on [-0.5, 0.5]
+    t = (np.arange(n_sub) + 0.5) / n_sub - 0.5
+    tx, tz = np.meshgrid(t, t, indexing='ij')
+    tx = tx.ravel()
+    tz = tz.ravel()
+
+    x = (wheel_x[:, None] + B[:, None] * tx[None, :]).ravel()
+    z = (wheel_z[:, None] + W[:, None] * tz[None, :]).ravel()
+    w = np.repeat(wheel_loads / tx.size, tx.size)
+    return x, z, w
+
+
+def bilinear(grid_x, grid_z, ordinates, x, z):
+    """
+    Bilinear interpolation of influence ordinates at arbitrary points.
+
+    Args:
+        grid_x (array): increasing, equally spaced grid coordinates along x (nx,)
+        grid_z (array): increasing, equally spaced grid coordinates along z (nz,)
+        ordinates (array): influence ordinates of shape (nx, nz)
+        x, z (array): query points of any matching shape
+
+    Returns:
+        array: interpolated ordinates, 0 more than one cell outside the grid
+    """
+    grid_x = np.asarray(grid_x, dtype=float)
+    grid_z = np.asarray(grid_z, dtype=float)
+    ordinates = np.asarray(ordinates, dtype=float)
+    x = np.asarray(x, dtype=float)
+    z = np.asarray(z, dtype=float)
+
+    # Ordinates are taken as zero beyond the grid, falling off linearly over one cell
+    padded = np.pad(ordinates, 1)
+    dx = grid_x[1] - grid_x[0]
+    dz = grid_z[1] - grid_z[0]
+    fx = (x - grid_x[0]) / dx + 1
+    fz = (z - grid_z[0]) / dz + 1
+    nx, nz = padded.shape
+
+    inside = (fx >= 0) & (fx <= nx - 1) & (fz >= 0) & (fz <= nz - 1)
+    ix = np.clip(np.floor(fx).astype(int), 0, nx - 2)
+    iz = np.clip(np.floor(fz).astype(int), 0, nz - 2)
+    tx = np.clip(fx - ix, 0.0, 1.0)
+    tz = np.clip(fz - iz, 0.0, 1.0)
+
+    value = (padded[ix, iz] * (1 - tx) * (1 - tz)
+             + padded[ix + 1, iz] * tx * (1 - tz)
+             + padded[ix, iz + 1] * (1 - tx) * tz
+             + padded[ix + 1, iz + 1] * tx * tz)
+    return np.where(inside, value, 0.0)
+
+
+def _governing(effects, placements_x, placements_z):
+    i_max = np.argmax(effects)
+    i_min = np.argmin(effects)
+    return {
+        'effects': effects,
+        'max': effects.flat[i_max],
+        'max_x': placements_x.flat[i_max],
+        'max_z': placements_z.flat[i_max],
+        'min': effects.flat[i_min],
+        'min_x': placements_x.flat[i_min],
+        'min_z': placements_z.flat[i_min],
+    }
+
+
+def evaluate_placements(grid_x, grid_z, ordinates, samples, placements_x, placements_z, chunk_size=4096):
+    """
+    Evaluates the load effect of one vehicle for many (X, Z) placements using
+    bilinear interpolation of the influence surface.
+
+    Args:
+        grid_x, grid_z, ordinates: influence surface (see `bilinear`)
+        samples (tuple): (x, z, w) wheel samples from `wheel_samples`
+        placements_x, placements_z (array): vehicle origin positions, same shape
+        chunk_size (int): placements evaluated per vectorized block
+
+    Returns:
+        dict: {
+            'effects': array of load effects with the shape of the placements,
+            'max', 'max_x', 'max_z': governing maximum and its placement,
+            'min', 'min_x', 'min_z': governing minimum and its placement
+        }
+    """
+    sx, sz, sw = samples
+    px, pz = np.broadcast_arrays(np.asarray(placements_x, dtype=float),
+                                 np.asarray(placements_z, dtype=float))
+    flat_x = px.ravel()
+    flat_z = pz.ravel()
+
+    effects = np.empty(flat_x.size)
+    for start in range(0, flat_x.size, chunk_size):
+        stop = start + chunk_size
+        ords = bilinear(grid_x, grid_z, ordinates,
+                        flat_x[start:stop, None] + sx[None, :],
+                        flat_z[start:stop, None] + sz[None, :])
+        effects[start:stop] = ords @ sw
+
+    return _governing(effects.reshape(px.shape), px, pz)
+
+
+def evaluate_grid_fft(grid_x, grid_z, ordinates, samples):
+    """
+    Evaluates the load effect of one vehicle with its origin on every node of the
+    influence grid, as a single FFT cross-correlation.
+
+    The wheel samples are spread onto the grid with bilinear weights, so the
+    result equals `evaluate_placements` at the grid nodes.
+
+    Args:
+        grid_x, grid_z, ordinates: influence surface (see `bilinear`)
+        samples (tuple): (x, z, w) wheel samples from `wheel_samples`
+
+    Returns:
+        dict: same keys as `evaluate_placements`, 'effects' of shape (nx, nz)
+    """
+    grid_x = np.asarray(grid_x, dtype=float)
+    grid_z = np.asarray(grid_z, dtype=float)
+    ordinates = np.asarray(ordinates, dtype=float)
+    sx, sz, sw = samples
+    nx, nz = ordinates.shape
+    dx = grid_x[1] - grid_x[0]
+    dz = grid_z[1] - grid_z[0]
+
+    # Rasterize the load stamp: node offsets (in grid steps) with bilinear weights
+    fx = sx / dx
+    fz = sz / dz
+    ix = np.floor(fx).astype(int)
+    iz = np.floor(fz).astype(int)
+    tx = fx - ix
+    tz = fz - iz
+    i0, j0 = ix.min(), iz.min()
+    stamp = np.zeros((ix.max() - i0 + 2, iz.max() - j0 + 2))
+    np.add.at(stamp, (ix - i0, iz - j0), sw * (1 - tx) * (1 - tz))
+    np.add.at(stamp, (ix - i0 + 1, iz - j0), sw * tx * (1 - tz))
+    np.add.at(stamp, (ix - i0, iz - j0 + 1), sw * (1 - tx) * tz)
+    np.add.at(stamp, (ix - i0 + 1, iz - j0 + 1), sw * tx * tz)
+    mx, mz = stamp.shape
+
+    # effect[a, b] = sum stamp[i, j] * ordinates[a + i0 + i, b + j0 + j]
+    shape = (nx + mx - 1, nz + mz - 1)
+    conv = np.fft.irfft2(np.fft.rfft2(ordinates, shape) * np.fft.rfft2(stamp[::-1, ::-1], shape), shape)
+
+    rows = np.arange(nx) + i0 + mx - 1
+    cols = np.arange(nz) + j0 + mz - 1
+    row_ok = (rows >= 0) & (rows < shape[0])
+    col_ok = (cols >= 0) & (cols < shape[1])
+    effects = np.zeros((nx, nz))
+    effects[np.ix_(row_ok, col_ok)] = conv[np.ix_(rows[row_ok], cols[col_ok])]
+
+    px, pz = np.meshgrid(grid_x, grid_z, indexing='ij')
+    return _governing(effects, px, pz)
+
+
+def vehicle_on_surface(vehicle, grid_x, grid_z, ordinates, placements_x=None, placements_z=None,
+                       contact_length=0.0, contact_width=0.0, n_sub=3):
+    """
+    Places all wheels of a vehicle on an influence surface and reports the
+    governing placement.
+
+    Args:
+        vehicle (dict): vehicle from the IRC6_2017 vehicle functions
+        grid_x, grid_z, ordinates: influence surface (see `bilinear`)
+        placements_x, placements_z (array, optional): vehicle origin positions.
+            If omitted, every grid node is used and the FFT path is taken.
+        contact_length, contact_width (float or array): wheel contact area (m),
+            e.g. from vehicle_arrays.class_a_contact_area
+        n_sub (int): sample points per side of each contact area
+
+    Returns:
+        dict: see `evaluate_placements`
+    """
+    wx, wz, wl = wheel_arrays(vehicle)
+    samples = wheel_samples(wx, wz, wl, contact_length, contact_width, n_sub)
+
+    if placements_x is None and placements_z is None:
+        return evaluate_grid_fft(grid_x, grid_z, ordinates, samples)
+
+    if placements_x is None or placements_z is None:
+        raise ValueError("placements_x and placements_z must be given together")
+    return evaluate_placements(grid_x, grid_z, ordinates, samples, placements_x, placements_z)
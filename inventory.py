@@ -0,0 +1,252 @@
+"""
+Batch evaluation of a bridge inventory with checkpointing and resume.
+
+Bridge records are read from a local JSONL or CSV file and processed in chunks on
+a worker pool. Every chunk is written as its own result shard (JSONL or NumPy
+.npz) and a checkpoint is recorded after it, so an interrupted run resumes at
+the first chunk that was not completed.
+"""
+
+import csv
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+import numpy as np
+from common import *
+from irc5_2015 import IRC5_2015
+from irc6_2017 import IRC6_2017
+
+KEY_RESULT_FORMAT = ['jsonl', 'npz']
+CHECKPOINT_FILE = 'checkpoint.json'
+
+
+def read_records(path):
+    """
+    Streams bridge records from a JSONL file (one object per line) or a CSV file
+    with a header row; numeric CSV fields are converted to float.
+
+    Args:
+        path (str): records file, '.jsonl' / '.json' or '.csv'
+
+    Yields:
+        dict: one bridge record
+    """
+    if path.endswith('.csv'):
+        with open(path, newline='') as f:
+            for row in csv.DictReader(f):
+                record = {}
+                for key, value in row.items():
+                    try:
+                        record[key] = float(value)
+                    except (TypeError, ValueError):
+                        record[key] = value
+                yield record
+    else:
+        with open(path) as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+
+def evaluate_bridge(record):
+    """
+    Default per-bridge evaluation: IRC 5:2015 geometry checks and IRC 6:2017 loads.
+
+    Expected record fields: 'id', 'carriageway_width' (m), 'span' (m) and
+    optionally 'kerb_width' (mm), 'footpath' and 'footpath_width' (m).
+
+    Returns:
+        dict: flat result with scalar values
+    """
+    width = float(record['carriageway_width'])
+    span = float(record['span'])
+    lanes = IRC6_2017.table_6(width)
+
+    result = {
+        'id': record.get('id'),
+        'design_lanes': lanes,
+        'required_carriageway_width': IRC5_2015.cl_104_3_1_carriageway_width(width, lanes),
+        'impact_factor': IRC6_2017.cl_208_2_impact_factor(span),
+        'congestion_factor': IRC6_2017.table_7(span) if span > 10.0 else 1.0,
+        'braking_force': IRC6_2017.cl_211_2_braking_force(lanes),
+    }
+
+    footpath = record.get('footpath', KEY_FOOTPATH[0])
+    if 'kerb_width' in record:
+        kerb = IRC5_2015.cl_101_41_safety_kerb_width(float(record['kerb_width']), footpath)
+        result['kerb_compliant'] = kerb['is_compliant']
+    footpath_check = IRC5_2015.cl_104_3_6_footpath_width(footpath, record.get('footpath_width'))
+    result['footpath_compliant'] = footpath_check['is_compliant']
+    return result
+
+
+def _safe_evaluate(evaluator, record):
+    try:
+        return evaluator(record)
+    except Exception as e:
+        return {'id': record.get('id'), 'error': f"{type(e).__name__}: {e}"}
+
+
+def _evaluate_chunk(evaluator, chunk):
+    return [_safe_evaluate(evaluator, record) for record in chunk]
+
+
+def _write_atomic(path, write):
+    tmp = path + '.tmp'
+    write(tmp)
+    os.replace(tmp, path)
+
+
+def _write_json(path, data):
+    def write(tmp):
+        with open(tmp, 'w') as f:
+            json.dump(data, f)
+    _write_atomic(path, write)
+
+
+def write_shard(path, results, fmt='jsonl'):
+    """
+    Writes one chunk of results atomically, as JSON lines or as an .npz file with
+    one array per result key (missing values stored as NaN or '').
+    """
+    if fmt == 'jsonl':
+        def write(tmp):
+            with open(tmp, 'w') as f:
+                for result in results:
+                    f.write(json.dumps(result, default=float) + '\n')
+    elif fmt == 'npz':
+        keys = sorted({key for result in results for key in result})
+
+        def write(tmp):
+            columns = {}
+            for key in keys:
+                values = [result.get(key) for result in results]
+                if all(isinstance(v, (int, float, bool, np.number)) or v is None for v in values):
+                    columns[key] = np.array([np.nan if v is None else v for v in values], dtype=float)
+                else:
+                    columns[key] = np.array(['' if v is None else str(v) for v in values])
+            with open(tmp, 'wb') as f:
+                np.savez(f, **columns)
+    else:
+        raise ValueError(f"fmt must be one of {KEY_RESULT_FORMAT}")
+    _write_atomic(path, write)
+
+
+def shard_path(out_dir, chunk_index, fmt='jsonl'):
+    return os.path.join(out_dir, f"results-{chunk_index:06d}.{fmt}")
+
+
+def read_checkpoint(out_dir):
+    path = os.path.join(out_dir, CHECKPOINT_FILE)
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+
+def run_inventory(records_path, out_dir, evaluator=evaluate_bridge, chunk_size=1000, workers=None,
+                  fmt='jsonl', progress=None):
+    """
+    Evaluates every bridge record, chunk by chunk, resuming after the last
+    completed chunk recorded in `out_dir`.
+
+    Args:
+        records_path (str): JSONL or CSV file of bridge records
+        out_dir (str): directory for result shards and the checkpoint
+        evaluator (callable): picklable function mapping a record to a flat dict;
+            exceptions are recorded as {'id', 'error'} results
+        chunk_size (int): records per chunk, fixed for the life of a run
+        workers (int, optional): worker processes; 0 evaluates in this process
+        fmt (str): 'jsonl' or 'npz' result shards
+        progress (callable, optional): called with one line of throughput per chunk,
+            e.g. print; nothing is reported by default
+
+    Returns:
+        dict: {'chunks': completed chunks, 'records': records processed in total,
+               'resumed_from': first chunk evaluated in this call, 'seconds': elapsed}
+
+    Raises:
+        ValueError: If the checkpoint belongs to a different input, chunk size or format
+    """
+    if fmt not in KEY_RESULT_FORMAT:
+        raise ValueError(f"fmt must be one of {KEY_RESULT_FORMAT}")
+    os.makedirs(out_dir, exist_ok=True)
+
+    checkpoint = read_checkpoint(out_dir) or {
+        'input': os.path.abspath(records_path),
+        'chunk_size': chunk_size,
+        'format': fmt,
+        'completed_chunks': 0,
+        'records': 0,
+    }
+    if (checkpoint['input'], checkpoint['chunk_size'], checkpoint['format']) != \
+            (os.path.abspath(records_path), chunk_size, fmt):
+        raise ValueError("Checkpoint in out_dir was written for a different input, chunk size or format")
+
+    start_chunk = checkpoint['completed_chunks']
+    records = read_records(records_path)
+    for _ in islice(records, start_chunk * chunk_size):
+        pass
+
+    n_workers = workers or os.cpu_count() or 1
+    pool = ProcessPoolExecutor(max_workers=n_workers) if workers != 0 else None
+    started = time.perf_counter()
+    try:
+        chunk_index = start_chunk
+        while True:
+            chunk = list(islice(records, chunk_size))
+            if not chunk:
+                break
+
+            tic = time.perf_counter()
+            if pool is None:
+                results = _evaluate_chunk(evaluator, chunk)
+            else:
+                size = -(-len(chunk) // n_workers)
+                parts = [chunk[i:i + size] for i in range(0, len(chunk), size)]
+                results = [r for part in pool.map(_evaluate_chunk, [evaluator] * len(parts), parts) for r in part]
+
+            write_shard(shard_path(out_dir, chunk_index, fmt), results, fmt)
+            checkpoint['completed_chunks'] = chunk_index + 1
+            checkpoint['records'] += len(results)
+            _write_json(os.path.join(out_dir, CHECKPOINT_FILE), checkpoint)
+
+            elapsed = time.perf_counter() - tic
+            if progress is not None:
+                errors = sum('error' in r for r in results)
+                progress(f"chunk {chunk_index}: {len(results)} records in {elapsed:.2f} s "
+                         f"({len(results) / max(elapsed, 1e-9):.0f} records/s, {errors} errors)")
+            chunk_index += 1
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    return {
+        'chunks': checkpoint['completed_chunks'],
+        'records': checkpoint['records'],
+        'resumed_from': start_chunk,
+        'seconds': time.perf_counter() - started,
+    }
+
+
+def iter_results(out_dir, fmt='jsonl'):
+    """
+    Reads back all result shards of a run in chunk order.
+
+    Yields:
+        dict: one result per record ('jsonl') or one dict of column arrays per shard ('npz')
+    """
+    checkpoint = read_checkpoint(out_dir)
+    n_chunks = checkpoint['completed_chunks'] if checkpoint else 0
+    for chunk_index in range(n_chunks):
+        path = shard_path(out_dir, chunk_index, fmt)
+        if fmt == 'jsonl':
+            with open(path) as f:
+                for line in f:
+                    yield json.loads(line)
+        else:
+            with np.load(path) as data:
+                yield {key: data[key] for key in data.files}
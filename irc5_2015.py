@@ -6,6 +6,7 @@ Module for IRC 5:2015 bridge design clauses.
 
 import math
 from common import *
+from design_state import with_entries
 
 
 class IRC5_2015(object):
@@ -48,6 +49,7 @@ class IRC5_2015(object):
 
         
         
+    @staticmethod
     def cl_109_8_1_road_kerb_outline(design_dict):
         """Road kerb dimensions as per IRC 5:2015
         Clause 109.8.1 - Standard dimensions for road kerbs
@@ -61,9 +63,7 @@ class IRC5_2015(object):
             'road_kerb_edge_radius': 25 * mm # edge radius in mm
         }
 
-        updated_design = design_dict.copy()
-        updated_design.update(road_kerb_dimensions)
-        return updated_design
+        return with_entries(design_dict, road_kerb_dimensions)
     
     @staticmethod
     def cl_109_8_3_safety_kerb_outline(design_dict):
@@ -84,10 +84,7 @@ class IRC5_2015(object):
             "is_width_compliant": road_kerb["road_kerb_width"] >= KEY_SAFETY_KERB_MIN_WIDTH,
         }
 
-        updated_design = design_dict.copy()
-        updated_design.update(safety_kerb_dimensions)
-
-        return updated_design
+        return with_entries(design_dict, safety_kerb_dimensions)
 
     # Utility function to compute safety kerb area
     def compute_safety_kerb_area(kerb):
@@ -106,20 +103,18 @@ class IRC5_2015(object):
         return area
 
 
+    @staticmethod
     def cl_104_1_3_4_design_life(design_dict):
         """
         IRC 5:2015
         Table 104.1.3.4 – Assumed design life
         """
 
-        updated_design = design_dict.copy()
-        updated_design.update({
+        return with_entries(design_dict, {
             "clause_104_1_3_4": "IRC 5:2015 Table 104.1.3.4",
             "design_life_years": 100
         })
 
-        return updated_design
-
 
     @staticmethod  
     def cl_104_3_1_carriageway_width(carriageway_width, num_lanes):
@@ -330,8 +325,7 @@ class IRC5_2015(object):
                         'crash_barrier_base_notch': 100,
                         'crash_barrier_middle_length': 550
                     }
-                    IRC5_2015.cl_109_7_2_railing_height(railing_dims['railing_height'])
-                    design_dict.update(railing_dims)
+                    design_dict = with_entries(design_dict, railing_dims, in_place=True)
 
                 elif railing_type == KEY_RAILING_TYPE[1]:  # steel
                     railing_dims = {
@@ -346,12 +340,11 @@ class IRC5_2015(object):
                         'crash_barrier_base_notch': 100,
                         'crash_barrier_middle_length': 550
                     }
-                    IRC5_2015.cl_109_7_2_railing_height(railing_dims['railing_height'])
-                    design_dict.update(railing_dims)
+                    design_dict = with_entries(design_dict, railing_dims, in_place=True)
 
             elif footpath == KEY_FOOTPATH[0]:
                 if crash_barrier_type == KEY_RIGID_CRASH_BARRIER_TYPE[0]:  # IRC-5R
-                    design_dict.update({
+                    design_dict = with_entries(design_dict, {
                         'crash_barrier_height': 1100,
                         'crash_barrier_width': 450,
                         'crash_barrier_radius1': 50,
@@ -359,10 +352,10 @@ class IRC5_2015(object):
                         'crash_barrier_top_notch': 175,
                         'crash_barrier_base_notch': 100,
                         'crash_barrier_middle_length': 750
-                    })
+                    }, in_place=True)
 
                 elif crash_barrier_type == KEY_RIGID_CRASH_BARRIER_TYPE[1]:  # High containment
-                    design_dict.update({
+                    design_dict = with_entries(design_dict, {
                         'crash_barrier_height': 1550,
                         'crash_barrier_width': 525,
                         'crash_barrier_radius1': 50,
@@ -370,12 +363,12 @@ class IRC5_2015(object):
                         'crash_barrier_top_notch': 250,
                         'crash_barrier_base_notch': 100,
                         'crash_barrier_middle_length': 1200
-                    })
+                    }, in_place=True)
 
         # METALLIC CRASH BARRIER – EDGE (IRC Fig. 4)
         elif barrier_type == KEY_CRASH_BARRIER_TYPE[1]:  # Semi-rigid
 
-            design_dict.update({
+            design_dict = with_entries(design_dict, {
                 # Overall geometry
                 'crash_barrier_width': 550,
                 'crash_barrier_height': 950 + 100,
@@ -397,22 +390,22 @@ class IRC5_2015(object):
                 'number_of_w_beams': (
                     2 if crash_barrier_type == KEY_METALLIC_CRASH_BARRIER_TYPE[1] else 1
                 )
-            })
+            }, in_place=True)
 
         # MEDIAN – FIG 5(a): RAISED KERB
         elif barrier_type == KEY_MEDIAN_TYPE[0]:
 
-            design_dict.update({
+            design_dict = with_entries(design_dict, {
                 'median_width': 1200,
                 'kerb_height': 100,
                 'kerb_top_width': 500,
                 'kerb_bottom_width': 550
-            })
+            }, in_place=True)
 
         # MEDIAN – FIG 5(b): RCC CRASH BARRIER
         elif barrier_type == KEY_MEDIAN_TYPE[1]:
 
-            design_dict.update({
+            design_dict = with_entries(design_dict, {
                 'median_width': 1200,
 
                 # RCC barrier
@@ -424,12 +417,12 @@ class IRC5_2015(object):
                 'kerb_height': 100,
                 'kerb_top_width': 500,
                 'kerb_bottom_width': 550
-            })
+            }, in_place=True)
 
         # MEDIAN – FIG 5(c): METALLIC CRASH BARRIER
         elif barrier_type == KEY_MEDIAN_TYPE[2]:
 
-            design_dict.update({
+            design_dict = with_entries(design_dict, {
                 'median_width': 1200,
 
                 # Same as edge metallic barrier
@@ -447,6 +440,6 @@ class IRC5_2015(object):
                 'number_of_w_beams': (
                     2 if crash_barrier_type == KEY_METALLIC_CRASH_BARRIER_TYPE[1] else 1
                 )
-            })
+            }, in_place=True)
 
         return design_dict
\ No newline at end of file
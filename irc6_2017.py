@@ -51,6 +51,7 @@ class IRC6_2017:
             'x' - list of longitudinal load positions (m)
             'z' - list of transverse load positions (m)
             'wheel_loads' - list of wheel loads (kN)
+            'length' - overall vehicle length, nose to tail (m)
         """
 
         # Define units
@@ -77,7 +78,7 @@ class IRC6_2017:
                 front_gap + axle_dist1 + axle_dist2 + gap_bogie,
                 front_gap + axle_dist1 + axle_dist2 + gap_bogie + bogie_axle_dist1,
                 front_gap + axle_dist1 + axle_dist2 + gap_bogie + bogie_axle_dist1 + bogie_axle_dist2,
-                front_gap + axle_dist1 + axle_dist2 + gap_bogie + bogie_axle_dist1 + bogie_axle_dist2 + rear_gap,
+                front_gap + axle_dist1 + axle_dist2 + gap_bogie + bogie_axle_dist1 + bogie_axle_dist2 + bogie_axle_dist1,
                 ]
             
         # Transverse position of each wheel
@@ -86,11 +87,15 @@ class IRC6_2017:
         # Spacing between two sucessive class 70R vehicles
         spacing_Class70R = 30.0 * m
 
+        # Overall length, nose to tail
+        vehicle_length = load_positions_x[-1] + rear_gap
+
         # make a dictonary to return vehicle data
         return {
             'x': load_positions_x,
             'z': load_positions_z,
             'wheel_loads': wheel_loads,
+            'length': vehicle_length,
             'spacing_Class70R': spacing_Class70R
         }
     
@@ -138,6 +143,7 @@ class IRC6_2017:
             'x' - list of longitudinal load positions (m)
             'z' - list of transverse load positions (m)
             'wheel_loads' - list of wheel loads (kN)
+            'length' - overall vehicle length, nose to tail (m)
         """
         # Define units
         front_gap = 0.6 * m
@@ -164,19 +170,23 @@ class IRC6_2017:
             front_gap + axle_dist1 + axle_dist2 + axle_dist3 + gap_bogie,
             front_gap + axle_dist1 + axle_dist2 + axle_dist3 + gap_bogie + bogie_axle_dist,
             front_gap + axle_dist1 + axle_dist2 + axle_dist3 + gap_bogie + bogie_axle_dist + bogie_axle_dist,
-            front_gap + axle_dist1 + axle_dist2 + axle_dist3 + gap_bogie + bogie_axle_dist + bogie_axle_dist + bogie_axle_dist + rear_gap,
+            front_gap + axle_dist1 + axle_dist2 + axle_dist3 + gap_bogie + bogie_axle_dist + bogie_axle_dist + bogie_axle_dist,
             ]
         # Transverse position of each wheel
         load_positions_z = [-0.9,0.9]
 
         # Spacing between two sucessive class A vehicles
         spacing_ClassA = 18.5 * m
+
+        # Overall length, nose to tail
+        vehicle_length = load_positions_x[-1] + rear_gap
    
         # make a dictonary to return vehicle data
         return {
             'x': load_positions_x,
             'z': load_positions_z,
             'wheel_loads': wheel_loads,
+            'length': vehicle_length,
             'spacing_ClassA': spacing_ClassA
         }
     
@@ -526,47 +536,77 @@ class IRC6_2017:
         }
     
     @staticmethod
-    def cl_206_1_footway_load():
+    def cl_206_1_footway_load(span=None, footway_width=None, crowd=False):
         """
-        Returns the footway load in kg/m2 based on the selected footway type
-        as per IRC:6-2017 Clause 206.1.
+        Returns the footway live load intensity as per IRC:6-2017 Clause 206.1.
+        400 kg/m2 (500 kg/m2 where crowds are likely), reduced for effective spans
+        over 7.5 m to P - (40L - 300) / 9 and, beyond 30 m, to
+        (P - 260 + 4800 / L) (16.5 - W) / 15.
+        Args:
+            span (float, optional): effective span L in metres; None for local elements
+            footway_width (float, optional): footway width W in metres, needed for spans over 30 m
+            crowd (bool): whether crowd loads are likely
+        Returns:
+            float: Footway load in kN/m2 (rounded to 3 decimal places)
         """
-        footway_type = KEY_TYPE_FOOTWAY[0]  # Default footway type
+        P = KEY_FOOTWAY_LOAD['crowd' if crowd else 'footway']  # kg/m2
 
-        # Get the load in kg/m2 from the FOOTWAY_LOADS dictionary
-        load_kg_m2 = FOOTWAY_LOADS.get(footway_type, 500)  # default to 500 kg/m2 if not found
+        if span is None or span <= 7.5:
+            load_kg_m2 = P
+        elif span <= 30.0:
+            load_kg_m2 = P - (40.0 * span - 300.0) / 9.0
+        else:
+            if footway_width is None:
+                raise ValueError("footway_width is required for spans over 30 m")
+            load_kg_m2 = (P - 260.0 + 4800.0 / span) * (16.5 - footway_width) / 15.0
 
         # Convert load to kN/m2
-        load_kN_m2 = (load_kg_m2 * 9.81) / 1000.0  # kN/m2
+        load_kN_m2 = (load_kg_m2 * g) / 1000.0  # kN/m2
 
         return round(load_kN_m2, 3)
     
     @staticmethod
-    def cl_206_2_kerb_load():
+    def cl_206_2_kerb_load(kerb_width, span=None, footway_width=None, crowd=False):
         """
-        Returns the kerb load in kg/m2 based on the kerb width
-        as per IRC:6-2017 Clause 206.2.
+        Returns the kerb loads as per IRC:6-2017 Clause 206.2.
+        Kerbs 600 mm or wider carry the footway load of Clause 206.1; every kerb is
+        designed for a lateral force of 750 kg/m at its top.
+        Args:
+            kerb_width (float): kerb width in mm
+            span, footway_width, crowd: see cl_206_1_footway_load
+        Returns:
+            dict: {'vertical_kN_m2': float, 'lateral_kN_m': float}
         """
-        if IRC5_2015.cl_109_8_1_road_kerb_outline('road_kerb_width') >= 600:
-            kerb_load_kg_m2 = FOOTWAY_LOADS.get('Default', 500)  # 500 kg/m2
+        if kerb_width >= KEY_MIN_LOADED_KERB_WIDTH:
+            vertical_kN_m2 = IRC6_2017.cl_206_1_footway_load(span, footway_width, crowd)
+        else:
+            vertical_kN_m2 = 0.0
 
-        # Convert load to kN/m2
-        kerb_kN_m2 = (kerb_load_kg_m2 * 9.81) / 1000.0  # kN/m2
-        
-        return round(kerb_kN_m2, 3)
+        # Convert load to kN/m
+        lateral_kN_m = (KEY_KERB_LATERAL_LOAD * g) / 1000.0  # kN/m
+
+        return {
+            'vertical_kN_m2': vertical_kN_m2,
+            'lateral_kN_m': round(lateral_kN_m, 3)
+        }
     
     @staticmethod
-    def cl_206_5_railing_load():
+    def cl_206_5_railing_load(railing_type=KEY_RAILING_TYPE[0]):
         """
-        Returns the parapet load in kg/m based on the parapet type
-        as per IRC:6-2017 Clause 206.5.
+        Returns the railing load as per IRC:6-2017 Clause 206.5.
+        Railings are designed for 150 kg/m applied horizontally and vertically
+        at the top, for RCC and steel railings alike.
+        Args:
+            railing_type (str): 'RCC' or 'steel'
+        Returns:
+            float: Railing load in kN/m (rounded to 3 decimal places)
         """
-        if KEY_RAILING_TYPE[0] == 'IRC 5 RCC railing':
-            railing_load_kg_m2 = 150.0  # kg/m
-        elif KEY_RAILING_TYPE[0] == 'IRC 5 steel railing':
-            railing_load_kg_m2 = 150.0  # kg/m
+        if railing_type not in KEY_RAILING_TYPE:
+            raise ValueError(f"railing_type must be one of {KEY_RAILING_TYPE}")
+
+        railing_load_kN_m = (KEY_RAILING_LOAD * g) / 1000.0  # kN/m
 
-        return round(railing_load_kg_m2, 3)
+        return round(railing_load_kN_m, 3)
     
     @staticmethod
     def cl_208_2_impact_factor(span):
@@ -899,48 +939,100 @@ class IRC6_2017:
     def cl_211_2_braking_force(design_lanes):
         """
         Returns braking force as per IRC:6-2017 Clause 211.2.
+        Twenty percent of the train load for the first two lanes plus five
+        percent of the load on each lane in excess of two.
+        Args:
+            design_lanes (int): number of lanes for design purposes
         Returns:
             float: Braking force in kN (rounded to 3 decimal places)
         """
-        for lane in range(1, design_lanes + 1):
-            if lane == 1 or lane == 2:
-                wheel_load = IRC6_2017.cl_204_1_ClassA_vehicle()['wheel_loads']
-                braking_force_1 = 0.20 * sum(wheel_load)  # kN
-            if lane > 2:
-                wheel_load = IRC6_2017.cl_204_1_Class70R_vehicle_wheel()['wheel_loads']
-                braking_force_2 = 0.05 * sum(wheel_load)  # kN
-            
-            total_braking_force = braking_force_1 + braking_force_2
+        wheel_load_A = IRC6_2017.cl_204_1_ClassA_vehicle()['wheel_loads']
+        wheel_load_70R = IRC6_2017.cl_204_1_Class70R_vehicle_wheel()['wheel_loads']
+
+        braking_force_1 = 0.20 * sum(wheel_load_A)  # kN, first two lanes
+        braking_force_2 = 0.05 * sum(wheel_load_70R) * max(design_lanes - 2, 0)  # kN, lanes in excess of two
+
+        total_braking_force = braking_force_1 + braking_force_2
         return round(total_braking_force, 3)
     
     @staticmethod
-    def cl_211_3_braking_force_location():
-
-        return
+    def cl_211_3_braking_force_location(deck_level=0.0):
+        """
+        Returns the line of action of the braking force as per IRC:6-2017 Clause 211.3.
+        The force acts parallel to the roadway, 1.2 m above it.
+        Args:
+            deck_level (float): level of the roadway surface in metres
+        Returns:
+            dict: {'height_above_roadway': float, 'level': float} in metres
+        """
+        return {
+            'height_above_roadway': KEY_BRAKING_FORCE_HEIGHT,
+            'level': round(deck_level + KEY_BRAKING_FORCE_HEIGHT, 3)
+        }
     
     
     @staticmethod
-    def table_15():
+    def cl_212_2_centrifugal_force(live_load, design_speed, radius):
+        """
+        Returns centrifugal force as per IRC:6-2017 Clause 212.2.
+        C = W V^2 / (127 R), with no increase for impact (Clause 212.4).
+        Args:
+            live_load (float): live load W on the curved deck (tonnes or kN)
+            design_speed (float): design speed V in km/h
+            radius (float): radius of curvature R in metres
+        Returns:
+            float: Centrifugal force in the units of the live load (rounded to 3 decimal places)
+        Raises:
+            ValueError: If the radius is not positive
+        """
+        if radius <= 0:
+            raise ValueError("Radius of curvature must be positive")
+
+        centrifugal_force = live_load * design_speed ** 2 / (127.0 * radius)
+        return round(centrifugal_force, 3)
+
+    @staticmethod
+    def cl_212_3_centrifugal_force_location(deck_level=0.0):
+        """
+        Returns the line of action of the centrifugal force as per IRC:6-2017 Clause 212.3.
+        The force acts 1.2 m above the level of the carriageway.
+        Args:
+            deck_level (float): level of the carriageway in metres
+        Returns:
+            dict: {'height_above_roadway': float, 'level': float} in metres
+        """
+        return {
+            'height_above_roadway': KEY_CENTRIFUGAL_FORCE_HEIGHT,
+            'level': round(deck_level + KEY_CENTRIFUGAL_FORCE_HEIGHT, 3)
+        }
+
+    @staticmethod
+    def table_15(max_temp, min_temp):
         """
         Returns bridge temperature as per IRC:6-2017 Table 15.
+        Args:
+            max_temp (float): maximum shade air temperature in °C
+            min_temp (float): minimum shade air temperature in °C
         Returns:
             float: Bridge temperature in °C (rounded to 3 decimal places)
         """
-        max_temp = None  # °C
-        min_temp = None  # °C
         delta_temp = max_temp - min_temp  # °C
         if delta_temp > 20.0:
             bridge_temp = ((max_temp + min_temp) / 2.0) + 10.0 # °C
-        elif delta_temp < 20.0:
+        else:
             bridge_temp = ((max_temp + min_temp) / 2.0) + 5.0  # °C 
         return round(bridge_temp, 3)
     
     @staticmethod
     def cl_215_4_material_properties():
-        
-        thermal_expansion_coefficient = 12 * 1.0e-6  # per °C
+        """
+        Returns the coefficient of thermal expansion as per IRC:6-2017 Clause 215.4.
+        Returns:
+            float: coefficient of thermal expansion per °C
+        """
+        thermal_expansion_coefficient = KEY_THERMAL_EXPANSION_COEFFICIENT  # per °C
 
-        
+        return thermal_expansion_coefficient
 
     @staticmethod
     def table_16():
@@ -0,0 +1,95 @@
+"""
+Expansion joint and bearing movements along a chain of simply supported spans.
+
+Each span moves about its fixed point, given as a fraction of the span length from
+its start (0 fixed at the start bearing, 1 fixed at the end bearing, 0.5 for a span
+floating symmetrically on elastomeric bearings). Displacements are positive in the
+direction of increasing chainage; joint openings are positive when a gap widens.
+Joint j lies between span j - 1 and span j, joints 0 and n being the abutments.
+"""
+
+import numpy as np
+from common import *
+from irc6_2017 import IRC6_2017
+
+
+def chain_movements(spans, fixed_position, temperature_change, creep_shrinkage_strain=0.0,
+                    braking_force=0.0, fixed_support_stiffness=np.inf, thermal_coefficient=None):
+    """
+    Thermal, creep/shrinkage and braking movements at every bearing and joint of a
+    viaduct for many temperature cases in one vectorized pass.
+
+    Args:
+        spans (array): span lengths (m), (n_spans,)
+        fixed_position (float or array): fixed point of each span as a fraction of
+            its length from the start
+        temperature_change (float or array): changes of effective temperature from
+            the installation temperature (°C), (n_cases,); rise positive
+        creep_shrinkage_strain (float or array): long-term strain of each span,
+            shortening negative (placeholder for a creep and shrinkage model)
+        braking_force (float or array): braking force carried by the fixed support
+            of each span, positive in the direction of chainage (N)
+        fixed_support_stiffness (float or array): horizontal stiffness of the
+            support holding each span's fixed bearing (N/m)
+        thermal_coefficient (float, optional): defaults to
+            IRC6_2017.cl_215_4_material_properties()
+
+    Returns:
+        dict: {
+            'joint_chainage': chainage of each joint (m), (n_spans + 1,),
+            'bearing_start', 'bearing_end': thermal plus creep/shrinkage movement of
+                the bearings of each span relative to their supports, (n_cases, n_spans),
+            'joint_thermal': thermal opening of each joint, (n_cases, n_joints),
+            'joint_creep_shrinkage': long-term opening of each joint, (n_joints,),
+            'joint_braking': opening from braking (either direction), (n_joints,),
+            'joint_max_opening', 'joint_max_closing': envelope over all cases, (n_joints,),
+            'joint_total_movement': movement range to be accommodated, (n_joints,)
+        }
+    """
+    if thermal_coefficient is None:
+        thermal_coefficient = IRC6_2017.cl_215_4_material_properties()
+
+    spans = np.asarray(spans, dtype=float)
+    n_spans = spans.size
+    fixed_position = np.broadcast_to(np.asarray(fixed_position, dtype=float), spans.shape)
+    temperature_change = np.atleast_1d(np.asarray(temperature_change, dtype=float))
+    strain_cs = np.broadcast_to(np.asarray(creep_shrinkage_strain, dtype=float), spans.shape)
+
+    # Distance of the start and end bearings from each span's fixed point
+    to_start = -fixed_position * spans
+    to_end = (1.0 - fixed_position) * spans
+
+    strain_t = thermal_coefficient * temperature_change[:, None]
+    bearing_start = (strain_t + strain_cs) * to_start
+    bearing_end = (strain_t + strain_cs) * to_end
+
+    # Rigid-body displacement of each span from its fixed support under braking
+    braking = np.broadcast_to(np.asarray(braking_force, dtype=float), spans.shape) \
+        / np.broadcast_to(np.asarray(fixed_support_stiffness, dtype=float), spans.shape)
+
+    def opening(start_disp, end_disp):
+        # Joint j opens by (start of span j) - (end of span j - 1); abutments do not move
+        pad = [(0, 0)] * (start_disp.ndim - 1)
+        start = np.pad(start_disp, pad + [(0, 1)])
+        end = np.pad(end_disp, pad + [(1, 0)])
+        return start - end
+
+    joint_thermal = opening(strain_t * to_start, strain_t * to_end)
+    joint_cs = opening(strain_cs * to_start, strain_cs * to_end)
+    joint_braking = np.abs(opening(braking, braking))
+
+    long_term = joint_thermal + joint_cs
+    max_opening = np.maximum(long_term.max(axis=0), joint_cs) + joint_braking
+    max_closing = np.minimum(long_term.min(axis=0), joint_cs) - joint_braking
+
+    return {
+        'joint_chainage': np.concatenate([[0.0], np.cumsum(spans)]),
+        'bearing_start': bearing_start,
+        'bearing_end': bearing_end,
+        'joint_thermal': joint_thermal,
+        'joint_creep_shrinkage': joint_cs,
+        'joint_braking': joint_braking,
+        'joint_max_opening': max_opening,
+        'joint_max_closing': max_closing,
+        'joint_total_movement': max_opening - max_closing,
+    }
@@ -0,0 +1,241 @@
+"""
+Beam-line moving-load analysis of simply supported spans: influence lines and
+load-effect envelopes of the IRC 6:2017 vehicles.
+
+A vehicle placed at position p puts axle i at p + x_i. Spans, sections, positions
+and axles are broadcast against each other, so many spans are evaluated together.
+Spans and sections may be `dual.Dual` numbers; the envelope then carries the
+derivatives of the extreme effects (the governing positions move with the span
+and sections).
+"""
+
+import numpy as np
+from common import *
+from dual import Dual, as_float, partials, piecewise
+from vehicle_arrays import axle_arrays
+
+KEY_LOAD_EFFECT = ['moment', 'shear', 'reaction']
+
+# Default bound on the temporaries of one envelope block, in bytes
+DEFAULT_MEMORY_BUDGET = 256 * 2**20
+_TEMPORARIES = 6
+
+
+def influence_line(span, section, position, effect='moment'):
+    """
+    Influence ordinates of a simply supported span for a unit load.
+
+    - moment at the section: x (L - a) / L left of it, a (L - x) / L right of it
+    - shear at the section: -x / L left of it, (L - x) / L at or right of it
+    - reaction at the left support: (L - x) / L
+
+    Args:
+        span (float or array): span L (m)
+        section (float or array): section a from the left support (m)
+        position (float or array): unit load position x (m)
+        effect (str): 'moment', 'shear' or 'reaction'
+
+    Returns:
+        array: ordinates broadcast over the inputs, 0 for loads off the span
+    """
+    if effect not in KEY_LOAD_EFFECT:
+        raise ValueError(f"effect must be one of {KEY_LOAD_EFFECT}")
+
+    L = as_float(span)
+    a = as_float(section)
+    x = as_float(position)
+
+    if effect == 'moment':
+        ordinate = piecewise(x - a, x * (L - a) / L, a * (L - x) / L)
+    elif effect == 'shear':
+        ordinate = np.where(x < a, -x, L - x) / L
+    else:
+        ordinate = (L - x) / L
+    # Zero off the span, |x - L/2| > L/2
+    return piecewise(np.abs(x - L / 2.0) - L / 2.0, ordinate, 0.0)
+
+
+def influence_line_areas(span, section, effect='moment'):
+    """
+    Areas under the influence lines of `influence_line`, for uniformly
+    distributed loads: a full-length load gives 'net', a load placed only where
+    it increases (decreases) the effect gives 'positive' ('negative').
+
+    - moment: a (L - a) / 2
+    - shear: (L - a)^2 / (2 L) and -a^2 / (2 L)
+    - reaction: L / 2
+
+    Args:
+        span (float or array): span L (m)
+        section (float or array): section a from the left support (m)
+        effect (str): 'moment', 'shear' or 'reaction'
+
+    Returns:
+        dict: {'positive', 'negative', 'net'} arrays broadcast over the inputs (m^2 for moment, m otherwise)
+    """
+    if effect not in KEY_LOAD_EFFECT:
+        raise ValueError(f"effect must be one of {KEY_LOAD_EFFECT}")
+
+    L, a = np.broadcast_arrays(as_float(span), as_float(section))
+    if effect == 'moment':
+        positive, negative = a * (L - a) / 2.0, np.zeros_like(L)
+    elif effect == 'shear':
+        positive, negative = (L - a) ** 2 / (2.0 * L), -a ** 2 / (2.0 * L)
+    else:
+        positive, negative = L / 2.0, np.zeros_like(L)
+    return {'positive': positive, 'negative': negative, 'net': positive + negative}
+
+
+def critical_positions(span, section, x):
+    """
+    Vehicle positions at which the effect of a train of point loads on a simply
+    supported span can peak: every axle at the section and at either support.
+
+    The effect is piecewise linear in the vehicle position with kinks only at
+    these positions, so evaluating them gives the exact extremes.
+
+    Args:
+        span (float or array): span L (m), shape (...)
+        section (array): sections (m), shape (..., n_s)
+        x (array): axle offsets (m), (n_a,) or (..., n_a)
+
+    Returns:
+        array: positions of shape (..., n_s, 3 n_a)
+    """
+    span = as_float(span)
+    section = as_float(section)
+    x = np.asarray(x, dtype=float)
+    marks = np.stack(np.broadcast_arrays(section, np.zeros_like(section), span[..., None] + 0.0 * section), -1)
+    positions = marks[..., :, None] - x[..., None, None, :]
+    return positions.reshape(positions.shape[:-2] + (3 * x.shape[-1],))
+
+
+def _tied(values, extreme, reduce):
+    """
+    Extreme of Dual values along the last axis with, where several entries tie
+    for it, the largest (np.max) or smallest (np.min) of their derivatives: the
+    one-sided derivative of the envelope for increasing parameters.
+    """
+    tol = 1e-9 * np.maximum(np.abs(extreme.value), 1.0)
+    tied = np.abs(values.value - extreme.value[..., None]) <= tol[..., None]
+    fill = -np.inf if reduce is np.max else np.inf
+    return Dual(extreme.value, reduce(np.where(tied[..., None], values.grad, fill), axis=-2))
+
+
+def _envelope_block(x, loads, span, sections, positions, effect):
+    span = span[..., None, None, None]
+    sections = sections[..., :, None, None]
+    load_x = positions[..., None] + x[..., None, None, :]
+    ordinates = influence_line(span, sections, load_x, effect)
+    if effect == 'shear':
+        # Shear jumps under a load at the section: take the limits with the load
+        # just right and just left of it (the tolerance absorbs rounding of the
+        # positions placing an axle at the section)
+        near = np.abs(load_x - sections) < 1e-9 * np.maximum(span, 1.0)
+        right = load_x >= sections
+        ordinates = np.concatenate([np.where(near & ~right, ordinates + 1.0, ordinates),
+                                    np.where(near & right, ordinates - 1.0, ordinates)], -2)
+        positions = np.concatenate([positions, positions], -1)
+    values = ordinates @ loads
+
+    i_max = np.argmax(values, axis=-1)[..., None]
+    i_min = np.argmin(values, axis=-1)[..., None]
+    v_max = np.take_along_axis(values, i_max, -1)[..., 0]
+    v_min = np.take_along_axis(values, i_min, -1)[..., 0]
+    if isinstance(values, Dual):
+        v_max, v_min = _tied(values, v_max, np.max), _tied(values, v_min, np.min)
+    positions = np.broadcast_to(positions, values.shape)
+    return (v_max, v_min,
+            np.take_along_axis(positions, i_max, -1)[..., 0],
+            np.take_along_axis(positions, i_min, -1)[..., 0])
+
+
+def envelope(vehicle, span, sections, positions=None, effect='moment', memory_budget=DEFAULT_MEMORY_BUDGET):
+    """
+    Maximum and minimum load effect of a vehicle at every section, with the
+    governing vehicle position.
+
+    The sections x positions x axles intermediate is evaluated in blocks of
+    sections (and of positions when one section alone exceeds the budget) sized
+    to `memory_budget`, reducing each block as it is computed.
+
+    Args:
+        vehicle (dict): vehicle from the IRC6_2017 vehicle functions
+        span (float or array): span L (m), shape (...) for many spans
+        sections (array): sections (m), shape (n_s,) or (..., n_s)
+        positions (array, optional): vehicle positions (m) to scan, shape (n_p,)
+            or (..., n_s, n_p). If omitted the exact critical positions are used.
+        effect (str): 'moment', 'shear' or 'reaction'
+        memory_budget (int): approximate bytes of temporaries per block
+
+    Returns:
+        dict: {
+            'max', 'min': extreme effects, shape (..., n_s),
+            'max_position', 'min_position': governing vehicle positions
+        }
+        With Dual spans or sections the entries are Duals holding the one-sided
+        derivatives for increasing parameters: where positions tie for an
+        extreme, the largest (smallest) of their derivatives, and at the kink of
+        the moment influence line the branch the load moves into. Where the
+        envelope itself jumps (shear, as a load crosses the section) the
+        derivative is that of the value returned.
+    """
+    x, loads = axle_arrays(vehicle)
+    return load_train_envelope(x, loads, span, sections, positions, effect, memory_budget)
+
+
+def load_train_envelope(x, loads, span, sections, positions=None, effect='moment',
+                        memory_budget=DEFAULT_MEMORY_BUDGET):
+    """
+    `envelope` of a train of point loads given directly: loads[i] at x[i] from the
+    train position. The offsets may vary over the batch, e.g. wheels mapped into
+    the strip coordinates of decks of different skew.
+
+    Args:
+        x (array): load offsets (m), (n_a,) or (..., n_a)
+        loads (array): loads, (n_a,)
+        span, sections, positions, effect, memory_budget: see `envelope`
+    """
+    x = np.asarray(x, dtype=float)
+    loads = np.asarray(loads, dtype=float)
+    span = as_float(span)
+    sections = as_float(sections)
+
+    if positions is None:
+        positions = critical_positions(span, sections, x)
+    positions = as_float(positions)
+
+    batch = np.broadcast_shapes(span.shape, sections.shape[:-1], positions.shape[:-2], x.shape[:-1])
+    n_s = sections.shape[-1]
+    n_p = positions.shape[-1]
+    span = np.broadcast_to(span, batch)
+    sections = np.broadcast_to(sections, batch + (n_s,))
+    positions = np.broadcast_to(positions, batch + (n_s, n_p))
+
+    # Bytes per (section, position) pair across the batch and axles, allowing
+    # for the temporaries of influence_line and their derivatives
+    pair_bytes = _TEMPORARIES * 8 * max(int(np.prod(batch)), 1) * max(x.shape[-1], 1) \
+        * (1 + partials(span, sections, positions)) * (2 if effect == 'shear' else 1)
+    p_block = int(min(n_p, max(1, memory_budget // pair_bytes)))
+    s_block = int(min(n_s, max(1, memory_budget // (pair_bytes * p_block))))
+
+    keys = ('max', 'min', 'max_position', 'min_position')
+    blocks = []
+    for s0 in range(0, n_s, s_block):
+        s = slice(s0, s0 + s_block)
+        best = None
+        for p0 in range(0, n_p, p_block):
+            block = _envelope_block(x, loads, span, sections[..., s], positions[..., s, p0:p0 + p_block], effect)
+            if best is None:
+                best = block
+                continue
+            # Strict comparisons keep the first governing position, as argmax does
+            higher = block[0] > best[0]
+            lower = block[1] < best[1]
+            v_max, v_min = np.where(higher, block[0], best[0]), np.where(lower, block[1], best[1])
+            if isinstance(v_max, Dual):
+                v_max = _tied(np.stack([best[0], block[0]], -1), v_max, np.max)
+                v_min = _tied(np.stack([best[1], block[1]], -1), v_min, np.min)
+            best = (v_max, v_min, np.where(higher, block[2], best[2]), np.where(lower, block[3], best[3]))
+        blocks.append(best)
+    return {key: np.concatenate([block[i] for block in blocks], -1) for i, key in enumerate(keys)}
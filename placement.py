@@ -0,0 +1,190 @@
+"""
+Governing transverse and longitudinal placement of vehicles on a deck by branch
+and bound.
+
+Vehicles are placed side by side across the carriageway, left to right, with
+the IRC:6-2017 Table 3 clearances: f between the outer wheel edge and the kerb,
+g between the outer wheel edges of adjacent vehicles. Vehicles in different
+lanes move independently along the span, so each one takes its own governing
+longitudinal position.
+
+The load effect comes from an influence surface (see `influence_surface`). The
+influence-line envelope of the surface (its largest ordinate along x at every z)
+bounds the effect of a vehicle at a transverse position from above without
+scanning the span; the exact longitudinal scan is only run for candidates whose
+bound could still beat the best configuration found so far.
+"""
+
+import numpy as np
+from common import *
+from influence_surface import evaluate_placements
+from irc6_2017 import IRC6_2017
+from vehicle_arrays import wheel_arrays
+
+# Table 3 f, which does not vary with width; used for single-lane decks below 5.3 m
+SINGLE_LANE_KERB_CLEARANCE = 0.15
+
+
+class _Candidate:
+    __slots__ = ('name', 'z', 'left', 'right', 'bound', 'exact', 'x')
+
+    def __init__(self, name, z, left, right, bound):
+        self.name = name
+        self.z = z
+        self.left = left
+        self.right = right
+        self.bound = bound
+        self.exact = None
+        self.x = None
+
+
+def transverse_envelope(grid_x, grid_z, ordinates, z):
+    """
+    Upper bound of the influence ordinate along the span at transverse positions z:
+    the largest ordinate of each grid column (at least 0, the value off the span),
+    interpolated linearly and falling to zero one cell beyond the grid as in
+    `influence_surface.bilinear`.
+    """
+    grid_z = np.asarray(grid_z, dtype=float)
+    dz = grid_z[1] - grid_z[0]
+    column_max = np.maximum(np.max(ordinates, axis=0), 0.0)
+    return np.interp(z, np.concatenate([[grid_z[0] - dz], grid_z, [grid_z[-1] + dz]]),
+                     np.concatenate([[0.0], column_max, [0.0]]), left=0.0, right=0.0)
+
+
+def governing_placement(vehicles, grid_x, grid_z, ordinates, left_kerb=None, right_kerb=None,
+                        transverse_step=0.1, longitudinal_step=None, wheel_width=0.5, max_count=None,
+                        lane_factors=None, design_lanes=None, f=None, g=None):
+    """
+    Maximizes the load effect of vehicles placed across and along a deck.
+
+    Args:
+        vehicles (dict): name -> vehicle dictionary (IRC6_2017 vehicle functions or
+            vehicle_registry); wheel loads must be non-negative
+        grid_x, grid_z, ordinates: influence surface (see `influence_surface.bilinear`),
+            x along the span and z across the deck
+        left_kerb, right_kerb (float, optional): carriageway edges in z (m), default
+            the grid extent
+        transverse_step (float): spacing of the candidate transverse positions (m)
+        longitudinal_step (float, optional): spacing of the longitudinal scan (m),
+            default the grid spacing
+        wheel_width (float or dict): tyre width (m) for the wheel edge clearances,
+            or name -> width
+        max_count (dict, optional): name -> largest number of such vehicles
+        lane_factors (sequence, optional): multiplier on the total effect for 1, 2,
+            3, ... loaded lanes (the last entry repeats), e.g. a multi-lane reduction
+        design_lanes (int, optional): largest number of vehicles; default Table 6
+        f, g (float, optional): kerb and vehicle-to-vehicle clearances (m), default
+            Table 3. Table 3 starts at 5.3 m; narrower decks carry a single lane with
+            the 0.15 m kerb clearance, and need g given to load more than one lane.
+
+    Returns:
+        dict: {
+            'effect': governing total effect (0.0 if no vehicle increases it),
+            'placements': list of {'vehicle', 'x', 'z', 'effect'} left to right,
+            'candidates': number of (vehicle, transverse position) candidates,
+            'evaluated': candidates whose longitudinal scan was run,
+            'nodes': search nodes visited
+        }
+    """
+    grid_x = np.asarray(grid_x, dtype=float)
+    grid_z = np.asarray(grid_z, dtype=float)
+    ordinates = np.asarray(ordinates, dtype=float)
+    left_kerb = grid_z[0] if left_kerb is None else float(left_kerb)
+    right_kerb = grid_z[-1] if right_kerb is None else float(right_kerb)
+    width = right_kerb - left_kerb
+
+    lanes = IRC6_2017.table_6(width) if design_lanes is None else int(design_lanes)
+    if f is None or g is None:
+        clearance = IRC6_2017.table_3(width) if width >= 5.3 else {'f': SINGLE_LANE_KERB_CLEARANCE, 'g': None}
+        f = clearance['f'] if f is None else f
+        g = clearance['g'] if g is None else g
+    if g is None and lanes > 1:
+        raise ValueError(f"Table 3 gives no vehicle clearance g for a {width:g} m carriageway; "
+                         f"pass g to load {lanes} lanes")
+    f = float(f)
+    g_clear = 0.0 if g is None else float(g)
+    factors = np.asarray(lane_factors if lane_factors is not None else [1.0], dtype=float)
+    factor = lambda n: factors[min(n, factors.size) - 1] if n > 0 else 0.0
+    max_count = max_count or {}
+    step = (grid_x[1] - grid_x[0]) if longitudinal_step is None else longitudinal_step
+
+    # Candidates: every vehicle at every transverse position that fits between the kerbs
+    wheels, candidates = {}, []
+    for name, vehicle in vehicles.items():
+        wx, wz, wl = wheel_arrays(vehicle)
+        if np.any(wl < 0):
+            raise ValueError(f"Vehicle {name!r} has negative wheel loads")
+        half = (wheel_width.get(name, 0.5) if isinstance(wheel_width, dict) else wheel_width) / 2.0
+        wheels[name] = (wx, wz, wl)
+        lo = left_kerb + f + half - wz.min()
+        hi = right_kerb - f - half - wz.max()
+        if hi < lo:
+            continue
+        zs = np.arange(lo, hi + 1e-9, transverse_step)
+        bounds = transverse_envelope(grid_x, grid_z, ordinates, zs[:, None] + wz) @ wl
+        for z, bound in zip(zs, bounds):
+            candidates.append(_Candidate(name, z, z + wz.min() - half, z + wz.max() + half, bound))
+
+    candidates.sort(key=lambda c: -c.bound)
+    by_left = sorted(candidates, key=lambda c: c.left)
+    lefts = np.array([c.left for c in by_left])
+    # Best bound among candidates starting at or right of each left edge
+    suffix_bound = np.maximum.accumulate(np.array([c.bound for c in by_left])[::-1])[::-1] \
+        if by_left else np.zeros(0)
+    narrowest = min((c.right - c.left for c in candidates), default=np.inf)
+
+    stats = {'evaluated': 0, 'nodes': 0}
+    best = {'effect': 0.0, 'placements': []}
+
+    def exact(c):
+        if c.exact is None:
+            wx, wz, wl = wheels[c.name]
+            xs = np.arange(grid_x[0] - wx.max(), grid_x[-1] - wx.min() + step, step)
+            result = evaluate_placements(grid_x, grid_z, ordinates, (wx, wz, wl), xs, np.full(xs.size, c.z))
+            c.exact, c.x = result['max'], result['max_x']
+            stats['evaluated'] += 1
+        return c.exact
+
+    def rest_bound(frontier, count, current):
+        """Upper bound of the final total from this state."""
+        i = np.searchsorted(lefts, frontier)
+        slot = suffix_bound[i] if i < lefts.size else 0.0
+        fits = int(np.floor((right_kerb - f - frontier + g_clear) / (narrowest + g_clear))) \
+            if np.isfinite(narrowest) else 0
+        extra = max(0, min(lanes - count, fits)) if slot > 0 else 0
+        return max(factor(n) * (current + (n - count) * slot) for n in range(count, count + extra + 1))
+
+    def search(frontier, count, current, placed, used):
+        stats['nodes'] += 1
+        value = factor(count) * current
+        if value > best['effect']:
+            best['effect'] = value
+            best['placements'] = list(placed)
+        if count >= lanes or rest_bound(frontier, count, current) <= best['effect']:
+            return
+        for c in candidates:
+            if c.left < frontier or used.get(c.name, 0) >= max_count.get(c.name, lanes):
+                continue
+            after = c.right + g_clear
+            if rest_bound(after, count + 1, current + c.bound) <= best['effect']:
+                continue
+            gain = exact(c)
+            if rest_bound(after, count + 1, current + gain) <= best['effect']:
+                continue
+            used[c.name] = used.get(c.name, 0) + 1
+            placed.append(c)
+            search(after, count + 1, current + gain, placed, used)
+            placed.pop()
+            used[c.name] -= 1
+
+    search(left_kerb, 0, 0.0, [], {})
+
+    return {
+        'effect': best['effect'],
+        'placements': [{'vehicle': c.name, 'x': c.x, 'z': c.z, 'effect': c.exact}
+                       for c in sorted(best['placements'], key=lambda c: c.z)],
+        'candidates': len(candidates),
+        'evaluated': stats['evaluated'],
+        'nodes': stats['nodes'],
+    }
@@ -0,0 +1,207 @@
+"""
+Opt-in instrumentation of the IRC6_2017 and IRC5_2015 clause functions.
+
+`enable()` replaces every public function of the clause classes by a wrapper
+that counts calls, times them and records the size of their arguments;
+`disable()` puts the original functions back, so nothing is left on the hot path
+when instrumentation is off.
+
+    import profiling
+    with profiling.profiled():
+        run_inventory(...)
+    profiling.write_json('profile.json')
+    profiling.write_prometheus('profile.prom')
+
+Timing percentiles come from a fixed-size reservoir sample per function. The
+counters are not locked; with threads, counts may be slightly off.
+"""
+
+import json
+import random
+import time
+from contextlib import contextmanager
+
+import numpy as np
+from irc5_2015 import IRC5_2015
+from irc6_2017 import IRC6_2017
+
+RESERVOIR_SIZE = 1024
+PERCENTILES = (50, 90, 99)
+
+_originals = {}
+_stats = {}
+_random = random.Random(0)
+
+
+class _FunctionStats:
+    __slots__ = ('calls', 'errors', 'total_ns', 'min_ns', 'max_ns', 'samples', 'arg_size_total', 'arg_size_max')
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.total_ns = 0
+        self.min_ns = None
+        self.max_ns = 0
+        self.samples = []
+        self.arg_size_total = 0
+        self.arg_size_max = 0
+
+    def record(self, elapsed, arg_size):
+        self.calls += 1
+        self.total_ns += elapsed
+        self.min_ns = elapsed if self.min_ns is None else min(self.min_ns, elapsed)
+        self.max_ns = max(self.max_ns, elapsed)
+        self.arg_size_total += arg_size
+        self.arg_size_max = max(self.arg_size_max, arg_size)
+        # Reservoir sampling keeps a uniform sample of all call timings
+        if len(self.samples) < RESERVOIR_SIZE:
+            self.samples.append(elapsed)
+        else:
+            j = _random.randrange(self.calls)
+            if j < RESERVOIR_SIZE:
+                self.samples[j] = elapsed
+
+    def summary(self):
+        percentiles = np.percentile(self.samples, PERCENTILES) if self.samples else [0.0] * len(PERCENTILES)
+        return {
+            'calls': self.calls,
+            'errors': self.errors,
+            'total_seconds': self.total_ns * 1e-9,
+            'mean_seconds': self.total_ns * 1e-9 / self.calls if self.calls else 0.0,
+            'min_seconds': (self.min_ns or 0) * 1e-9,
+            'max_seconds': self.max_ns * 1e-9,
+            'percentile_seconds': {str(p): float(v) * 1e-9 for p, v in zip(PERCENTILES, percentiles)},
+            'mean_arg_size': self.arg_size_total / self.calls if self.calls else 0.0,
+            'max_arg_size': self.arg_size_max,
+        }
+
+
+def _size(value):
+    """Number of elements in an argument: array size, container length, else 1."""
+    if isinstance(value, np.ndarray):
+        return value.size
+    if isinstance(value, (list, tuple, dict, set, str)):
+        return len(value)
+    return 1
+
+
+def _wrap(name, func):
+    stats = _stats.setdefault(name, _FunctionStats())
+    perf_counter_ns = time.perf_counter_ns
+
+    def wrapper(*args, **kwargs):
+        arg_size = sum(_size(a) for a in args) + sum(_size(v) for v in kwargs.values())
+        tic = perf_counter_ns()
+        try:
+            return func(*args, **kwargs)
+        except Exception:
+            stats.errors += 1
+            raise
+        finally:
+            stats.record(perf_counter_ns() - tic, arg_size)
+
+    wrapper.__name__ = func.__name__
+    wrapper.__qualname__ = func.__qualname__
+    wrapper.__doc__ = func.__doc__
+    wrapper.__wrapped__ = func
+    return wrapper
+
+
+def enable(classes=(IRC6_2017, IRC5_2015)):
+    """Instruments every public function of the given clause classes."""
+    for cls in classes:
+        for attr, raw in list(vars(cls).items()):
+            if attr.startswith('_') or (cls, attr) in _originals:
+                continue
+            is_static = isinstance(raw, staticmethod)
+            func = raw.__func__ if is_static else raw
+            if not callable(func):
+                continue
+            wrapper = _wrap(f"{cls.__name__}.{attr}", func)
+            _originals[(cls, attr)] = raw
+            setattr(cls, attr, staticmethod(wrapper) if is_static else wrapper)
+
+
+def disable():
+    """Restores the original functions; collected statistics are kept."""
+    for (cls, attr), raw in _originals.items():
+        setattr(cls, attr, raw)
+    _originals.clear()
+
+
+def is_enabled():
+    return bool(_originals)
+
+
+def reset():
+    """Clears the collected statistics."""
+    _stats.clear()
+    if _originals:
+        classes = {cls for cls, _ in _originals}
+        disable()
+        enable(tuple(classes))
+
+
+@contextmanager
+def profiled(classes=(IRC6_2017, IRC5_2015)):
+    enable(classes)
+    try:
+        yield
+    finally:
+        disable()
+
+
+def report():
+    """
+    Statistics of every instrumented function that was called.
+
+    Returns:
+        dict: function name -> {'calls', 'errors', 'total_seconds', 'mean_seconds',
+            'min_seconds', 'max_seconds', 'percentile_seconds', 'mean_arg_size',
+            'max_arg_size'}, ordered by total time
+    """
+    summaries = {name: stats.summary() for name, stats in _stats.items() if stats.calls}
+    return dict(sorted(summaries.items(), key=lambda item: -item[1]['total_seconds']))
+
+
+def write_json(path):
+    with open(path, 'w') as f:
+        json.dump(report(), f, indent=2)
+
+
+def prometheus_text():
+    """The report in the Prometheus text exposition format."""
+    lines = [
+        "# HELP irc_clause_calls_total Calls of an IRC clause function.",
+        "# TYPE irc_clause_calls_total counter",
+    ]
+    data = report()
+    for name, s in data.items():
+        lines.append(f'irc_clause_calls_total{{function="{name}"}} {s["calls"]}')
+    lines += [
+        "# HELP irc_clause_errors_total Calls of an IRC clause function that raised.",
+        "# TYPE irc_clause_errors_total counter",
+    ]
+    for name, s in data.items():
+        lines.append(f'irc_clause_errors_total{{function="{name}"}} {s["errors"]}')
+    lines += [
+        "# HELP irc_clause_duration_seconds Duration of IRC clause function calls.",
+        "# TYPE irc_clause_duration_seconds summary",
+    ]
+    for name, s in data.items():
+        for p, value in s['percentile_seconds'].items():
+            lines.append(f'irc_clause_duration_seconds{{function="{name}",quantile="{int(p) / 100}"}} {value:.9g}')
+        lines.append(f'irc_clause_duration_seconds_sum{{function="{name}"}} {s["total_seconds"]:.9g}')
+        lines.append(f'irc_clause_duration_seconds_count{{function="{name}"}} {s["calls"]}')
+    lines += [
+        "# HELP irc_clause_arg_size_max Largest total argument size seen by an IRC clause function.",
+        "# TYPE irc_clause_arg_size_max gauge",
+    ]
+    for name, s in data.items():
+        lines.append(f'irc_clause_arg_size_max{{function="{name}"}} {s["max_arg_size"]}')
+    return "\n".join(lines) + "\n"
+
+
+def write_prometheus(path):
+    with open(path, 'w') as f:
+        f.write(prometheus_text())
@@ -0,0 +1,157 @@
+"""
+Load rating of existing bridges: the largest multiplier on a rating vehicle that
+the members can carry on top of their dead-load effects, for thousands of bridges
+and members at once.
+"""
+
+import numpy as np
+from common import *
+from dual import as_float
+from moving_load import envelope
+
+# Table 7 breakpoints: span (m) -> congestion factor
+TABLE_7_SPANS = np.array([30.0, 40.0, 50.0, 60.0, 70.0])
+TABLE_7_FACTORS = np.array([1.15, 1.30, 1.45, 1.60, 1.70])
+
+
+def impact_factor(span):
+    """
+    Vectorized IRC:6-2017 Clause 208.2 impact factor 9 / (13.5 + L), the span being
+    taken between 3 m and 45 m (see IRC6_2017.cl_208_2_impact_factor).
+    """
+    return 9.0 / (13.5 + np.clip(as_float(span), 3.0, 45.0))
+
+
+def congestion_factor(span):
+    """
+    Vectorized IRC:6-2017 Table 7 congestion factor: 1.15 up to 30 m, linear
+    between the breakpoints to 1.70 at 70 m and beyond (see IRC6_2017.table_7).
+    NaN for spans of 10 m or less, to which the table does not apply.
+    """
+    span = as_float(span)
+    factor = np.interp(span, TABLE_7_SPANS, TABLE_7_FACTORS)
+    return np.where(span > 10.0, factor, np.nan)
+
+
+def rating_factor(capacity, dead_effect, live_effect, impact=0.0, dead_factor=1.0, live_factor=1.0):
+    """
+    Closed-form rating factor for load effects linear in the vehicle load:
+    RF = (C - gD D) / (gL L (1 + IM)).
+
+    Args:
+        capacity (array): member capacities C
+        dead_effect (array): dead-load effects D
+        live_effect (array): effects L of one rating vehicle
+        impact (float or array): impact factor IM
+        dead_factor, live_factor (float or array): load factors gD and gL
+
+    Returns:
+        array: rating factors, inf where the vehicle causes no effect and
+            negative where the dead load alone exceeds the capacity
+    """
+    reserve = np.asarray(capacity, dtype=float) - dead_factor * np.asarray(dead_effect, dtype=float)
+    demand = live_factor * np.asarray(live_effect, dtype=float) * (1.0 + np.asarray(impact, dtype=float))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(demand > 0.0, reserve / demand, np.inf)
+
+
+def rating_factor_bisect(utilisation, shape, lower=0.0, upper=1.0, tol=1e-4, max_expand=30, max_iter=60):
+    """
+    Rating factors of load effects that are not linear in the vehicle load, found by
+    bracketing and bisection on all members simultaneously.
+
+    Args:
+        utilisation (callable): maps an array of multipliers of shape `shape` to
+            utilisation ratios of the same shape, 1.0 at the limit and increasing
+            with the multiplier
+        shape (tuple): shape of the member arrays
+        lower (float): multiplier known to be acceptable
+        upper (float): first trial upper bound, doubled until exceeded
+        tol (float): absolute tolerance on the multiplier
+        max_expand (int): maximum number of doublings of the upper bound
+        max_iter (int): maximum number of bisections
+
+    Returns:
+        dict: {'rating_factor': array, 'bracketed': mask of members whose limit
+            was found below the final upper bound}
+    """
+    lo = np.full(shape, float(lower))
+    hi = np.full(shape, float(upper))
+
+    # Expand the bracket where the upper bound is still acceptable
+    for _ in range(max_expand):
+        open_top = utilisation(hi) <= 1.0
+        if not open_top.any():
+            break
+        lo = np.where(open_top, hi, lo)
+        hi = np.where(open_top, 2.0 * hi, hi)
+    bracketed = utilisation(hi) > 1.0
+
+    for _ in range(max_iter):
+        if np.all(hi - lo <= tol):
+            break
+        mid = (lo + hi) / 2.0
+        ok = utilisation(mid) <= 1.0
+        lo = np.where(ok, mid, lo)
+        hi = np.where(ok, hi, mid)
+
+    return {'rating_factor': lo, 'bracketed': bracketed}
+
+
+def rate_bridges(vehicle, spans, section_fractions, capacity, dead_effect, effect='moment',
+                 impact=None, dead_factor=1.0, live_factor=1.0):
+    """
+    Rates a rating vehicle (e.g. IRC6_2017.cl_204_5_1_special_vehicle) over many
+    simply supported bridges and members.
+
+    Live-load effects come from the exact moving-load envelope of one vehicle on
+    each span; the rating factor then follows in closed form. Effects are signed
+    and the capacity applies to either sense: each member is rated for the
+    largest positive live effect with the dead effect and for the largest
+    negative one with the dead effect reversed, so a live effect opposite to the
+    dead load is only relieved by it, and the lower rating governs.
+
+    Args:
+        vehicle (dict): vehicle from the IRC6_2017 vehicle functions
+        spans (array): spans (m), (n_bridges,)
+        section_fractions (array): member sections as fractions of the span,
+            (n_members,) or (n_bridges, n_members)
+        capacity (array): member capacities, the same in either sense,
+            (n_bridges, n_members), in the units of the vehicle loads times m for moments
+        dead_effect (array): signed dead-load effects, (n_bridges, n_members)
+        effect (str): 'moment' or 'shear'
+        impact (float or array, optional): impact factor; defaults to Clause 208.2
+        dead_factor, live_factor (float): load factors
+
+    Returns:
+        dict: {
+            'live_effect': signed live-load effect of the governing sense per member,
+            'impact': impact factor per bridge,
+            'rating_factor': per member, (n_bridges, n_members),
+            'governing_member': index of the lowest rated member per bridge,
+            'bridge_rating': lowest rating factor per bridge
+        }
+    """
+    spans = np.atleast_1d(np.asarray(spans, dtype=float))
+    sections = spans[:, None] * np.asarray(section_fractions, dtype=float)
+
+    result = envelope(vehicle, spans, sections, effect=effect)
+
+    if impact is None:
+        impact = impact_factor(spans)
+    impact = np.broadcast_to(np.asarray(impact, dtype=float), spans.shape)
+
+    dead_effect = np.asarray(dead_effect, dtype=float)
+    rf_positive = rating_factor(capacity, dead_effect, result['max'], impact[:, None], dead_factor, live_factor)
+    rf_negative = rating_factor(capacity, -dead_effect, -result['min'], impact[:, None], dead_factor, live_factor)
+    negative = rf_negative < rf_positive
+    rf = np.where(negative, rf_negative, rf_positive)
+    live_effect = np.where(negative, result['min'], result['max'])
+    governing = np.argmin(rf, axis=-1)
+    return {
+        'live_effect': live_effect,
+        'impact': impact,
+        'rating_factor': rf,
+        'governing_member': governing,
+        'bridge_rating': np.take_along_axis(rf, governing[:, None], -1)[:, 0],
+    }
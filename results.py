@@ -0,0 +1,230 @@
+"""
+Compact result types for the clause functions and a columnar container for
+keeping many results in memory.
+
+The clause functions keep returning dictionaries; `from_dict` turns one into a
+NamedTuple (no per-instance __dict__) and `to_dict` gives back exactly the
+original dictionary. `ResultColumns` stores many results of one type as parallel
+NumPy arrays, with repeated strings such as remarks stored as integer codes.
+"""
+
+from typing import NamedTuple, Optional
+
+import numpy as np
+
+
+def _from_dict(cls, data):
+    return cls(**{name: data.get(name) for name in cls._fields})
+
+
+def _to_dict(self):
+    return {name: value for name, value in zip(self._fields, self)
+            if value is not None or name not in self._optional}
+
+
+class SafetyKerbCheck(NamedTuple):
+    """IRC5_2015.cl_101_41_safety_kerb_width"""
+    applicable: bool
+    is_compliant: bool
+    required_min_width: float
+    provided_width: float
+    remarks: str
+
+    _optional = ()
+    from_dict = classmethod(_from_dict)
+    to_dict = _to_dict
+
+
+class FootpathWidthCheck(NamedTuple):
+    """IRC5_2015.cl_104_3_6_footpath_width"""
+    clause: str
+    applicable: bool
+    required_min_clear_width: float
+    provided_clear_width: Optional[float]
+    is_compliant: bool
+    remarks: str
+
+    _optional = ()
+    from_dict = classmethod(_from_dict)
+    to_dict = _to_dict
+
+
+class RemainingWidth(NamedTuple):
+    """IRC6_2017.table_6A; the UDL entries are only present for one lane"""
+    design_lanes: int
+    vehicle_width: float
+    f_m: float
+    remaining_width: float
+    udl_intensity_kg_m2: Optional[float] = None
+    udl_kg_per_m: Optional[float] = None
+    udl_kN_per_m: Optional[float] = None
+
+    _optional = ('udl_intensity_kg_m2', 'udl_kg_per_m', 'udl_kN_per_m')
+    from_dict = classmethod(_from_dict)
+    to_dict = _to_dict
+
+
+class WindSpeedPressure(NamedTuple):
+    """IRC6_2017.table_12"""
+    Vz: float
+    Pz: float
+
+    _optional = ()
+    from_dict = classmethod(_from_dict)
+    to_dict = _to_dict
+
+
+class VehicleLoad(NamedTuple):
+    """
+    The IRC6_2017 vehicle functions; the arrays are read-only and the
+    vehicle-specific entries (train spacing, fatigue cycles, ...) are kept in `extra`.
+    """
+    x: np.ndarray
+    z: np.ndarray
+    wheel_loads: np.ndarray
+    extra: tuple = ()
+
+    @classmethod
+    def from_dict(cls, data):
+        arrays = []
+        for key in ('x', 'z', 'wheel_loads'):
+            array = np.array(data.get(key, ()), dtype=float)
+            array.flags.writeable = False
+            arrays.append(array)
+        extra = tuple((key, value) for key, value in data.items() if key not in ('x', 'z', 'wheel_loads'))
+        return cls(*arrays, extra)
+
+    def to_dict(self):
+        data = {'x': self.x.tolist(), 'z': self.z.tolist()}
+        if self.wheel_loads.size:
+            data['wheel_loads'] = self.wheel_loads.tolist()
+        data.update(self.extra)
+        return data
+
+
+class ResultColumns:
+    """
+    Many results of one NamedTuple type stored column by column.
+
+    Booleans, integers and floats become NumPy arrays (None as NaN), strings are
+    stored as int32 codes into a shared category list, and anything else is kept
+    in an object array. Appended rows are buffered and converted in batches.
+
+    Args:
+        result_type (type): one of the result NamedTuples
+    """
+    __slots__ = ('result_type', '_columns', '_categories', '_nullable', '_pending')
+
+    def __init__(self, result_type):
+        self.result_type = result_type
+        self._columns = {name: None for name in result_type._fields}
+        self._categories = {}
+        self._nullable = set()
+        self._pending = []
+
+    @classmethod
+    def from_results(cls, result_type, results):
+        table = cls(result_type)
+        table.extend(results)
+        return table
+
+    def append(self, result):
+        if isinstance(result, dict):
+            result = self.result_type.from_dict(result)
+        self._pending.append(tuple(result))
+
+    def extend(self, results):
+        for result in results:
+            self.append(result)
+
+    def _encode(self, name, values):
+        if all(isinstance(v, (bool, np.bool_)) for v in values):
+            return np.array(values, dtype=bool)
+        if all(isinstance(v, (int, np.integer)) and not isinstance(v, bool) for v in values):
+            return np.array(values, dtype=np.int64)
+        if all(isinstance(v, (int, float, np.number)) or v is None for v in values):
+            if any(v is None for v in values):
+                self._nullable.add(name)
+            return np.array([np.nan if v is None else v for v in values], dtype=float)
+        if all(isinstance(v, str) for v in values):
+            categories = self._categories.setdefault(name, {})
+            return np.array([categories.setdefault(v, len(categories)) for v in values], dtype=np.int32)
+        column = np.empty(len(values), dtype=object)
+        column[:] = values
+        return column
+
+    def _flush(self):
+        if not self._pending:
+            return
+        batch = list(zip(*self._pending))
+        self._pending = []
+        for name, values in zip(self.result_type._fields, batch):
+            new = self._encode(name, list(values))
+            old = self._columns[name]
+            if old is None:
+                self._columns[name] = new
+                continue
+            kinds = {self._kind(name, old), self._kind(name, new)}
+            if len(kinds) == 1 or kinds == {'i', 'f'}:
+                self._columns[name] = np.concatenate([old, new])
+            else:
+                values = [self._decode(name, old, i) for i in range(old.size)] \
+                    + [self._decode(name, new, i) for i in range(new.size)]
+                self._categories.pop(name, None)
+                combined = np.empty(len(values), dtype=object)
+                combined[:] = values
+                self._columns[name] = combined
+
+    def _kind(self, name, column):
+        if name in self._categories and column.dtype == np.int32:
+            return 'category'
+        return column.dtype.kind
+
+    def _decode(self, name, column, i):
+        value = column[i]
+        if name in self._categories and column.dtype == np.int32:
+            return self._labels(name)[value]
+        if isinstance(value, np.generic):
+            value = value.item()
+        if name in self._nullable and isinstance(value, float) and np.isnan(value):
+            return None
+        return value
+
+    def _labels(self, name):
+        return list(self._categories[name])
+
+    def __len__(self):
+        self._flush()
+        first = self._columns[self.result_type._fields[0]]
+        return 0 if first is None else first.size
+
+    def column(self, name):
+        """Column as an array; string columns are decoded to an array of str."""
+        self._flush()
+        column = self._columns[name]
+        if name in self._categories and column.dtype == np.int32:
+            return np.array(self._labels(name))[column]
+        return column
+
+    def codes(self, name):
+        """Integer codes and category labels of a string column."""
+        self._flush()
+        return self._columns[name], self._labels(name)
+
+    def __getitem__(self, i):
+        self._flush()
+        return self.result_type(*(self._decode(name, self._columns[name], i)
+                                  for name in self.result_type._fields))
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def to_dicts(self):
+        return [row.to_dict() for row in self]
+
+    @property
+    def nbytes(self):
+        """Memory held by the column arrays (object columns count references only)."""
+        self._flush()
+        return sum(column.nbytes for column in self._columns.values() if column is not None)
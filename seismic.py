@@ -0,0 +1,130 @@
+"""
+Seismic design spectra and pier fundamental periods as per IRC:6-2017 Clause 219,
+vectorized over arrays of periods, zones, soil types and importance/response factors.
+"""
+
+import math
+import numpy as np
+from common import *
+from irc6_2017 import IRC6_2017
+
+
+def zone_factor(zone):
+    """
+    Vectorized lookup of the IRC:6-2017 Table 16 zone factor Z.
+
+    Args:
+        zone (str or array): seismic zone names, e.g. 'Zone IV'
+
+    Returns:
+        array: zone factors with the shape of `zone`
+
+    Raises:
+        ValueError: If a zone is not listed in Table 16
+    """
+    factors = IRC6_2017.table_16()
+    names = np.array(sorted(factors))
+    values = np.array([factors[name] for name in names])
+
+    zone = np.asarray(zone, dtype=str)
+    idx = np.clip(np.searchsorted(names, zone), 0, names.size - 1)
+    if not np.all(names[idx] == zone):
+        raise ValueError(f"zone must be one of {list(factors)}")
+    return values[idx]
+
+
+def spectral_acceleration(period, soil_type):
+    """
+    Spectral acceleration coefficient Sa/g for 5 % damping.
+
+    Sa/g = 1 + 15 T up to 0.1 s, 2.5 up to the corner period Tc,
+    c / T up to 4 s and c / 4 beyond, where (Tc, c) is (0.40, 1.00), (0.55, 1.36)
+    and (0.67, 1.67) for soil types I, II and III.
+
+    Args:
+        period (float or array): natural period T in seconds
+        soil_type (int or array): 1 rock or hard, 2 medium, 3 soft soil
+
+    Returns:
+        array: Sa/g broadcast over period and soil_type
+    """
+    period = np.asarray(period, dtype=float)
+    soil_type = np.asarray(soil_type)
+    if np.any((soil_type < 1) | (soil_type > 3)):
+        raise ValueError("soil_type must be 1, 2 or 3")
+
+    corner = np.array(KEY_SPECTRUM_CORNER_PERIOD)[soil_type - 1]
+    coefficient = np.array(KEY_SPECTRUM_COEFFICIENT)[soil_type - 1]
+
+    T = np.minimum(period, 4.0)
+    with np.errstate(divide='ignore'):
+        sa_g = np.where(T <= 0.1, 1.0 + 15.0 * T,
+                        np.where(T <= corner, 2.5, coefficient / T))
+    return sa_g
+
+
+def design_horizontal_acceleration(period, zone, soil_type, importance_factor=1.0,
+                                   response_reduction=1.0, damping_factor=1.0):
+    """
+    Design horizontal seismic coefficient Ah = (Z / 2) (Sa / g) / (R / I), with
+    R / I not taken less than 1.0.
+
+    All arguments broadcast against each other, so a whole corridor of piers
+    (each with its own period, zone and factors) is one call.
+
+    Args:
+        period (float or array): natural period T in seconds
+        zone (str or array): seismic zone, see `zone_factor`
+        soil_type (int or array): 1, 2 or 3, see `spectral_acceleration`
+        importance_factor (float or array): importance factor I
+        response_reduction (float or array): response reduction factor R
+        damping_factor (float or array): multiplier on Sa/g for damping other than 5 %
+
+    Returns:
+        dict: {'Sa_g': array, 'Ah': array, 'Av': array} where Av = 2/3 Ah
+    """
+    sa_g = spectral_acceleration(period, soil_type) * np.asarray(damping_factor, dtype=float)
+    Z = zone_factor(zone)
+    r_over_i = np.maximum(np.asarray(response_reduction, dtype=float)
+                          / np.asarray(importance_factor, dtype=float), 1.0)
+
+    Ah = (Z / 2.0) * sa_g / r_over_i
+    return {'Sa_g': sa_g, 'Ah': Ah, 'Av': 2.0 / 3.0 * Ah}
+
+
+def pier_fundamental_period(pier_height, section_area, second_moment, elastic_modulus,
+                            superstructure_weight, material='concrete_cement_reinforced'):
+    """
+    Fundamental period of single-column piers idealized as cantilevers with a
+    lumped mass at the top, T = 2 pi sqrt(M / k).
+
+    M is the superstructure mass plus 33/140 of the pier mass (Rayleigh mass of a
+    uniform cantilever), the pier density being taken from Clause 203;
+    k = 3 E I / H^3.
+
+    Args:
+        pier_height (float or array): height H of the pier (m)
+        section_area (float or array): cross-sectional area of the pier (m2)
+        second_moment (float or array): second moment of area I in the direction
+            considered (m4)
+        elastic_modulus (float or array): modulus of elasticity E (Pa)
+        superstructure_weight (float or array): superstructure dead load plus the
+            live load considered, carried by the pier (N)
+        material (str): key of IRC6_2017.cl_203_dead_load for the pier density
+
+    Returns:
+        dict: {'mass': lumped mass (kg), 'stiffness': k (N/m), 'period': T (s)}
+    """
+    density = IRC6_2017.cl_203_dead_load()[material] * 1000.0  # t/m3 -> kg/m3
+    pier_height = np.asarray(pier_height, dtype=float)
+
+    pier_mass = density * np.asarray(section_area, dtype=float) * pier_height
+    mass = np.asarray(superstructure_weight, dtype=float) / g + 33.0 / 140.0 * pier_mass
+    stiffness = 3.0 * np.asarray(elastic_modulus, dtype=float) * np.asarray(second_moment, dtype=float) \
+        / pier_height ** 3
+
+    return {
+        'mass': mass,
+        'stiffness': stiffness,
+        'period': 2.0 * math.pi * np.sqrt(mass / stiffness),
+    }
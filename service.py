@@ -0,0 +1,317 @@
+"""
+Local HTTP/JSON service for the design-check functions.
+
+The service keeps the modules loaded and evaluates requests on a warm process
+pool, so a front end pays neither interpreter nor NumPy start-up per request.
+Concurrent scalar requests to the vectorized functions are collected for a few
+milliseconds and evaluated as one array call.
+
+Endpoints:
+    POST /call     {"function": "IRC6_2017.table_3", "args": [...], "kwargs": {...}}
+    POST /batch    {"function": ..., "calls": [{"args": [...], "kwargs": {...}}, ...]}
+    GET  /metrics  request counts, errors, batch sizes and latency percentiles
+    GET  /health
+
+Command line:
+    python service.py --port 8350 --workers 4
+"""
+
+import argparse
+import importlib
+import json
+import queue
+import threading
+import time
+from collections import defaultdict, deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+
+CLAUSE_CLASSES = {'IRC6_2017': 'irc6_2017', 'IRC5_2015': 'irc5_2015'}
+# Clause functions are the static methods of CLAUSE_CLASSES with these prefixes
+CLAUSE_PREFIXES = ('cl_', 'table_')
+
+# Functions that broadcast elementwise over their positional arguments
+VECTORIZED = {
+    'rating.impact_factor',
+    'rating.congestion_factor',
+    'wind.table_12',
+    'seismic.spectral_acceleration',
+    'seismic.design_horizontal_acceleration',
+    'temperature.effective_bridge_temperature',
+}
+
+LATENCY_WINDOW = 10000
+
+
+def resolve(name):
+    """
+    Function for a request name: 'IRC6_2017.<clause>' / 'IRC5_2015.<clause>' for the
+    cl_* and table_* static methods, or one of the vectorized module functions.
+
+    Raises:
+        ValueError: If the name is not served
+    """
+    owner, _, attr = name.partition('.')
+    if attr.startswith('_'):
+        raise ValueError(f"Unknown function {name!r}")
+    if owner in CLAUSE_CLASSES and attr.startswith(CLAUSE_PREFIXES):
+        cls = getattr(importlib.import_module(CLAUSE_CLASSES[owner]), owner)
+        func = getattr(cls, attr) if isinstance(vars(cls).get(attr), staticmethod) else None
+    elif name in VECTORIZED:
+        func = getattr(importlib.import_module(owner), attr)
+    else:
+        func = None
+    if not callable(func):
+        raise ValueError(f"Unknown function {name!r}")
+    return func
+
+
+def _jsonable(value):
+    if isinstance(value, dict):
+        return {str(k): _jsonable(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(v) for v in value]
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def _warm_up():
+    for name in CLAUSE_CLASSES.values():
+        importlib.import_module(name)
+    for name in VECTORIZED:
+        importlib.import_module(name.partition('.')[0])
+
+
+def _call(name, args, kwargs):
+    try:
+        return {'result': _jsonable(resolve(name)(*args, **kwargs))}
+    except Exception as e:
+        return {'error': f"{type(e).__name__}: {e}"}
+
+
+def _call_many(name, calls):
+    return [_call(name, call.get('args', []), call.get('kwargs', {})) for call in calls]
+
+
+def _call_vectorized(name, arg_rows, kwargs):
+    """
+    One array call of a vectorized function for many scalar requests, split back
+    into one result per request; falls back to separate calls on error.
+    """
+    try:
+        columns = [np.array(column, dtype=float) for column in zip(*arg_rows)]
+        result = resolve(name)(*columns, **kwargs)
+        n = len(arg_rows)
+        if isinstance(result, dict):
+            result = {key: np.broadcast_to(value, (n,)) for key, value in result.items()}
+            return [{'result': {key: value[i].item() for key, value in result.items()}} for i in range(n)]
+        result = np.broadcast_to(result, (n,))
+        return [{'result': result[i].item()} for i in range(n)]
+    except Exception:
+        return [_call(name, list(args), kwargs) for args in arg_rows]
+
+
+class Metrics:
+    """Thread-safe request counters and recent latencies per endpoint."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.started = time.time()
+        self.requests = defaultdict(int)
+        self.errors = defaultdict(int)
+        self.latencies = defaultdict(lambda: deque(maxlen=LATENCY_WINDOW))
+        self.batches = 0
+        self.batched_calls = 0
+
+    def record(self, endpoint, seconds, error=False):
+        with self._lock:
+            self.requests[endpoint] += 1
+            self.errors[endpoint] += error
+            self.latencies[endpoint].append(seconds)
+
+    def record_batch(self, size):
+        with self._lock:
+            self.batches += 1
+            self.batched_calls += size
+
+    def snapshot(self):
+        with self._lock:
+            uptime = time.time() - self.started
+            endpoints = {}
+            for endpoint, count in self.requests.items():
+                latencies = np.array(self.latencies[endpoint])
+                p50, p90, p99 = np.percentile(latencies, [50, 90, 99]) if latencies.size else (0.0, 0.0, 0.0)
+                endpoints[endpoint] = {
+                    'requests': count,
+                    'errors': self.errors[endpoint],
+                    'requests_per_second': count / uptime if uptime else 0.0,
+                    'latency_seconds': {'p50': p50, 'p90': p90, 'p99': p99, 'max': latencies.max(initial=0.0)},
+                }
+            return _jsonable({
+                'uptime_seconds': uptime,
+                'endpoints': endpoints,
+                'batches': self.batches,
+                'mean_batch_size': self.batched_calls / self.batches if self.batches else 0.0,
+            })
+
+
+class Batcher:
+    """
+    Collects scalar calls to vectorized functions for up to `window` seconds (or
+    `max_batch` calls) and evaluates each group as one array call on the pool.
+    """
+
+    def __init__(self, pool, metrics, window=0.002, max_batch=4096):
+        self.pool = pool
+        self.metrics = metrics
+        self.window = window
+        self.max_batch = max_batch
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    @staticmethod
+    def accepts(name, args, kwargs):
+        return name in VECTORIZED and all(isinstance(a, (int, float)) and not isinstance(a, bool) for a in args)
+
+    def submit(self, name, args, kwargs):
+        future = Future()
+        self._queue.put((name, tuple(args), kwargs, future))
+        return future
+
+    def _run(self):
+        while True:
+            pending = [self._queue.get()]
+            deadline = time.perf_counter() + self.window
+            while len(pending) < self.max_batch:
+                timeout = deadline - time.perf_counter()
+                if timeout <= 0:
+                    break
+                try:
+                    pending.append(self._queue.get(timeout=timeout))
+                except queue.Empty:
+                    break
+
+            groups = defaultdict(list)
+            for name, args, kwargs, future in pending:
+                key = (name, len(args), json.dumps(kwargs, sort_keys=True))
+                groups[key].append((args, future))
+            for (name, _, kwargs), items in groups.items():
+                self.metrics.record_batch(len(items))
+                job = self.pool.submit(_call_vectorized, name, [args for args, _ in items], json.loads(kwargs))
+                job.add_done_callback(lambda job, items=items: self._deliver(job, items))
+
+    @staticmethod
+    def _deliver(job, items):
+        try:
+            results = job.result()
+        except Exception as e:
+            results = [{'error': f"{type(e).__name__}: {e}"}] * len(items)
+        for (_, future), result in zip(items, results):
+            future.set_result(result)
+
+
+class DesignCheckServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 256
+
+    def __init__(self, address, workers=None, batch_window=0.002):
+        super().__init__(address, _Handler)
+        self.pool = ProcessPoolExecutor(max_workers=workers, initializer=_warm_up)
+        self.metrics = Metrics()
+        self.batcher = Batcher(self.pool, self.metrics, window=batch_window)
+
+    def server_close(self):
+        super().server_close()
+        self.pool.shutdown()
+
+    def evaluate(self, body):
+        name = body.get('function')
+        resolve(name)  # reject unknown names before they reach the pool
+        args, kwargs = body.get('args', []), body.get('kwargs', {})
+        if self.batcher.accepts(name, args, kwargs):
+            return self.batcher.submit(name, args, kwargs).result()
+        return self.pool.submit(_call, name, args, kwargs).result()
+
+    def evaluate_batch(self, body):
+        name = body.get('function')
+        resolve(name)
+        return self.pool.submit(_call_many, name, body.get('calls', [])).result()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status, payload):
+        """Sends a JSON response and returns its status, 500 if the payload does not serialise."""
+        try:
+            data = json.dumps(payload).encode()
+        except (TypeError, ValueError) as e:
+            status = 500
+            data = json.dumps({'error': f"Result is not JSON serialisable: {type(e).__name__}: {e}"}).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+        return status
+
+    def do_GET(self):
+        if self.path == '/health':
+            self._send(200, {'status': 'ok'})
+        elif self.path == '/metrics':
+            self._send(200, self.server.metrics.snapshot())
+        else:
+            self._send(404, {'error': f"Unknown path {self.path}"})
+
+    def do_POST(self):
+        tic = time.perf_counter()
+        endpoint = self.path
+        status, payload = 200, None
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+            body = json.loads(self.rfile.read(length) or b'{}')
+            if endpoint == '/call':
+                payload = self.server.evaluate(body)
+            elif endpoint == '/batch':
+                payload = {'results': self.server.evaluate_batch(body)}
+            else:
+                status, payload = 404, {'error': f"Unknown path {endpoint}"}
+        except (ValueError, TypeError, AttributeError) as e:
+            status, payload = 400, {'error': f"{type(e).__name__}: {e}"}
+        except Exception as e:
+            status, payload = 500, {'error': f"{type(e).__name__}: {e}"}
+        if status == 200 and 'error' in payload:
+            status = 422
+        status = self._send(status, payload)
+        self.server.metrics.record(endpoint, time.perf_counter() - tic, error=status != 200)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve the design-check functions over local HTTP/JSON.")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8350)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--batch-window', type=float, default=0.002, help="seconds to collect vectorized calls")
+    args = parser.parse_args(argv)
+
+    server = DesignCheckServer((args.host, args.port), args.workers, args.batch_window)
+    print(f"Serving on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,134 @@
+"""
+Load effects on skewed slab decks, vectorized over families of spans and skew
+angles.
+
+Each longitudinal strip of a deck of skew angle theta spans L between the skewed
+support lines, so a wheel at transverse offset z sits z tan(theta) further
+along its strip than a wheel at z = 0. Mapping the wheels of a vehicle into
+these skew coordinates turns its axles into staggered wheel lines, which are then
+run over the simply supported influence lines of `moving_load`.
+
+IRC:6-2017 gives no skew correction factors; the strip results are corrected
+with the empirical factors for slab bridges of AASHTO LRFD: a reduction of
+longitudinal moments and an amplification of the shear and reaction at the
+obtuse corner. The factors are only defined up to KEY_MAX_SKEW_ANGLE; larger
+skews take the factor at that angle.
+"""
+
+import numpy as np
+from common import *
+from moving_load import DEFAULT_MEMORY_BUDGET, KEY_LOAD_EFFECT, influence_line, load_train_envelope
+from vehicle_arrays import wheel_arrays
+
+
+def skew_coordinates(x, z, skew_angle):
+    """
+    Position along a strip, measured from the skewed left support line, of points
+    at (x, z) in road coordinates (x along the road from the support line at z = 0).
+
+    Args:
+        x, z (float or array): road coordinates (m)
+        skew_angle (float or array): skew angle in degrees
+
+    Returns:
+        array: x - z tan(skew), broadcast over the inputs
+    """
+    return np.asarray(x, dtype=float) - np.asarray(z, dtype=float) * np.tan(np.radians(skew_angle))
+
+
+def _factor_tangent(skew_angle):
+    # tan of the skew magnitude, limited to the range of the correction factors
+    skew = np.minimum(np.abs(np.asarray(skew_angle, dtype=float)), KEY_MAX_SKEW_ANGLE)
+    return np.tan(np.radians(skew))
+
+
+def moment_reduction_factor(skew_angle):
+    """Moment reduction r = 1.05 - 0.25 tan(skew), at most 1.0, skew limited to KEY_MAX_SKEW_ANGLE."""
+    a, b = KEY_SKEW_MOMENT_REDUCTION
+    return np.minimum(a - b * _factor_tangent(skew_angle), 1.0)
+
+
+def obtuse_corner_factor(skew_angle, coefficient=KEY_SKEW_SHEAR_COEFFICIENT):
+    """Shear and reaction amplification 1 + c tan(skew) at the obtuse corner, skew limited to KEY_MAX_SKEW_ANGLE."""
+    return 1.0 + coefficient * _factor_tangent(skew_angle)
+
+
+def skewed_influence_surface(span, skew_angle, section, grid_x, grid_z, effect='moment'):
+    """
+    Influence surface of the strip model on an (x, z) road grid, for use with
+    `influence_surface` and `placement`.
+
+    Args:
+        span (float or array): span L along the road (m), shape (...)
+        skew_angle (float or array): skew angle in degrees, shape (...)
+        section (float or array): section along each strip from its left support (m)
+        grid_x, grid_z (array): road grid (m), (nx,) and (nz,)
+        effect (str): 'moment', 'shear' or 'reaction'
+
+    Returns:
+        array: ordinates of shape (..., nx, nz)
+    """
+    span, skew_angle, section = np.broadcast_arrays(np.asarray(span, dtype=float),
+                                                    np.asarray(skew_angle, dtype=float),
+                                                    np.asarray(section, dtype=float))
+    xi = skew_coordinates(np.asarray(grid_x, dtype=float)[:, None], np.asarray(grid_z, dtype=float)[None, :],
+                          skew_angle[..., None, None])
+    return influence_line(span[..., None, None], section[..., None, None], xi, effect)
+
+
+def skew_envelope(vehicle, span, skew_angle, section_fractions, effect='moment',
+                  shear_coefficient=KEY_SKEW_SHEAR_COEFFICIENT, memory_budget=DEFAULT_MEMORY_BUDGET):
+    """
+    Exact extreme load effects of a vehicle on a family of skewed slab decks.
+
+    The wheels are mapped into skew coordinates and run over the strips with
+    `moving_load.load_train_envelope`, which places every wheel at the section
+    and at either support in turn, the positions where the strip effect can
+    peak, in blocks bounded by `memory_budget`. Moments are then multiplied by
+    the moment reduction factor, and shears and reactions by the obtuse-corner
+    factor (for shear, decreasing linearly from the support to 1.0 at midspan).
+
+    Args:
+        vehicle (dict): vehicle from the IRC6_2017 vehicle functions or vehicle_registry
+        span (float or array): spans L (m), (n,) or scalar
+        skew_angle (float or array): skew angles in degrees, broadcast with span
+        section_fractions (array): sections as fractions of the span, (n_s,)
+        effect (str): 'moment', 'shear' or 'reaction'
+        shear_coefficient (float): c of the obtuse-corner factor
+        memory_budget (int): approximate bytes of temporaries per block
+
+    Returns:
+        dict: {
+            'max', 'min': strip-model extremes, shape (n, n_s),
+            'max_position', 'min_position': vehicle position along the road (m),
+            'factor': skew correction factor, (n, n_s),
+            'max_corrected', 'min_corrected': extremes times the factor,
+            'within_range': skew within the range of the correction factors, (n,);
+                outside it the factors are those at KEY_MAX_SKEW_ANGLE
+        }
+    """
+    if effect not in KEY_LOAD_EFFECT:
+        raise ValueError(f"effect must be one of {KEY_LOAD_EFFECT}")
+    span, skew_angle = np.broadcast_arrays(np.atleast_1d(np.asarray(span, dtype=float)),
+                                           np.atleast_1d(np.asarray(skew_angle, dtype=float)))
+    fractions = np.atleast_1d(np.asarray(section_fractions, dtype=float))
+    sections = span[:, None] * fractions
+
+    wx, wz, wl = wheel_arrays(vehicle)
+    # Wheel offsets along the strips, (n, n_w)
+    offsets = skew_coordinates(wx, wz, skew_angle[:, None])
+    result = load_train_envelope(offsets, wl, span, sections, effect=effect, memory_budget=memory_budget)
+
+    if effect == 'moment':
+        factor = np.broadcast_to(moment_reduction_factor(skew_angle)[:, None], sections.shape)
+    else:
+        amplification = obtuse_corner_factor(skew_angle, shear_coefficient)[:, None] - 1.0
+        if effect == 'shear':
+            amplification = amplification * np.clip(1.0 - 2.0 * fractions, 0.0, 1.0)
+        factor = np.broadcast_to(1.0 + amplification, sections.shape)
+
+    result['factor'] = factor
+    result['max_corrected'] = result['max'] * factor
+    result['min_corrected'] = result['min'] * factor
+    result['within_range'] = np.abs(skew_angle) <= KEY_MAX_SKEW_ANGLE
+    return result
@@ -0,0 +1,237 @@
+"""
+On-disk store for computed arrays: influence lines, load-effect envelopes and
+vehicle arrays.
+
+Every entry is keyed by a content hash of the inputs that generated it (vehicle
+definition, spans, sections, effect, ...) and kept as one .npy file per array in
+its own directory, so entries are loaded memory-mapped and worker processes
+reading the same entry share its pages. Changed inputs hash to a new key, so a
+stale entry is never returned; `prune` removes entries that are no longer wanted.
+
+A small JSON index (index.json) lists the entries; it is updated under a file
+lock and can be rebuilt from the entry directories with `rebuild_index`.
+
+    store = SnapshotStore('cache/')
+    result = store.envelope(vehicle, spans, sections, effect='moment')
+"""
+
+import fcntl
+import hashlib
+import json
+import os
+import shutil
+import time
+import uuid
+from contextlib import contextmanager
+
+import numpy as np
+from common import *
+from moving_load import envelope, influence_line
+from vehicle_arrays import axle_arrays
+
+# Part of every key; bump when the stored computations change
+SNAPSHOT_VERSION = 1
+
+INDEX_FILE = 'index.json'
+META_FILE = 'meta.json'
+
+
+def _is_real(dtype):
+    return np.issubdtype(dtype, np.integer) or np.issubdtype(dtype, np.floating)
+
+
+def _feed(h, value):
+    """Feeds a canonical byte form of nested inputs into a hash."""
+    if isinstance(value, dict):
+        h.update(b'd%d' % len(value))
+        for key in sorted(value, key=str):
+            _feed(h, str(key))
+            _feed(h, value[key])
+    elif isinstance(value, (list, tuple)):
+        h.update(b'l%d' % len(value))
+        for item in value:
+            _feed(h, item)
+    elif isinstance(value, (float, int)) and not isinstance(value, bool) or \
+            isinstance(value, (np.ndarray, np.generic)) and _is_real(value.dtype):
+        array = np.ascontiguousarray(value, dtype=float)
+        h.update(b'a' + str(array.shape).encode())
+        h.update(array.tobytes())
+    elif isinstance(value, np.ndarray):
+        # Strings, booleans, objects: element by element, repr would elide large arrays
+        h.update(b'n' + str(value.shape).encode())
+        _feed(h, value.ravel().tolist())
+    elif isinstance(value, np.generic):
+        _feed(h, value.item())
+    else:
+        h.update(b's' + repr(value).encode())
+
+
+def content_hash(kind, inputs):
+    """
+    Hash of an entry kind and its generating inputs. Numbers and arrays are
+    hashed by value as float64, so 30 and 30.0 give the same key.
+    """
+    h = hashlib.sha256()
+    _feed(h, [SNAPSHOT_VERSION, kind, inputs])
+    return h.hexdigest()[:32]
+
+
+class SnapshotStore:
+    """
+    Content-addressed array store in a local directory.
+
+    Args:
+        root (str): store directory, created if missing
+        mmap (bool): load arrays memory-mapped read-only; otherwise into memory
+    """
+
+    def __init__(self, root, mmap=True):
+        self.root = root
+        self.mmap_mode = 'r' if mmap else None
+        os.makedirs(root, exist_ok=True)
+
+    def _entry_dir(self, key):
+        return os.path.join(self.root, key)
+
+    @contextmanager
+    def _locked_index(self):
+        with open(os.path.join(self.root, INDEX_FILE + '.lock'), 'w') as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield self.index()
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def _write_index(self, index):
+        path = os.path.join(self.root, INDEX_FILE)
+        tmp = f"{path}.{uuid.uuid4().hex}.tmp"
+        with open(tmp, 'w') as f:
+            json.dump(index, f, indent=1)
+        os.replace(tmp, path)
+
+    def index(self):
+        """Entry key -> metadata ({'kind', 'arrays', 'created', 'inputs'})."""
+        path = os.path.join(self.root, INDEX_FILE)
+        if not os.path.exists(path):
+            return {}
+        with open(path) as f:
+            return json.load(f)
+
+    def get(self, kind, inputs):
+        """
+        Stored arrays for the inputs, or None if there is no entry.
+
+        Returns:
+            dict: array name -> array (read-only memory map by default)
+        """
+        directory = self._entry_dir(content_hash(kind, inputs))
+        meta_path = os.path.join(directory, META_FILE)
+        if not os.path.exists(meta_path):
+            return None
+        with open(meta_path) as f:
+            meta = json.load(f)
+        return {name: np.load(os.path.join(directory, name + '.npy'), mmap_mode=self.mmap_mode)
+                for name in meta['arrays']}
+
+    def put(self, kind, inputs, arrays, description=None):
+        """
+        Stores arrays under the hash of the inputs. The entry directory appears
+        atomically; if another process stored the same entry first, its copy is kept.
+
+        Args:
+            kind (str): entry kind, part of the key
+            inputs: generating inputs (nested dicts, lists, numbers and arrays)
+            arrays (dict): array name -> array
+            description (dict, optional): JSON-serialisable summary kept in the index
+
+        Returns:
+            str: entry key
+        """
+        key = content_hash(kind, inputs)
+        directory = self._entry_dir(key)
+        if os.path.exists(directory):
+            return key
+
+        tmp = os.path.join(self.root, f".tmp-{key}-{uuid.uuid4().hex}")
+        os.makedirs(tmp)
+        for name, array in arrays.items():
+            np.save(os.path.join(tmp, name + '.npy'), np.asarray(array), allow_pickle=False)
+        meta = {'kind': kind, 'arrays': list(arrays), 'created': time.time(), 'inputs': description or {}}
+        with open(os.path.join(tmp, META_FILE), 'w') as f:
+            json.dump(meta, f)
+        try:
+            os.rename(tmp, directory)
+        except OSError:
+            shutil.rmtree(tmp, ignore_errors=True)
+            return key
+
+        with self._locked_index() as index:
+            index[key] = meta
+            self._write_index(index)
+        return key
+
+    def get_or_compute(self, kind, inputs, compute, description=None):
+        """Stored arrays for the inputs, computing and storing them on a miss."""
+        arrays = self.get(kind, inputs)
+        if arrays is None:
+            self.put(kind, inputs, compute(), description)
+            arrays = self.get(kind, inputs)
+        return arrays
+
+    def prune(self, keep=None):
+        """
+        Removes entries for which `keep(key, meta)` is false (all entries if
+        `keep` is None) and leftovers of interrupted writes.
+
+        Returns:
+            int: number of entries removed
+        """
+        removed = 0
+        with self._locked_index() as index:
+            for name in os.listdir(self.root):
+                path = os.path.join(self.root, name)
+                if name.startswith('.tmp-'):
+                    shutil.rmtree(path, ignore_errors=True)
+                elif os.path.isdir(path) and (keep is None or not keep(name, index.get(name, {}))):
+                    shutil.rmtree(path, ignore_errors=True)
+                    index.pop(name, None)
+                    removed += 1
+            self._write_index(index)
+        return removed
+
+    def rebuild_index(self):
+        """Rewrites the index from the entry directories."""
+        with self._locked_index():
+            index = {}
+            for name in os.listdir(self.root):
+                meta_path = os.path.join(self.root, name, META_FILE)
+                if os.path.exists(meta_path):
+                    with open(meta_path) as f:
+                        index[name] = json.load(f)
+            self._write_index(index)
+        return index
+
+    def vehicle_arrays(self, vehicle):
+        """Axle positions and loads of a vehicle dictionary: {'x', 'loads'}."""
+        def compute():
+            x, loads = axle_arrays(vehicle)
+            return {'x': x, 'loads': loads}
+        return self.get_or_compute('vehicle_arrays', {'vehicle': vehicle}, compute)
+
+    def influence_lines(self, span, sections, positions, effect='moment'):
+        """Influence ordinates of `moving_load.influence_line`: {'ordinates'}."""
+        inputs = {'span': span, 'sections': sections, 'positions': positions, 'effect': effect}
+
+        def compute():
+            return {'ordinates': influence_line(np.asarray(span, dtype=float)[..., None, None],
+                                                np.asarray(sections, dtype=float)[..., :, None],
+                                                positions, effect)}
+        return self.get_or_compute('influence_line', inputs, compute,
+                                   {'effect': effect, 'shape': list(np.shape(sections)) + [np.size(positions)]})
+
+    def envelope(self, vehicle, span, sections, positions=None, effect='moment'):
+        """Envelope of `moving_load.envelope`: {'max', 'min', 'max_position', 'min_position'}."""
+        inputs = {'vehicle': vehicle, 'span': span, 'sections': sections, 'positions': positions, 'effect': effect}
+        return self.get_or_compute('envelope', inputs,
+                                   lambda: envelope(vehicle, span, sections, positions, effect),
+                                   {'effect': effect, 'n_spans': int(np.size(span))})
@@ -0,0 +1,232 @@
+"""
+Superimposed dead and footway loads of deck cross-sections, distributed to the
+girders as line loads and turned into load effects with influence-line areas.
+
+Each edge of the deck carries, from the outside in, either
+    railing | footway | crash barrier | carriageway     (footway on that side)
+or
+    crash barrier | safety kerb | carriageway            (no footway)
+with the barrier and railing outlines of IRC 5:2015 Clause 109.6.3. The loads
+(barrier and railing self-weight, railing load, footway and kerb live load,
+wearing coat) are shared between the girders by the lever rule and applied over
+the whole span, or over the part of it where they increase the effect for the
+live loads. Girder positions, widths and spans are arrays over a batch of
+cross-sections; the barrier and railing types are shared by the batch.
+"""
+
+import numpy as np
+from common import *
+from irc5_2015 import IRC5_2015
+from irc6_2017 import IRC6_2017
+from moving_load import influence_line_areas
+
+DEAD_CASES = ['barrier', 'railing_self_weight', 'wearing_coat']
+LIVE_CASES = ['railing_load', 'footway', 'kerb']
+
+KEY_WEARING_COAT_DENSITY = {'bituminous': 'concrete_asphalt', 'concrete': 'concrete_cement_plain'}
+
+
+def _unit_weight(material):
+    """Unit weight in kN/m3 of a Clause 203 material."""
+    return IRC6_2017.cl_203_dead_load()[material] * g
+
+
+def barrier_outline(barrier_type, footpath, railing_type=KEY_RAILING_TYPE[0],
+                    crash_barrier_type=KEY_RIGID_CRASH_BARRIER_TYPE[0]):
+    """
+    Width and self-weight of an edge barrier (and of the railing beside a footway)
+    from the Clause 109.6.3 outlines.
+
+    Rigid barriers are taken as a vertical base notch plus a trapezium to the top
+    notch; metallic barriers as an RCC kerb with steel posts and W-beams.
+
+    Args:
+        barrier_type (str): 'Semi-Rigid' or 'Rigid' (KEY_CRASH_BARRIER_TYPE)
+        footpath (str): KEY_FOOTPATH entry of the side
+        railing_type (str): railing beside a footway, 'RCC' or 'steel'
+        crash_barrier_type (str): rigid or metallic barrier sub-type
+
+    Returns:
+        dict: {'barrier_width' (m), 'barrier_weight' (kN/m), 'railing_width' (m)}
+
+    Raises:
+        ValueError: If Clause 109.6.3 gives no outline for the combination
+    """
+    dims = IRC5_2015.cl_109_6_3_shapes(barrier_type, footpath, railing_type, {}, crash_barrier_type)
+    if 'crash_barrier_width' not in dims:
+        raise ValueError(f"No Clause 109.6.3 outline for {barrier_type!r} with footpath {footpath!r}")
+
+    concrete = _unit_weight('concrete_cement_reinforced')
+    if 'post_section_area' in dims:
+        kerb = (dims['kerb_top_width'] + dims['kerb_bottom_width']) / 2.0 * dims['kerb_height'] * mm ** 2
+        posts = dims['post_section_area'] * dims['post_height'] / dims['post_spacing'] * mm ** 2
+        beams = dims['w_beam_thickness'] * dims['w_beam_developed_length'] * dims['number_of_w_beams'] * mm ** 2
+        weight = kerb * concrete + (posts + beams) * _unit_weight('steel')
+    else:
+        w, h = dims['crash_barrier_width'], dims['crash_barrier_height']
+        base, top = dims['crash_barrier_base_notch'], dims['crash_barrier_top_notch']
+        weight = (w * base + (w + top) / 2.0 * (h - base)) * mm ** 2 * concrete
+
+    return {
+        'barrier_width': dims['crash_barrier_width'] * mm,
+        'barrier_weight': weight,
+        'railing_width': (dims.get('railing_width') or 0.0) * mm,
+    }
+
+
+def lever_rule(girder_z, load_z):
+    """
+    Shares of unit loads carried by each girder by the lever rule, the deck
+    acting as simply supported between girders and cantilevering beyond the
+    outer ones.
+
+    Args:
+        girder_z (array): increasing girder positions (m), (..., n_g)
+        load_z (array): load positions (m), (..., n_l)
+
+    Returns:
+        array: shares of shape (..., n_l, n_g), each row summing to 1
+    """
+    girder_z = np.asarray(girder_z, dtype=float)
+    load_z = np.asarray(load_z, dtype=float)
+    n_g = girder_z.shape[-1]
+    shape = np.broadcast_shapes(girder_z.shape[:-1], load_z.shape[:-1]) + (load_z.shape[-1], n_g)
+    if n_g == 1:
+        return np.ones(shape)
+
+    gz = girder_z[..., None, :]
+    i = np.clip(np.sum(load_z[..., :, None] >= gz, axis=-1) - 1, 0, n_g - 2)
+    z0 = np.take_along_axis(np.broadcast_to(gz, shape), i[..., None], -1)[..., 0]
+    z1 = np.take_along_axis(np.broadcast_to(gz, shape), i[..., None] + 1, -1)[..., 0]
+    t = (load_z - z0) / (z1 - z0)
+
+    shares = np.zeros(shape)
+    np.put_along_axis(shares, i[..., None], (1.0 - t)[..., None], -1)
+    np.put_along_axis(shares, i[..., None] + 1, t[..., None], -1)
+    return shares
+
+
+def _band(girder_z, start, end, intensity, n_strips):
+    """Girder line loads of a uniform band load between start and end (kN/m per girder)."""
+    start, end = np.asarray(start, dtype=float), np.asarray(end, dtype=float)
+    k = (np.arange(n_strips) + 0.5) / n_strips
+    z = start[..., None] + (end - start)[..., None] * k
+    w = (np.asarray(intensity, dtype=float) * np.abs(end - start) / n_strips)[..., None]
+    return lever_rule(girder_z, z) * w[..., None]
+
+
+def _line(girder_z, z, load):
+    """Girder line loads of a line load at z (kN/m per girder)."""
+    return lever_rule(girder_z, np.asarray(z, dtype=float)[..., None])[..., 0, :] * np.asarray(load)[..., None]
+
+
+def superimposed_loads(span, deck_width, girder_z, section_fractions, effect='moment',
+                       footpath_width=(0.0, 0.0), barrier_type=KEY_CRASH_BARRIER_TYPE[2],
+                       railing_type=KEY_RAILING_TYPE[0], crash_barrier_type=KEY_RIGID_CRASH_BARRIER_TYPE[0],
+                       safety_kerb_width=(0.0, 0.0), wearing_coat_thickness=0.065,
+                       wearing_coat=KEY_WEARING_COAT[0], railing_self_weight=0.0, crowd=False, n_strips=40):
+    """
+    Girder line loads and load effects of the superimposed loads of many deck
+    cross-sections.
+
+    Args:
+        span (float or array): effective spans L (m), (n,)
+        deck_width (float or array): overall deck widths (m), (n,)
+        girder_z (array): girder positions from the left deck edge (m), (n_g,) or (n, n_g)
+        section_fractions (array): sections as fractions of the span, (n_s,)
+        effect (str): 'moment', 'shear' or 'reaction'
+        footpath_width (tuple): clear footway widths (m) on the left and right, 0 for
+            none; floats or arrays of shape (n,)
+        barrier_type, railing_type, crash_barrier_type (str): see `barrier_outline`
+        safety_kerb_width (tuple): safety kerb widths (mm) inside the barrier on
+            sides without footway; kerbs of 600 mm or more carry the footway load
+        wearing_coat_thickness (float or array): wearing coat thickness (m)
+        wearing_coat (str): 'bituminous' or 'concrete'
+        railing_self_weight (float): self-weight of each railing (kN/m)
+        crowd (bool): footway load for crowds (Clause 206.1)
+        n_strips (int): strips per band load for the lever rule
+
+    Returns:
+        dict: {
+            'line_loads': case -> girder line loads (kN/m), (n, n_g),
+            'effects': case -> {'max', 'min'} of shape (n, n_g, n_s),
+            'dead': {'max', 'min'} of the dead cases together,
+            'live': {'max', 'min'} of the live cases together,
+            'kerb_lateral': lateral kerb force of Clause 206.2 (kN/m)
+        }
+        The cases are 'barrier', 'railing_self_weight' and 'wearing_coat' (applied
+        over the whole span) and 'railing_load', 'footway' and 'kerb' (applied
+        where they increase, respectively decrease, the effect).
+    """
+    if wearing_coat not in KEY_WEARING_COAT:
+        raise ValueError(f"wearing_coat must be one of {KEY_WEARING_COAT}")
+    span = np.atleast_1d(np.asarray(span, dtype=float))
+    deck_width = np.broadcast_to(np.asarray(deck_width, dtype=float), span.shape)
+    girder_z = np.broadcast_to(np.asarray(girder_z, dtype=float), span.shape + (np.shape(girder_z)[-1],))
+    if np.any(np.diff(girder_z, axis=-1) <= 0.0):
+        raise ValueError("girder_z must be increasing")
+
+    zero = np.zeros(span.shape + girder_z.shape[-1:])
+    loads = {case: zero.copy() for case in DEAD_CASES + LIVE_CASES}
+    live_parts = {case: [] for case in LIVE_CASES}
+
+    carriageway = []
+    for side, outer in enumerate((np.zeros_like(deck_width), deck_width)):
+        direction = 1.0 if side == 0 else -1.0  # inward from this edge
+        fp = np.broadcast_to(np.asarray(footpath_width[side], dtype=float), span.shape)
+        has_fp = fp > 0.0
+
+        with_fp = barrier_outline(barrier_type, KEY_FOOTPATH[1], railing_type, crash_barrier_type)
+        without_fp = barrier_outline(barrier_type, KEY_FOOTPATH[0], railing_type, crash_barrier_type)
+        railing_w = np.where(has_fp, with_fp['railing_width'], 0.0)
+        barrier_w = np.where(has_fp, with_fp['barrier_width'], without_fp['barrier_width'])
+        barrier_weight = np.where(has_fp, with_fp['barrier_weight'], without_fp['barrier_weight'])
+        kerb_w = np.where(has_fp, 0.0, np.broadcast_to(np.asarray(safety_kerb_width[side], dtype=float), span.shape) * mm)
+
+        # Offsets from the edge: railing, footway, barrier, safety kerb, carriageway
+        fp_start = railing_w
+        barrier_start = fp_start + fp
+        kerb_start = barrier_start + barrier_w
+        road_start = kerb_start + kerb_w
+        at = lambda offset: outer + direction * offset
+
+        loads['barrier'] += _line(girder_z, at(barrier_start + barrier_w / 2.0), barrier_weight)
+        railing_mask = has_fp.astype(float)
+        loads['railing_self_weight'] += _line(girder_z, at(railing_w / 2.0), railing_self_weight * railing_mask)
+        live_parts['railing_load'].append(
+            _line(girder_z, at(railing_w / 2.0), IRC6_2017.cl_206_5_railing_load(railing_type) * railing_mask)[..., None, :])
+
+        footway_intensity = np.array([IRC6_2017.cl_206_1_footway_load(L, w, crowd) for L, w in
+                                      zip(span, np.where(has_fp, fp, kerb_w))])
+        live_parts['footway'].append(_band(girder_z, at(fp_start), at(barrier_start),
+                                           footway_intensity * has_fp, n_strips))
+        loaded_kerb = kerb_w * 1000.0 >= KEY_MIN_LOADED_KERB_WIDTH
+        live_parts['kerb'].append(_band(girder_z, at(kerb_start), at(road_start),
+                                        footway_intensity * loaded_kerb, n_strips))
+        carriageway.append(at(road_start))
+
+    coat = np.asarray(wearing_coat_thickness, dtype=float) * _unit_weight(KEY_WEARING_COAT_DENSITY[wearing_coat])
+    loads['wearing_coat'] = _band(girder_z, carriageway[0], carriageway[1], coat, n_strips).sum(axis=-2)
+
+    areas = influence_line_areas(span[:, None], span[:, None] * np.asarray(section_fractions, dtype=float), effect)
+    net, positive, negative = (areas[key][:, None, :] for key in ('net', 'positive', 'negative'))
+
+    effects = {}
+    for case in DEAD_CASES:
+        value = loads[case][..., None] * net
+        effects[case] = {'max': value, 'min': value}
+    for case in LIVE_CASES:
+        # Load only the strips that act on each girder in the governing sense
+        parts = np.concatenate(live_parts[case], axis=-2)
+        w_pos = np.maximum(parts, 0.0).sum(axis=-2)[..., None]
+        w_neg = np.minimum(parts, 0.0).sum(axis=-2)[..., None]
+        loads[case] = parts.sum(axis=-2)
+        effects[case] = {'max': w_pos * positive + w_neg * negative, 'min': w_pos * negative + w_neg * positive}
+
+    return {
+        'line_loads': loads,
+        'effects': effects,
+        'dead': {key: sum(effects[case][key] for case in DEAD_CASES) for key in ('max', 'min')},
+        'live': {key: sum(effects[case][key] for case in LIVE_CASES) for key in ('max', 'min')},
+        'kerb_lateral': IRC6_2017.cl_206_2_kerb_load(0.0)['lateral_kN_m'],
+    }
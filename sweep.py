@@ -0,0 +1,199 @@
+"""
+Sharded parametric sweeps over a Cartesian parameter grid.
+
+The grid is numbered in a fixed mixed-radix order and split into contiguous,
+deterministic shards by (shard_index, shard_count). Each shard runs on its own,
+in any process or on any node, and writes one .npz file to a shared directory;
+`merge_shards` combines them and verifies that every grid point is present once.
+
+Command line:
+    python sweep.py grid.json module:function --shard-index 0 --shard-count 8 --out-dir runs/
+    python sweep.py grid.json --merge --shard-count 8 --out-dir runs/ --output merged.npz
+"""
+
+import argparse
+import hashlib
+import importlib
+import json
+import os
+import uuid
+
+import numpy as np
+
+
+def grid_size(grid):
+    return int(np.prod([len(values) for values in grid.values()], dtype=np.int64))
+
+
+def grid_fingerprint(grid):
+    """Content hash of the grid definition, stored in every shard."""
+    text = json.dumps({name: list(values) for name, values in grid.items()}, sort_keys=False, default=str)
+    return hashlib.sha256(text.encode()).hexdigest()[:16]
+
+
+def shard_range(n_points, shard_index, shard_count):
+    """
+    Contiguous block [start, stop) of grid indices belonging to a shard; block
+    sizes differ by at most one.
+    """
+    if not 0 <= shard_index < shard_count:
+        raise ValueError("shard_index must be in [0, shard_count)")
+    return n_points * shard_index // shard_count, n_points * (shard_index + 1) // shard_count
+
+
+def grid_points(grid, indices):
+    """
+    Parameter values of the given grid indices.
+
+    Args:
+        grid (dict): parameter name -> list of values, in a fixed order
+        indices (array): flat grid indices
+
+    Returns:
+        dict: parameter name -> array of values, one per index
+    """
+    shape = tuple(len(values) for values in grid.values())
+    positions = np.unravel_index(np.asarray(indices, dtype=np.int64), shape)
+    return {name: np.asarray(values)[pos] for (name, values), pos in zip(grid.items(), positions)}
+
+
+def shard_file(out_dir, shard_index, shard_count):
+    return os.path.join(out_dir, f"shard-{shard_index:05d}-of-{shard_count:05d}.npz")
+
+
+def run_shard(grid, func, shard_index, shard_count, out_dir, vectorized=False, overwrite=False):
+    """
+    Evaluates one shard of the grid and writes its results.
+
+    Args:
+        grid (dict): parameter name -> list of values
+        func (callable): called as func(**params) for one grid point, or with arrays
+            of all points of the shard if `vectorized`; returns a scalar or a dict
+            of scalars (arrays if vectorized)
+        shard_index, shard_count (int): shard to run and total number of shards
+        out_dir (str): shared result directory
+        vectorized (bool): pass the whole shard to `func` at once
+        overwrite (bool): recompute a shard whose file already exists
+
+    Returns:
+        str: path of the shard file
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    path = shard_file(out_dir, shard_index, shard_count)
+    if os.path.exists(path) and not overwrite:
+        return path
+
+    start, stop = shard_range(grid_size(grid), shard_index, shard_count)
+    indices = np.arange(start, stop, dtype=np.int64)
+    params = grid_points(grid, indices)
+
+    if indices.size == 0:
+        # Nothing to evaluate; the merge takes the result columns from the other shards
+        columns = {}
+    elif vectorized:
+        result = func(**params)
+        columns = result if isinstance(result, dict) else {'value': result}
+        columns = {key: np.asarray(value) for key, value in columns.items()}
+    else:
+        rows = [func(**{name: values[i] for name, values in params.items()}) for i in range(indices.size)]
+        rows = [row if isinstance(row, dict) else {'value': row} for row in rows]
+        keys = list(rows[0]) if rows else []
+        columns = {key: np.array([row[key] for row in rows]) for key in keys}
+
+    tmp = f"{path}.{uuid.uuid4().hex}.tmp"
+    with open(tmp, 'wb') as f:
+        np.savez(f, __index__=indices, __fingerprint__=np.array(grid_fingerprint(grid)), **columns)
+    os.replace(tmp, path)
+    return path
+
+
+def merge_shards(grid, shard_count, out_dir, output=None):
+    """
+    Combines all shard files of a sweep and verifies completeness.
+
+    Args:
+        grid (dict): parameter name -> list of values, as used for the shards
+        shard_count (int): total number of shards
+        out_dir (str): shared result directory
+        output (str, optional): write the merged columns to this .npz file
+
+    Returns:
+        dict: parameter and result columns ordered by grid index
+
+    Raises:
+        ValueError: If shards are missing, belong to another grid, do not cover
+            every grid point exactly once or disagree on the result columns
+    """
+    fingerprint = grid_fingerprint(grid)
+    missing = [k for k in range(shard_count) if not os.path.exists(shard_file(out_dir, k, shard_count))]
+    if missing:
+        raise ValueError(f"Missing shards: {missing}")
+
+    indices, parts = [], []
+    for k in range(shard_count):
+        with np.load(shard_file(out_dir, k, shard_count)) as data:
+            if str(data['__fingerprint__']) != fingerprint:
+                raise ValueError(f"Shard {k} was computed for a different grid")
+            indices.append(data['__index__'])
+            parts.append({key: data[key] for key in data.files if not key.startswith('__')})
+
+    index = np.concatenate(indices)
+    n_points = grid_size(grid)
+    counts = np.bincount(index, minlength=n_points)
+    if index.size != n_points or np.any(counts != 1):
+        raise ValueError(f"Shards cover {np.count_nonzero(counts)} of {n_points} grid points "
+                         f"with {np.count_nonzero(counts > 1)} duplicates")
+
+    # Empty shards carry no result columns; the others must agree on them
+    filled = [(i, part) for i, part in zip(indices, parts) if i.size]
+    keys = list(filled[0][1]) if filled else []
+    for _, part in filled:
+        if set(part) != set(keys):
+            raise ValueError(f"Shards disagree on result columns: {sorted(keys)} and {sorted(part)}")
+
+    order = np.argsort(np.concatenate([i for i, _ in filled])) if filled else np.zeros(0, dtype=np.int64)
+    merged = grid_points(grid, np.arange(n_points))
+    for key in keys:
+        merged[key] = np.concatenate([part[key] for _, part in filled])[order]
+
+    if output is not None:
+        tmp = f"{output}.{uuid.uuid4().hex}.tmp"
+        with open(tmp, 'wb') as f:
+            np.savez(f, **merged)
+        os.replace(tmp, output)
+    return merged
+
+
+def _load_function(spec):
+    module_name, _, func_name = spec.partition(':')
+    return getattr(importlib.import_module(module_name), func_name)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run or merge one shard of a parameter sweep.")
+    parser.add_argument('grid', help="JSON file mapping parameter names to lists of values")
+    parser.add_argument('function', nargs='?', help="module:function evaluated at each grid point")
+    parser.add_argument('--shard-index', type=int, default=0)
+    parser.add_argument('--shard-count', type=int, default=1)
+    parser.add_argument('--out-dir', default='.')
+    parser.add_argument('--vectorized', action='store_true')
+    parser.add_argument('--merge', action='store_true')
+    parser.add_argument('--output')
+    args = parser.parse_args(argv)
+
+    with open(args.grid) as f:
+        grid = json.load(f)
+
+    if args.merge:
+        merged = merge_shards(grid, args.shard_count, args.out_dir, args.output)
+        print(f"Merged {grid_size(grid)} points from {args.shard_count} shards: {sorted(merged)}")
+    else:
+        if args.function is None:
+            parser.error("function is required unless --merge is given")
+        path = run_shard(grid, _load_function(args.function), args.shard_index, args.shard_count,
+                         args.out_dir, args.vectorized)
+        print(f"Wrote {path}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,161 @@
+"""
+Effective bridge temperature as per IRC:6-2017 Table 15 from streamed daily
+shade air temperature records of many weather stations.
+
+Records are read from a CSV file in fixed-size chunks, so memory stays constant
+however long the record is; each chunk is evaluated and reduced per site with
+NumPy.
+"""
+
+import csv
+from itertools import islice
+
+import numpy as np
+from common import *
+
+
+def effective_bridge_temperature(max_temp, min_temp):
+    """
+    Vectorized IRC:6-2017 Table 15: the effective bridge temperature is the mean of
+    the maximum and minimum shade air temperatures +- 10 °C where their difference
+    exceeds 20 °C, and +- 5 °C otherwise.
+
+    Args:
+        max_temp, min_temp (float or array): shade air temperatures in °C
+
+    Returns:
+        dict: {'mean', 'adjustment', 'max', 'min'} arrays in °C
+    """
+    max_temp = np.asarray(max_temp, dtype=float)
+    min_temp = np.asarray(min_temp, dtype=float)
+    mean = (max_temp + min_temp) / 2.0
+    adjustment = np.where(max_temp - min_temp > 20.0, 10.0, 5.0)
+    return {
+        'mean': mean,
+        'adjustment': adjustment,
+        'max': mean + adjustment,
+        'min': mean - adjustment,
+    }
+
+
+def read_climate_chunks(path, chunk_rows=100000, site_column='site', max_column='tmax', min_column='tmin',
+                        skipped=None):
+    """
+    Streams daily records from a CSV file with a header row. Each chunk of lines
+    is parsed into column arrays by np.genfromtxt in one call.
+
+    Rows whose field count differs from the header and rows with a blank or
+    non-numeric temperature are skipped. Fields are split on commas; quoted
+    fields containing commas are not supported. '#' is ordinary text.
+
+    Args:
+        path (str): CSV file
+        chunk_rows (int): rows per chunk
+        site_column, max_column, min_column (str): column names
+        skipped (dict, optional): incremented in place with the number of
+            'malformed' (wrong field count) and 'invalid' (non-numeric) rows
+
+    Yields:
+        tuple: (sites, max_temp, min_temp) arrays of at most `chunk_rows` rows
+    """
+    skipped = {} if skipped is None else skipped
+    skipped.setdefault('malformed', 0)
+    skipped.setdefault('invalid', 0)
+    with open(path, newline='') as f:
+        header = next(csv.reader(f), [])
+        try:
+            columns = [header.index(name) for name in (site_column, max_column, min_column)]
+        except ValueError:
+            raise ValueError(f"{path} needs the columns {site_column!r}, {max_column!r} and {min_column!r}") from None
+
+        while True:
+            chunk = list(islice(f, chunk_rows))
+            if not chunk:
+                break
+            lines = [line for line in chunk if line.strip()]
+            # Ragged rows are dropped here, so both parses below see the same rows
+            rows = [line for line in lines if line.count(',') == len(header) - 1]
+            skipped['malformed'] += len(lines) - len(rows)
+            if not rows:
+                continue
+            sites = np.genfromtxt(rows, delimiter=',', usecols=columns[0], dtype=str, ndmin=1, comments=None)
+            temps = np.genfromtxt(rows, delimiter=',', usecols=columns[1:], dtype=float, ndmin=2, comments=None)
+            valid = ~np.isnan(temps).any(axis=1)
+            skipped['invalid'] += int(valid.size - valid.sum())
+            if valid.any():
+                yield sites[valid], temps[valid, 0], temps[valid, 1]
+
+
+def site_temperature_statistics(path, expansion_length=1.0, installation_temperature=None,
+                                thermal_coefficient=KEY_THERMAL_EXPANSION_COEFFICIENT, chunk_rows=100000,
+                                site_column='site', max_column='tmax', min_column='tmin', skipped=None):
+    """
+    Extreme effective bridge temperatures and thermal movements for every site in
+    a climate CSV file, computed in one streaming pass.
+
+    Args:
+        path (str): CSV file of daily records, see `read_climate_chunks`
+        expansion_length (float): length of deck expanding towards the joint (m)
+        installation_temperature (float, optional): temperature at which the joints
+            and bearings are set (°C); defaults to the mean of the extremes
+        thermal_coefficient (float): coefficient of thermal expansion (per °C)
+        chunk_rows (int): rows per chunk
+        site_column, max_column, min_column (str): column names
+        skipped (dict, optional): counts of skipped rows, see `read_climate_chunks`
+
+    Returns:
+        dict: site name -> {
+            'days': number of records,
+            'max_effective', 'min_effective': extreme effective temperatures (°C),
+            'range': max_effective - min_effective (°C),
+            'mean_effective': average daily mean temperature (°C),
+            'expansion', 'contraction': movement from the installation
+                temperature (m),
+            'total_movement': movement over the full range (m)
+        }
+    """
+    index = {}
+    days = np.zeros(0)
+    hottest = np.zeros(0)
+    coldest = np.zeros(0)
+    mean_sum = np.zeros(0)
+
+    for sites, highs, lows in read_climate_chunks(path, chunk_rows, site_column, max_column, min_column, skipped):
+        names, inverse = np.unique(sites, return_inverse=True)
+        for name in names:
+            index.setdefault(str(name), len(index))
+        if len(index) > days.size:
+            grow = len(index) - days.size
+            days = np.concatenate([days, np.zeros(grow)])
+            hottest = np.concatenate([hottest, np.full(grow, -np.inf)])
+            coldest = np.concatenate([coldest, np.full(grow, np.inf)])
+            mean_sum = np.concatenate([mean_sum, np.zeros(grow)])
+
+        site_id = np.array([index[str(name)] for name in names])[inverse]
+        effective = effective_bridge_temperature(highs, lows)
+
+        np.add.at(days, site_id, 1.0)
+        np.maximum.at(hottest, site_id, effective['max'])
+        np.minimum.at(coldest, site_id, effective['min'])
+        np.add.at(mean_sum, site_id, effective['mean'])
+
+    temp_range = hottest - coldest
+    if installation_temperature is None:
+        installation = (hottest + coldest) / 2.0
+    else:
+        installation = np.full(days.size, float(installation_temperature))
+    movement = thermal_coefficient * expansion_length
+
+    result = {}
+    for name, i in index.items():
+        result[name] = {
+            'days': int(days[i]),
+            'max_effective': float(hottest[i]),
+            'min_effective': float(coldest[i]),
+            'range': float(temp_range[i]),
+            'mean_effective': float(mean_sum[i] / days[i]),
+            'expansion': float(movement * (hottest[i] - installation[i])),
+            'contraction': float(movement * (installation[i] - coldest[i])),
+            'total_movement': float(movement * temp_range[i]),
+        }
+    return result
@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+from braking import bearing_forces, braking_force, train_load_on_span, train_spacing, vehicle_length
+from common import KEY_BEARING_FRICTION, KEY_BRAKING_FORCE_HEIGHT
+from irc6_2017 import IRC6_2017
+from vehicle_arrays import axle_arrays
+
+
+def _train_load_by_copies(vehicle, span, copies=20):
+    x, loads = axle_arrays(vehicle)
+    pitch = vehicle_length(vehicle) + train_spacing(vehicle)
+    first = loads[x <= span].sum()
+    total = sum(loads[x + k * pitch <= span].sum() for k in range(copies))
+    return first, total - first
+
+
+def test_train_spacing_reads_vehicle_entry():
+    assert train_spacing(IRC6_2017.cl_204_1_ClassA_vehicle()) == 18.5
+    assert train_spacing({'x': [0.0], 'wheel_loads': [1.0]}) is None
+
+
+@pytest.mark.parametrize('vehicle', [IRC6_2017.cl_204_1_ClassA_vehicle(), IRC6_2017.cl_204_1_Class70R_vehicle_wheel()])
+def test_train_load_matches_vehicle_copies(vehicle):
+    spans = np.array([5.0, 15.0, 37.0, 60.0, 120.0])
+    first, succeeding = train_load_on_span(vehicle, spans)
+    expected = np.array([_train_load_by_copies(vehicle, span) for span in spans])
+    np.testing.assert_allclose(first, expected[:, 0])
+    np.testing.assert_allclose(succeeding, expected[:, 1])
+
+
+def test_train_pitch_includes_front_gap_and_rear_overhang():
+    vehicle = {'x': [1.0, 3.0], 'wheel_loads': [10.0, 20.0], 'length': 5.0, 'spacing_Truck': 4.0}
+    # Second vehicle's nose at 5 + 4 = 9 m, its first axle at 10 m
+    first, succeeding = train_load_on_span(vehicle, [9.9, 10.0, 12.0])
+    np.testing.assert_allclose(first, 30.0)
+    np.testing.assert_allclose(succeeding, [0.0, 10.0, 30.0])
+    assert vehicle_length(IRC6_2017.cl_204_1_ClassA_vehicle()) == pytest.approx(20.3)
+    assert vehicle_length({'x': [0.0, 2.0], 'wheel_loads': [1.0, 1.0]}) == 2.0
+
+
+def test_single_vehicle_has_no_succeeding_load():
+    first, succeeding = train_load_on_span({'x': [0.0, 2.0], 'wheel_loads': [10.0, 20.0]}, [1.0, 3.0])
+    np.testing.assert_allclose(first, [10.0, 30.0])
+    np.testing.assert_allclose(succeeding, 0.0)
+
+
+def test_braking_force_percentages_and_excess_lanes():
+    vehicles = [IRC6_2017.cl_204_1_ClassA_vehicle(), IRC6_2017.cl_204_1_Class70R_vehicle_wheel()]
+    out = braking_force([1, 2, 4], 60.0, vehicles, lead_vehicle=0, excess_vehicle=1)
+    first, succeeding = train_load_on_span(vehicles[0], 60.0)
+    excess = sum(train_load_on_span(vehicles[1], 60.0))
+    np.testing.assert_allclose(out['first'], 0.20 * first)
+    np.testing.assert_allclose(out['succeeding'], 0.10 * succeeding)
+    np.testing.assert_allclose(out['excess_lanes'], [0.0, 0.0, 2 * 0.05 * excess])
+    np.testing.assert_allclose(out['braking_force'], out['first'] + out['succeeding'] + out['excess_lanes'])
+
+
+def test_braking_force_rejects_no_lanes():
+    with pytest.raises(ValueError):
+        braking_force(0, 20.0, [IRC6_2017.cl_204_1_ClassA_vehicle()])
+
+
+def test_bearing_forces_split_between_fixed_and_free():
+    out = bearing_forces(100.0, 20.0, 800.0, 200.0, bearing_level=1.8)
+    friction = KEY_BEARING_FRICTION * 1000.0
+    assert out['height'] == pytest.approx(KEY_BRAKING_FORCE_HEIGHT + 1.8)
+    assert out['delta_reaction'] == pytest.approx(100.0 * 3.0 / 20.0)
+    assert out['free'] == pytest.approx(friction)
+    assert out['fixed'] == pytest.approx(max(100.0 - friction, 50.0 + friction))
@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+
+from braking import train_load_on_span
+from centrifugal import centrifugal_force, curved_deck_forces
+from irc6_2017 import IRC6_2017
+
+VEHICLES = [IRC6_2017.cl_204_1_ClassA_vehicle(), IRC6_2017.cl_204_1_Class70R_vehicle_wheel()]
+
+
+def test_centrifugal_force_matches_clause_function():
+    cases = [(1000.0, 60.0, 200.0), (554.0, 40.0, 75.0), (80.0, 100.0, 1000.0)]
+    for W, V, R in cases:
+        assert centrifugal_force(W, V, R) == pytest.approx(IRC6_2017.cl_212_2_centrifugal_force(W, V, R), abs=5e-4)
+    np.testing.assert_allclose(centrifugal_force(1000.0, [30.0, 60.0], 100.0), [1000.0 * 900 / 12700, 1000.0 * 3600 / 12700])
+    with pytest.raises(ValueError):
+        centrifugal_force(1000.0, 60.0, 0.0)
+
+
+def test_curved_deck_forces_sum_the_lane_trains():
+    out = curved_deck_forces([1, 3], 40.0, 50.0, 150.0, VEHICLES, lead_vehicle=1, other_vehicle=0,
+                             bearing_level=1.5, bearing_spacing=6.0)
+    lead = sum(train_load_on_span(VEHICLES[1], 40.0))
+    other = sum(train_load_on_span(VEHICLES[0], 40.0))
+    np.testing.assert_allclose(out['live_load'], [lead, lead + 2 * other])
+    np.testing.assert_allclose(out['centrifugal_force'], out['live_load'] * 2500.0 / (127.0 * 150.0))
+    assert out['height'] == pytest.approx(2.7)
+    np.testing.assert_allclose(out['overturning_moment'], out['centrifugal_force'] * 2.7)
+    np.testing.assert_allclose(out['delta_reaction'], out['overturning_moment'] / 6.0)
+
+
+def test_curved_deck_forces_broadcast_over_ramps():
+    out = curved_deck_forces(2, [[20.0], [60.0]], [30.0, 50.0, 80.0], 200.0, VEHICLES)
+    assert out['centrifugal_force'].shape == (2, 3)
+    assert 'delta_reaction' not in out
+    with pytest.raises(ValueError):
+        curved_deck_forces(0, 20.0, 30.0, 200.0, VEHICLES)
@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from design_state import DesignState, with_entries
+from irc5_2015 import IRC5_2015
+
+
+def test_versions_share_the_base_and_leave_it_unchanged():
+    base = DesignState({'span': 20.0, 'lanes': 2})
+    variant = base.set('span', 25.0)
+    assert base['span'] == 20.0 and variant['span'] == 25.0
+    assert variant.parent is base and variant._delta == {'span': 25.0}
+    assert dict(variant.without('lanes')) == {'span': 25.0}
+    assert len(variant.with_entries(width=7.5)) == 3
+    with pytest.raises(KeyError):
+        variant.without('lanes')['lanes']
+
+
+def test_setting_an_equal_value_returns_the_same_version():
+    base = DesignState({'span': 20.0, 'sections': np.array([0.25, 0.5])})
+    assert base.set('span', 20.0) is base
+    assert base.set('sections', np.array([0.25, 0.5])) is base
+    assert base.set('span', 20) is not base
+    assert base.set('sections', np.array([0.25, 0.75])) is not base
+
+
+def test_diff_between_sibling_variants():
+    base = DesignState({'span': 20.0, 'lanes': 2, 'footpath': 'with'})
+    a = base.with_entries(span=25.0, kerb=0.75)
+    b = base.with_entries(span=30.0).without('footpath')
+    diff = a.diff(b)
+    assert diff == {'added': {}, 'removed': {'kerb': 0.75, 'footpath': 'with'}, 'changed': {'span': (25.0, 30.0)}}
+    assert DesignState({'lanes': 1}).diff(DesignState({'lanes': True}))['changed'] == {'lanes': (1, True)}
+
+
+def test_long_chains_are_flattened():
+    state = DesignState()
+    for i in range(DesignState.MAX_DEPTH + 5):
+        state = state.set('step', i)
+    assert state['step'] == DesignState.MAX_DEPTH + 4
+    assert state._depth <= DesignState.MAX_DEPTH
+
+
+def test_clauses_accept_dicts_and_design_states():
+    plain = {'span': 20.0}
+    returned = IRC5_2015.cl_104_1_3_4_design_life(plain)
+    assert returned is not plain and 'span' in returned and len(returned) > 1
+    state = DesignState(plain)
+    new = IRC5_2015.cl_104_1_3_4_design_life(state)
+    assert isinstance(new, DesignState) and new.parent is state and new.to_dict() == returned
+    assert with_entries(plain, {'a': 1}, in_place=True) is plain and plain['a'] == 1
@@ -0,0 +1,108 @@
+import numpy as np
+import pytest
+
+import rating
+import wind
+from dual import Dual, derivatives, piecewise, value_of, variables
+from irc6_2017 import IRC6_2017
+from moving_load import envelope
+
+
+def _central(f, x, h=1e-6):
+    x = np.asarray(x, dtype=float)
+    return (f(x + h) - f(x - h)) / (2.0 * h)
+
+
+def _forward(f, x, h=1e-7):
+    x = np.asarray(x, dtype=float)
+    return (f(x + h) - f(x)) / h
+
+
+def test_arithmetic_and_ufuncs():
+    (x,) = variables(x=[0.5, 1.5, 3.0])
+    y = np.sqrt(x) * np.exp(-x) + np.sin(x) / x - np.log(x) ** 2 + np.maximum(x, 1.0) ** 1.5
+    f = lambda v: np.sqrt(v) * np.exp(-v) + np.sin(v) / v - np.log(v) ** 2 + np.maximum(v, 1.0) ** 1.5
+    np.testing.assert_allclose(value_of(y), f(x.value))
+    np.testing.assert_allclose(derivatives(y, ['x'])['x'], _central(f, x.value), rtol=1e-6)
+    assert (x > 1.0).dtype == bool and not isinstance(x > 1.0, Dual)
+    with pytest.raises(TypeError):
+        np.asarray(x)
+
+
+def test_piecewise_takes_the_branch_moved_into():
+    a, b = variables(a=1.0, b=1.0)
+    kink = piecewise(a - b, 2.0 * a, a + b)
+    f = lambda a, b: np.where(a - b <= 0.0, 2.0 * a, a + b)
+    d = derivatives(kink, ['a', 'b'])
+    # Increasing a opens the gap (branch a + b), increasing b closes it (branch 2 a)
+    assert d['a'] == pytest.approx(_forward(lambda v: f(v, 1.0), 1.0)) == pytest.approx(1.0)
+    assert d['b'] == pytest.approx(_forward(lambda v: f(1.0, v), 1.0), abs=1e-9)
+    assert d['b'] == 0.0
+    with pytest.raises(ValueError):
+        derivatives(kink, ['a'])
+
+
+def test_clause_functions_match_finite_differences():
+    height, speed = variables(height=[12.0, 27.0, 64.0], speed=[39.0, 44.0, 50.0])
+    Pz = wind.table_12(height, 'plain', speed)['Pz']
+    d = derivatives(Pz, ['height', 'speed'])
+    np.testing.assert_allclose(d['height'], _central(lambda h: wind.table_12(h, 'plain', speed.value)['Pz'],
+                                                     height.value), rtol=1e-6)
+    np.testing.assert_allclose(d['speed'], _central(lambda v: wind.table_12(height.value, 'plain', v)['Pz'],
+                                                    speed.value), rtol=1e-6)
+
+    (span,) = variables(span=[12.0, 22.0, 36.0, 55.0])
+    for f in (rating.impact_factor, rating.congestion_factor):
+        got = derivatives(f(span), ['span'])['span']
+        np.testing.assert_allclose(got, _central(f, span.value), rtol=1e-5, atol=1e-12)
+    assert np.isnan(value_of(rating.congestion_factor(variables(span=8.0)[0])))
+
+
+def test_wind_loads_match_finite_differences():
+    depth, spacing = variables(depth=[0.9, 1.4], spacing=[2.5, 3.0])
+    CD, valid = wind.drag_coefficient('plate', 4, depth, spacing)
+    assert valid.all()
+    d = derivatives(CD, ['depth', 'spacing'])
+    np.testing.assert_allclose(d['depth'], _central(lambda v: wind.drag_coefficient('plate', 4, v, spacing.value)[0],
+                                                    depth.value), rtol=1e-6)
+
+    exposed, height = variables(exposed=[2.5, 3.1], height=[14.0, 33.0])
+    FT = wind.transverse_wind_load(exposed, height, 'rolled', 1, 0.6, b_width=1.8)['FT']
+    d = derivatives(FT, ['exposed', 'height'])
+    f = lambda e, h: wind.transverse_wind_load(e, h, 'rolled', 1, 0.6, b_width=1.8)['FT']
+    np.testing.assert_allclose(d['exposed'], _central(lambda e: f(e, height.value), exposed.value), rtol=1e-6)
+    np.testing.assert_allclose(d['height'], _central(lambda h: f(exposed.value, h), height.value), rtol=1e-6)
+
+
+@pytest.mark.parametrize('effect', ['moment', 'shear', 'reaction'])
+def test_envelope_derivatives_match_finite_differences(effect):
+    vehicle = IRC6_2017.cl_204_1_ClassA_vehicle()
+    fractions = np.array([0.17, 0.33, 0.41])
+    span, section = variables(span=[19.3, 31.7], section=0.0)
+    sections = span[:, None] * fractions + section
+    result = envelope(vehicle, span, sections, effect=effect)
+
+    def extremes(L, offset=0.0):
+        out = envelope(vehicle, L, L[:, None] * fractions + offset, effect=effect)
+        return np.stack([out['max'], out['min']])
+
+    got = np.stack([derivatives(result[key], ['span', 'section'])['span'] for key in ('max', 'min')])
+    np.testing.assert_allclose(got, _central(extremes, span.value), rtol=1e-4, atol=1e-3)
+    got = np.stack([derivatives(result[key], ['span', 'section'])['section'] for key in ('max', 'min')])
+    expected = _central(lambda s: extremes(span.value, s[()]), 0.0)
+    np.testing.assert_allclose(got, expected, rtol=1e-4, atol=1e-3)
+
+
+@pytest.mark.parametrize('effect', ['moment', 'shear'])
+def test_envelope_derivatives_are_one_sided_at_ties_and_kinks(effect):
+    # Class 70R axles land on the section at midspan: ties and influence-line kinks
+    vehicle = IRC6_2017.cl_204_1_Class70R_vehicle_wheel()
+    (span,) = variables(span=[20.0, 30.0])
+    result = envelope(vehicle, span, span[:, None] * np.array([0.25, 0.5]), effect=effect)
+
+    def extremes(L):
+        out = envelope(vehicle, L, L[:, None] * np.array([0.25, 0.5]), effect=effect)
+        return np.stack([out['max'], out['min']])
+
+    got = np.stack([derivatives(result[key], ['span'])['span'] for key in ('max', 'min')])
+    np.testing.assert_allclose(got, _forward(extremes, span.value), rtol=1e-4, atol=1e-2)
@@ -0,0 +1,51 @@
+import math
+
+import numpy as np
+import pytest
+
+from dynamics import _recurrence, beam_modes, crossing_response
+
+SPAN, EI, MASS = 20.0, 2e10, 1.5e4
+SINGLE_AXLE = {'x': [0.0], 'wheel_loads': [100.0]}
+
+
+def test_beam_modes_follow_euler_bernoulli():
+    modes = beam_modes(SPAN, EI, MASS, 3)
+    k = np.arange(1, 4) * math.pi / SPAN
+    np.testing.assert_allclose(modes['omega'], k ** 2 * math.sqrt(EI / MASS))
+    assert modes['modal_mass'] == pytest.approx(MASS * SPAN / 2.0)
+
+
+def test_recurrence_is_exact_for_constant_force():
+    # A suddenly applied unit force on a unit-mass oscillator: u = (1 - e cos - ...) / k
+    omega, damping, dt = 3.0, 0.05, 0.01
+    A, B, C, D, A_v, B_v, C_v, D_v = _recurrence(np.array([omega]), damping, dt)
+    u = v = 0.0
+    for _ in range(500):
+        u, v = A * u + B * v + C + D, A_v * u + B_v * v + C_v + D_v
+    t = 500 * dt
+    omega_d = omega * math.sqrt(1.0 - damping ** 2)
+    exact = (1.0 - math.exp(-damping * omega * t) * (math.cos(omega_d * t)
+             + damping * omega / omega_d * math.sin(omega_d * t))) / omega ** 2
+    assert u[0] == pytest.approx(exact, rel=1e-9)
+
+
+def test_slow_crossing_is_quasi_static():
+    out = crossing_response(SINGLE_AXLE, SPAN, EI, MASS, [0.5], [SPAN / 2.0], effect='deflection')
+    assert out['amplification'][0, 0] == pytest.approx(1.0, abs=0.02)
+    # quasi-static modal deflection converges to P L^3 / 48 EI at midspan
+    assert out['static_max'][0, 0] == pytest.approx(100.0 * SPAN ** 3 / (48.0 * EI), rel=1e-3)
+
+
+def test_fast_crossing_amplifies_and_is_compared_with_code():
+    out = crossing_response(SINGLE_AXLE, SPAN, EI, MASS, [5.0, 40.0], [SPAN / 2.0], effect='deflection',
+                            impact_factor=0.05)
+    assert out['amplification'][1, 0] > out['amplification'][0, 0]
+    np.testing.assert_array_equal(out['exceeds_code'], out['amplification'] - 1.0 > 0.05)
+
+
+def test_crossing_rejects_bad_arguments():
+    with pytest.raises(ValueError):
+        crossing_response(SINGLE_AXLE, SPAN, EI, MASS, [10.0], [10.0], effect='shear')
+    with pytest.raises(ValueError):
+        crossing_response(SINGLE_AXLE, SPAN, EI, MASS, [10.0], [10.0], damping=1.0)
@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+
+from influence_surface import bilinear, evaluate_grid_fft, evaluate_placements, vehicle_on_surface, wheel_samples
+from irc6_2017 import IRC6_2017
+from vehicle_arrays import axle_arrays, class_a_contact_area, wheel_arrays
+
+
+def _surface():
+    grid_x = np.linspace(0.0, 20.0, 81)
+    grid_z = np.linspace(-4.0, 4.0, 33)
+    X, Z = np.meshgrid(grid_x, grid_z, indexing='ij')
+    ordinates = X * (20.0 - X) / 20.0 * np.exp(-Z ** 2 / 8.0)
+    return grid_x, grid_z, ordinates
+
+
+def test_wheel_samples_conserve_load_and_centroid():
+    x, z, w = wheel_samples([1.0, 3.0], [0.5, -0.5], [10.0, 20.0], contact_length=0.25, contact_width=0.5)
+    assert w.sum() == pytest.approx(30.0)
+    assert np.sum(x * w) / w.sum() == pytest.approx((10.0 + 60.0) / 30.0)
+    assert x.min() >= 1.0 - 0.125 and x.max() <= 3.0 + 0.125
+
+
+def test_bilinear_reproduces_nodes_and_vanishes_off_grid():
+    grid_x, grid_z, ordinates = _surface()
+    X, Z = np.meshgrid(grid_x, grid_z, indexing='ij')
+    np.testing.assert_allclose(bilinear(grid_x, grid_z, ordinates, X, Z), ordinates, atol=1e-12)
+    assert bilinear(grid_x, grid_z, ordinates, np.array([-5.0, 30.0]), np.array([0.0, 0.0])).tolist() == [0.0, 0.0]
+
+
+def test_fft_matches_placements_on_grid_nodes():
+    grid_x, grid_z, ordinates = _surface()
+    vehicle = IRC6_2017.cl_204_1_ClassA_vehicle()
+    B, W = class_a_contact_area(vehicle)
+    wx, wz, wl = wheel_arrays(vehicle)
+    samples = wheel_samples(wx, wz, wl, B, W)
+
+    fft = evaluate_grid_fft(grid_x, grid_z, ordinates, samples)
+    X, Z = np.meshgrid(grid_x, grid_z, indexing='ij')
+    direct = evaluate_placements(grid_x, grid_z, ordinates, samples, X, Z, chunk_size=500)
+    np.testing.assert_allclose(fft['effects'], direct['effects'], rtol=1e-9, atol=1e-6 * np.abs(direct['effects']).max())
+    assert fft['max'] == pytest.approx(direct['max'], rel=1e-9)
+
+
+def test_vehicle_on_surface_requires_both_placement_axes():
+    grid_x, grid_z, ordinates = _surface()
+    with pytest.raises(ValueError):
+        vehicle_on_surface(IRC6_2017.cl_204_1_ClassA_vehicle(), grid_x, grid_z, ordinates, placements_x=[1.0])
+
+
+def test_vehicle_arrays_split_axle_loads_between_wheels():
+    vehicle = IRC6_2017.cl_204_1_ClassA_vehicle()
+    x, loads = axle_arrays(vehicle)
+    wx, wz, wl = wheel_arrays(vehicle)
+    assert wl.sum() == pytest.approx(loads.sum())
+    assert wx.size == x.size * len(vehicle['z'])
+    with pytest.raises(ValueError):
+        axle_arrays({'x': [0.0], 'z': [0.0], 'wheel_loads_udl': 1.0})
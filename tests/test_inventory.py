@@ -0,0 +1,87 @@
+import json
+
+import numpy as np
+import pytest
+
+from inventory import evaluate_bridge, iter_results, read_checkpoint, read_records, run_inventory
+
+
+def _double(record):
+    if record['id'] == 'bad':
+        raise KeyError('span')
+    return {'id': record['id'], 'twice': 2.0 * record['span']}
+
+
+def _interrupt_at_third(record):
+    if record['id'] == 'b2':
+        raise KeyboardInterrupt
+    return _double(record)
+
+
+@pytest.fixture
+def records(tmp_path):
+    path = tmp_path / 'bridges.jsonl'
+    rows = [{'id': f'b{i}', 'span': 10.0 + i} for i in range(5)]
+    path.write_text('\n'.join(json.dumps(row) for row in rows) + '\n\n')
+    return str(path)
+
+
+def test_read_records_from_csv_converts_numbers(tmp_path):
+    path = tmp_path / 'bridges.csv'
+    path.write_text('id,span,footpath\nb0,12.5,without\n')
+    assert list(read_records(str(path))) == [{'id': 'b0', 'span': 12.5, 'footpath': 'without'}]
+
+
+def test_run_writes_shards_and_checkpoint(records, tmp_path):
+    out_dir = str(tmp_path / 'out')
+    summary = run_inventory(records, out_dir, evaluator=_double, chunk_size=2, workers=0)
+    assert (summary['chunks'], summary['records'], summary['resumed_from']) == (3, 5, 0)
+    assert [r['twice'] for r in iter_results(out_dir)] == [20.0, 22.0, 24.0, 26.0, 28.0]
+    assert read_checkpoint(out_dir)['completed_chunks'] == 3
+
+
+def test_interrupted_run_resumes_after_last_chunk(records, tmp_path):
+    out_dir = str(tmp_path / 'out')
+    with pytest.raises(KeyboardInterrupt):
+        run_inventory(records, out_dir, evaluator=_interrupt_at_third, chunk_size=2, workers=0)
+    assert read_checkpoint(out_dir)['completed_chunks'] == 1
+    summary = run_inventory(records, out_dir, evaluator=_double, chunk_size=2, workers=0)
+    assert summary['resumed_from'] == 1 and summary['records'] == 5
+    assert [r['id'] for r in iter_results(out_dir)] == ['b0', 'b1', 'b2', 'b3', 'b4']
+
+
+def test_checkpoint_for_other_settings_is_rejected(records, tmp_path):
+    out_dir = str(tmp_path / 'out')
+    run_inventory(records, out_dir, evaluator=_double, chunk_size=2, workers=0)
+    with pytest.raises(ValueError):
+        run_inventory(records, out_dir, evaluator=_double, chunk_size=3, workers=0)
+
+
+def test_errors_are_recorded_and_npz_shards_hold_columns(tmp_path):
+    path = tmp_path / 'bridges.jsonl'
+    path.write_text('{"id": "ok", "span": 5.0}\n{"id": "bad"}\n')
+    out_dir = str(tmp_path / 'out')
+    run_inventory(str(path), out_dir, evaluator=_double, chunk_size=10, workers=0, fmt='npz')
+    (shard,) = list(iter_results(out_dir, 'npz'))
+    assert shard['id'].tolist() == ['ok', 'bad']
+    np.testing.assert_array_equal(shard['twice'], [10.0, np.nan])
+    assert shard['error'][1].startswith('KeyError')
+
+
+def test_progress_is_silent_by_default_and_reported_on_request(records, tmp_path, capsys):
+    run_inventory(records, str(tmp_path / 'quiet'), evaluator=_double, chunk_size=2, workers=0)
+    assert capsys.readouterr().out == ''
+    lines = []
+    run_inventory(records, str(tmp_path / 'loud'), evaluator=_double, chunk_size=2, workers=0, progress=lines.append)
+    assert len(lines) == 3 and lines[0].startswith('chunk 0: 2 records')
+
+
+def test_worker_pool_matches_in_process_evaluation(tmp_path):
+    path = tmp_path / 'bridges.jsonl'
+    rows = [{'id': f'b{i}', 'carriageway_width': 7.5, 'span': 10.0 + 5 * i} for i in range(4)]
+    path.write_text('\n'.join(json.dumps(row) for row in rows))
+    run_inventory(str(path), str(tmp_path / 'serial'), chunk_size=3, workers=0)
+    run_inventory(str(path), str(tmp_path / 'pool'), chunk_size=3, workers=2)
+    serial = list(iter_results(str(tmp_path / 'serial')))
+    assert serial == list(iter_results(str(tmp_path / 'pool')))
+    assert serial[0] == json.loads(json.dumps(evaluate_bridge(rows[0]), default=float))
@@ -0,0 +1,35 @@
+import numpy as np
+import pytest
+
+from movements import chain_movements
+
+
+def test_thermal_openings_of_spans_fixed_at_start():
+    out = chain_movements([20.0, 30.0], 0.0, [10.0, -20.0], thermal_coefficient=1e-5)
+    np.testing.assert_allclose(out['joint_chainage'], [0.0, 20.0, 50.0])
+    np.testing.assert_allclose(out['bearing_start'], 0.0)
+    np.testing.assert_allclose(out['bearing_end'], [[2e-3, 3e-3], [-4e-3, -6e-3]])
+    np.testing.assert_allclose(out['joint_thermal'], [[0.0, -2e-3, -3e-3], [0.0, 4e-3, 6e-3]], atol=1e-15)
+    np.testing.assert_allclose(out['joint_total_movement'], [0.0, 6e-3, 9e-3], atol=1e-15)
+
+
+def test_floating_spans_split_movement_between_joints():
+    out = chain_movements([20.0, 20.0], 0.5, [10.0], thermal_coefficient=1e-5)
+    np.testing.assert_allclose(out['joint_thermal'], [[-1e-3, -2e-3, -1e-3]])
+
+
+def test_creep_shrinkage_and_braking_widen_the_envelope():
+    out = chain_movements([20.0, 30.0], 0.0, [10.0, -20.0], creep_shrinkage_strain=-2e-4,
+                          braking_force=100.0, fixed_support_stiffness=1e4, thermal_coefficient=1e-5)
+    np.testing.assert_allclose(out['joint_creep_shrinkage'], [0.0, 4e-3, 6e-3], atol=1e-15)
+    np.testing.assert_allclose(out['joint_braking'], [0.01, 0.0, 0.01])
+    long_term = out['joint_thermal'] + out['joint_creep_shrinkage']
+    np.testing.assert_allclose(out['joint_max_opening'], long_term.max(axis=0) + out['joint_braking'])
+    np.testing.assert_allclose(out['joint_max_closing'],
+                               np.minimum(long_term.min(axis=0), out['joint_creep_shrinkage']) - out['joint_braking'])
+    assert np.all(out['joint_total_movement'] >= 0.0)
+
+
+def test_default_coefficient_from_clause_215():
+    out = chain_movements([10.0], 0.0, [1.0])
+    assert out['bearing_end'][0, 0] == pytest.approx(10.0 * 1.2e-5)
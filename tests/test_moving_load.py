@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+
+from irc6_2017 import IRC6_2017
+from moving_load import envelope, influence_line, load_train_envelope
+from vehicle_arrays import axle_arrays
+
+SPANS = np.array([12.0, 25.0, 40.0])
+FRACTIONS = np.array([0.1, 0.25, 0.4, 0.5])
+
+
+def test_influence_lines():
+    x = np.array([-1.0, 2.5, 5.0, 7.5, 11.0])
+    np.testing.assert_allclose(influence_line(10.0, 5.0, x), [0.0, 1.25, 2.5, 1.25, 0.0])
+    np.testing.assert_allclose(influence_line(10.0, 5.0, x, 'shear'), [0.0, -0.25, 0.5, 0.25, 0.0])
+    np.testing.assert_allclose(influence_line(10.0, 5.0, x, 'reaction'), [0.0, 0.75, 0.5, 0.25, 0.0])
+    with pytest.raises(ValueError):
+        influence_line(10.0, 5.0, x, 'torsion')
+
+
+def test_point_load_envelopes():
+    point = {'x': [0.0], 'wheel_loads': [100.0]}
+    sections = np.array([[5.0, 2.5]])
+    moment = envelope(point, np.array([10.0]), sections)
+    np.testing.assert_allclose(moment['max'], [[250.0, 187.5]])
+    np.testing.assert_allclose(moment['max_position'], [[5.0, 2.5]])
+    shear = envelope(point, np.array([10.0]), sections, effect='shear')
+    np.testing.assert_allclose(shear['max'], [[50.0, 75.0]])
+    np.testing.assert_allclose(shear['min'], [[-50.0, -25.0]])
+    reaction = envelope(point, 10.0, np.array([0.0]), effect='reaction')
+    assert reaction['max'][0] == pytest.approx(100.0)
+
+
+@pytest.mark.parametrize('effect', ['moment', 'shear', 'reaction'])
+def test_exact_positions_bound_a_dense_scan(effect):
+    vehicle = IRC6_2017.cl_204_1_ClassA_vehicle()
+    sections = SPANS[:, None] * FRACTIONS
+    exact = envelope(vehicle, SPANS, sections, effect=effect)
+    dense = envelope(vehicle, SPANS, sections, positions=np.linspace(-25.0, 45.0, 7001), effect=effect)
+    assert np.all(exact['max'] >= dense['max'] - 1e-6)
+    assert np.all(exact['min'] <= dense['min'] + 1e-6)
+    np.testing.assert_allclose(exact['max'], dense['max'], rtol=1e-2, atol=1.0)
+
+
+@pytest.mark.parametrize('effect', ['moment', 'shear'])
+def test_blocked_envelope_equals_single_block(effect):
+    vehicle = IRC6_2017.cl_204_1_Class70R_vehicle_wheel()
+    sections = SPANS[:, None] * FRACTIONS
+    whole = envelope(vehicle, SPANS, sections, effect=effect)
+    blocked = envelope(vehicle, SPANS, sections, effect=effect, memory_budget=1)
+    for key in ('max', 'min', 'max_position'):
+        np.testing.assert_allclose(blocked[key], whole[key], err_msg=key)
+
+
+def test_batched_offsets_equal_separate_trains():
+    x, loads = axle_arrays(IRC6_2017.cl_204_1_ClassA_vehicle())
+    offsets = np.stack([x, 1.1 * x])
+    sections = 30.0 * FRACTIONS
+    batched = load_train_envelope(offsets, loads, 30.0, sections, memory_budget=4096)
+    for i in range(2):
+        single = load_train_envelope(offsets[i], loads, 30.0, sections)
+        np.testing.assert_allclose(batched['max'][i], single['max'])
@@ -0,0 +1,35 @@
+import numpy as np
+import pytest
+
+from wind import pier_wind_load, table_12
+
+
+def test_uniform_pier_below_10m_has_constant_pressure():
+    out = pier_wind_load([4.0, 8.0], [0.0, 1.0], [1.5, 1.5], 1.2)
+    Pz = table_12(10.0)['Pz']
+    np.testing.assert_allclose(out['force'], Pz * 2.0 * 1.2 * 1.5 * np.array([4.0, 8.0]))
+    np.testing.assert_allclose(out['lever_arm'], [2.0, 4.0])
+    np.testing.assert_allclose(out['width'], 1.5)
+
+
+def test_tapered_pier_matches_fine_integration():
+    kwargs = dict(profile_z=[0.0, 30.0], profile_width=[3.0, 1.5], drag_coefficient=1.0, base_level=5.0)
+    coarse = pier_wind_load(30.0, n_stations=61, **kwargs)
+    fine = pier_wind_load(30.0, n_stations=6001, rule='trapezoidal', **kwargs)
+    assert coarse['force'][0] == pytest.approx(fine['force'][0], rel=1e-4)
+    assert coarse['moment'][0] == pytest.approx(fine['moment'][0], rel=1e-4)
+
+
+def test_stepped_profile_and_per_pier_inputs():
+    out = pier_wind_load([6.0, 6.0], [[0.0, 3.0, 3.0, 6.0], [0.0, 3.0, 3.0, 6.0]],
+                         [[2.0, 2.0, 1.0, 1.0], [1.0, 1.0, 1.0, 1.0]], [1.0, 1.0],
+                         basic_wind_speed=[33, 66], n_stations=7, rule='trapezoidal')
+    np.testing.assert_allclose(out['width'][0], [2.0, 2.0, 2.0, 1.0, 1.0, 1.0, 1.0])
+    np.testing.assert_allclose(out['Pz'][1], 4.0 * out['Pz'][0])
+
+
+def test_simpson_needs_odd_stations():
+    with pytest.raises(ValueError):
+        pier_wind_load(10.0, [0.0, 10.0], [1.0, 1.0], 1.0, n_stations=40)
+    with pytest.raises(ValueError):
+        pier_wind_load(10.0, [0.0, 10.0], [1.0, 1.0], 1.0, rule='midpoint')
@@ -0,0 +1,97 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from influence_surface import evaluate_placements
+from irc6_2017 import IRC6_2017
+from placement import governing_placement, transverse_envelope
+from vehicle_arrays import wheel_arrays
+
+
+def _surface(width=7.5):
+    grid_x = np.linspace(0.0, 16.0, 33)
+    grid_z = np.linspace(-width / 2.0, width / 2.0, 16)
+    X, Z = np.meshgrid(grid_x, grid_z, indexing='ij')
+    # Skewed towards the right edge, so vehicle positions across the deck matter
+    ordinates = X * (16.0 - X) / 16.0 * (1.0 + 0.3 * Z)
+    return grid_x, grid_z, ordinates
+
+
+def _brute_force(vehicles, grid_x, grid_z, ordinates, step, lanes, factors, f, g_clear, half=0.25):
+    left_kerb, right_kerb = grid_z[0], grid_z[-1]
+    options = []
+    for name, vehicle in vehicles.items():
+        wx, wz, wl = wheel_arrays(vehicle)
+        for z in np.arange(left_kerb + f + half - wz.min(), right_kerb - f - half - wz.max() + 1e-9, step):
+            xs = np.arange(grid_x[0] - wx.max(), grid_x[-1] - wx.min() + 0.5, 0.5)
+            effect = evaluate_placements(grid_x, grid_z, ordinates, (wx, wz, wl), xs, np.full(xs.size, z))['max']
+            options.append((z + wz.min() - half, z + wz.max() + half, effect))
+    best = 0.0
+    for n in range(1, lanes + 1):
+        for combo in itertools.combinations(sorted(options), n):
+            if all(b[0] >= a[1] + g_clear for a, b in zip(combo, combo[1:])):
+                best = max(best, factors[min(n, len(factors)) - 1] * sum(c[2] for c in combo))
+    return best
+
+
+@pytest.mark.parametrize('factors', [[1.0], [1.0, 0.6]])
+def test_branch_and_bound_matches_brute_force(factors):
+    grid_x, grid_z, ordinates = _surface()
+    vehicles = {'ClassA': IRC6_2017.cl_204_1_ClassA_vehicle()}
+    out = governing_placement(vehicles, grid_x, grid_z, ordinates, transverse_step=0.5,
+                              longitudinal_step=0.5, lane_factors=factors)
+    clearance = IRC6_2017.table_3(7.5)
+    expected = _brute_force(vehicles, grid_x, grid_z, ordinates, 0.5, IRC6_2017.table_6(7.5), factors,
+                            clearance['f'], clearance['g'])
+    assert out['effect'] == pytest.approx(expected)
+    assert out['evaluated'] <= out['candidates']
+    if factors == [1.0]:
+        assert len(out['placements']) == 2
+
+
+def test_placements_respect_clearances_and_counts():
+    grid_x, grid_z, ordinates = _surface(11.0)
+    vehicles = {'ClassA': IRC6_2017.cl_204_1_ClassA_vehicle(),
+                'Class70R': IRC6_2017.cl_204_1_Class70R_vehicle_wheel()}
+    out = governing_placement(vehicles, grid_x, grid_z, ordinates, transverse_step=0.25,
+                              max_count={'Class70R': 1})
+    placed = [p['vehicle'] for p in out['placements']]
+    assert placed.count('Class70R') <= 1 and len(placed) <= IRC6_2017.table_6(11.0)
+    assert out['effect'] == pytest.approx(sum(p['effect'] for p in out['placements']))
+    zs = [p['z'] for p in out['placements']]
+    assert zs == sorted(zs)
+
+
+def test_transverse_envelope_bounds_every_column():
+    grid_x, grid_z, ordinates = _surface()
+    np.testing.assert_allclose(transverse_envelope(grid_x, grid_z, ordinates, grid_z), ordinates.max(axis=0))
+    assert transverse_envelope(grid_x, grid_z, ordinates, grid_z[-1] + 5.0) == 0.0
+
+
+def test_negative_wheel_loads_are_rejected():
+    grid_x, grid_z, ordinates = _surface()
+    with pytest.raises(ValueError):
+        governing_placement({'Uplift': {'x': [0.0], 'z': [0.0], 'wheel_loads': [-1.0]}}, grid_x, grid_z, ordinates)
+
+
+def test_narrow_deck_loads_a_single_lane():
+    grid_x, grid_z, ordinates = _surface(4.5)
+    vehicles = {'ClassA': IRC6_2017.cl_204_1_ClassA_vehicle()}
+    out = governing_placement(vehicles, grid_x, grid_z, ordinates, transverse_step=0.5,
+                              longitudinal_step=0.5, design_lanes=1)
+    expected = _brute_force(vehicles, grid_x, grid_z, ordinates, 0.5, 1, [1.0], 0.15, 0.0)
+    assert len(out['placements']) == 1
+    assert out['effect'] == pytest.approx(expected)
+    assert governing_placement(vehicles, grid_x, grid_z, ordinates, transverse_step=0.5,
+                               longitudinal_step=0.5)['effect'] == pytest.approx(expected)
+
+
+def test_narrow_deck_needs_g_for_several_lanes():
+    grid_x, grid_z, ordinates = _surface(4.5)
+    vehicles = {'ClassA': IRC6_2017.cl_204_1_ClassA_vehicle()}
+    with pytest.raises(ValueError):
+        governing_placement(vehicles, grid_x, grid_z, ordinates, design_lanes=2)
+    out = governing_placement(vehicles, grid_x, grid_z, ordinates, transverse_step=0.5,
+                              longitudinal_step=0.5, design_lanes=2, f=0.15, g=0.4)
+    assert len(out['placements']) == 1
@@ -0,0 +1,56 @@
+import json
+
+import pytest
+
+import profiling
+from irc6_2017 import IRC6_2017
+
+
+@pytest.fixture(autouse=True)
+def clean_profiler():
+    profiling.disable()
+    profiling.reset()
+    yield
+    profiling.disable()
+    profiling.reset()
+
+
+def test_profiled_counts_calls_and_restores_originals():
+    original = IRC6_2017.__dict__['cl_208_2_impact_factor']
+    with profiling.profiled():
+        assert profiling.is_enabled()
+        assert IRC6_2017.cl_208_2_impact_factor.__wrapped__ is original.__func__
+        for span in (10.0, 20.0, 30.0):
+            IRC6_2017.cl_208_2_impact_factor(span)
+    assert not profiling.is_enabled()
+    assert IRC6_2017.__dict__['cl_208_2_impact_factor'] is original
+
+    stats = profiling.report()['IRC6_2017.cl_208_2_impact_factor']
+    assert stats['calls'] == 3 and stats['errors'] == 0
+    assert stats['min_seconds'] <= stats['mean_seconds'] <= stats['max_seconds']
+    assert stats['max_arg_size'] == 1
+
+
+def test_errors_are_counted_and_reraised():
+    with profiling.profiled():
+        with pytest.raises(TypeError):
+            IRC6_2017.cl_208_2_impact_factor()
+    assert profiling.report()['IRC6_2017.cl_208_2_impact_factor']['errors'] == 1
+
+
+def test_reports_in_json_and_prometheus_formats(tmp_path):
+    with profiling.profiled():
+        IRC6_2017.table_7(35.0)
+    profiling.write_json(str(tmp_path / 'profile.json'))
+    with open(tmp_path / 'profile.json') as f:
+        assert json.load(f)['IRC6_2017.table_7']['calls'] == 1
+    text = profiling.prometheus_text()
+    assert 'irc_clause_calls_total{function="IRC6_2017.table_7"} 1' in text
+    assert 'quantile="0.99"' in text and text.endswith('\n')
+
+
+def test_reset_clears_statistics():
+    with profiling.profiled():
+        IRC6_2017.table_7(35.0)
+    profiling.reset()
+    assert profiling.report() == {}
@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+from irc6_2017 import IRC6_2017
+from rating import congestion_factor, impact_factor, rate_bridges, rating_factor, rating_factor_bisect
+
+POINT_LOAD = {'x': [0.0], 'wheel_loads': [100.0]}
+
+
+def test_impact_and_congestion_match_the_clause_functions():
+    spans = [2.0, 10.0, 50.0]
+    np.testing.assert_allclose(impact_factor(spans), [IRC6_2017.cl_208_2_impact_factor(s) for s in spans], atol=5e-4)
+    np.testing.assert_allclose(congestion_factor([12.0, 35.0, 80.0]), [IRC6_2017.table_7(s) for s in (12.0, 35.0, 80.0)])
+    assert np.isnan(congestion_factor(10.0))
+
+
+def test_rating_factor_closed_form():
+    rf = rating_factor([1000.0, 1000.0, 100.0], [400.0, 400.0, 200.0], [200.0, 0.0, 50.0],
+                       impact=0.2, dead_factor=1.35, live_factor=1.5)
+    np.testing.assert_allclose(rf, [(1000.0 - 540.0) / 360.0, np.inf, (100.0 - 270.0) / 90.0])
+
+
+def test_bisection_agrees_with_closed_form_for_linear_effects():
+    capacity = np.array([500.0, 1000.0, 3000.0])
+    dead, live = np.array([100.0, 200.0, 300.0]), np.array([80.0, 30.0, 50.0])
+    out = rating_factor_bisect(lambda m: (dead + m * live) / capacity, capacity.shape, tol=1e-6)
+    np.testing.assert_allclose(out['rating_factor'], rating_factor(capacity, dead, live), atol=1e-5)
+    assert out['bracketed'].all()
+
+
+def test_rate_bridges_point_load_at_midspan():
+    out = rate_bridges(POINT_LOAD, [10.0, 20.0], [0.5], [[1000.0], [1000.0]], [[250.0], [250.0]], impact=0.0)
+    np.testing.assert_allclose(out['live_effect'], [[250.0], [500.0]])
+    np.testing.assert_allclose(out['rating_factor'], [[3.0], [1.5]])
+    np.testing.assert_allclose(out['bridge_rating'], [3.0, 1.5])
+
+
+def test_rate_bridges_rates_both_senses_of_shear():
+    # Shear at L/4 is +75 or -25 per 100 of load. With dead +50 the negative sense
+    # is relieved (rf 6) and the positive one governs (rf 2); with dead -150 the
+    # negative sense governs (rf 2) and is reported with its sign.
+    out = rate_bridges(POINT_LOAD, [10.0], [0.25, 0.25], [[200.0, 200.0]], [[50.0, -150.0]],
+                       effect='shear', impact=0.0)
+    np.testing.assert_allclose(out['rating_factor'], [[2.0, 2.0]])
+    np.testing.assert_allclose(out['live_effect'], [[75.0, -25.0]])
+    assert out['governing_member'].tolist() == [0]
@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+
+from irc5_2015 import IRC5_2015
+from irc6_2017 import IRC6_2017
+from results import FootpathWidthCheck, RemainingWidth, ResultColumns, SafetyKerbCheck, VehicleLoad
+
+
+def test_named_tuples_round_trip_clause_dictionaries():
+    kerb = IRC5_2015.cl_101_41_safety_kerb_width(700, 'without')
+    footpath = IRC5_2015.cl_104_3_6_footpath_width('with', 1.2)
+    assert SafetyKerbCheck.from_dict(kerb).to_dict() == kerb
+    assert FootpathWidthCheck.from_dict(footpath).to_dict() == footpath
+    assert not hasattr(SafetyKerbCheck.from_dict(kerb), '__dict__')
+
+
+def test_optional_entries_are_only_written_back_when_present():
+    two_lanes = {'design_lanes': 2, 'vehicle_width': 2.3, 'f_m': 0.15, 'remaining_width': 1.2}
+    one_lane = dict(two_lanes, design_lanes=1, udl_intensity_kg_m2=500.0, udl_kg_per_m=600.0, udl_kN_per_m=5.886)
+    assert RemainingWidth.from_dict(two_lanes).to_dict() == two_lanes
+    assert RemainingWidth.from_dict(one_lane).to_dict() == one_lane
+
+
+def test_vehicle_load_is_read_only_and_round_trips():
+    vehicle = IRC6_2017.cl_204_1_ClassA_vehicle()
+    compact = VehicleLoad.from_dict(vehicle)
+    assert compact.to_dict() == vehicle
+    with pytest.raises(ValueError):
+        compact.x[0] = 1.0
+
+
+def test_columns_encode_strings_and_decode_rows():
+    checks = [IRC5_2015.cl_104_3_6_footpath_width('with', w) for w in (1.0, 1.5, 2.0, 1.2)]
+    table = ResultColumns.from_results(FootpathWidthCheck, checks)
+    assert len(table) == 4
+    codes, labels = table.codes('remarks')
+    assert codes.dtype == np.int32 and len(labels) == 2
+    assert table.column('is_compliant').tolist() == [c['is_compliant'] for c in checks]
+    assert table.to_dicts() == checks
+
+
+def test_columns_keep_none_and_promote_mixed_types():
+    table = ResultColumns(FootpathWidthCheck)
+    table.append(IRC5_2015.cl_104_3_6_footpath_width('with', 1.0))
+    table.append(IRC5_2015.cl_104_3_6_footpath_width('without', None))
+    assert len(table) == 2
+    assert table[1].provided_clear_width is None
+    assert np.isnan(table.column('provided_clear_width')[1])
+    table.append(FootpathWidthCheck('c', True, 1.5, 'n/a', True, 'r'))
+    assert [row.provided_clear_width for row in table] == [1.0, None, 'n/a']
@@ -0,0 +1,38 @@
+import math
+
+import numpy as np
+import pytest
+
+from common import g
+from seismic import design_horizontal_acceleration, pier_fundamental_period, spectral_acceleration, zone_factor
+
+
+def test_zone_factor_lookup():
+    np.testing.assert_allclose(zone_factor(['Zone II', 'Zone V', 'Zone IV']), [0.10, 0.36, 0.24])
+    with pytest.raises(ValueError):
+        zone_factor('Zone VI')
+
+
+def test_spectrum_branches_per_soil_type():
+    T = np.array([0.0, 0.05, 0.3, 0.5, 1.0, 6.0])
+    np.testing.assert_allclose(spectral_acceleration(T, 1), [1.0, 1.75, 2.5, 2.0, 1.0, 0.25])
+    np.testing.assert_allclose(spectral_acceleration(T, 3), [1.0, 1.75, 2.5, 2.5, 1.67, 1.67 / 4.0])
+    with pytest.raises(ValueError):
+        spectral_acceleration(1.0, 4)
+
+
+def test_design_acceleration_broadcasts_and_limits_r_over_i():
+    out = design_horizontal_acceleration([0.3, 1.0], ['Zone IV', 'Zone V'], [2, 2],
+                                         importance_factor=1.2, response_reduction=[3.0, 1.0])
+    np.testing.assert_allclose(out['Sa_g'], [2.5, 1.36])
+    np.testing.assert_allclose(out['Ah'], [0.12 * 2.5 / 2.5, 0.18 * 1.36])
+    np.testing.assert_allclose(out['Av'], 2.0 / 3.0 * out['Ah'])
+
+
+def test_pier_period_of_lumped_cantilever():
+    out = pier_fundamental_period(10.0, 2.0, 0.5, 3e10, 5e6)
+    mass = 5e6 / g + 33.0 / 140.0 * 2500.0 * 2.0 * 10.0
+    stiffness = 3.0 * 3e10 * 0.5 / 1000.0
+    assert out['mass'] == pytest.approx(mass)
+    assert out['stiffness'] == pytest.approx(stiffness)
+    assert out['period'] == pytest.approx(2.0 * math.pi * math.sqrt(mass / stiffness))
@@ -0,0 +1,98 @@
+import json
+import threading
+import time
+import urllib.error
+import urllib.request
+
+import pytest
+
+from service import DesignCheckServer, Metrics, _call, _call_vectorized, resolve
+from irc5_2015 import IRC5_2015
+from irc6_2017 import IRC6_2017
+
+
+def test_resolve_serves_clauses_and_vectorized_functions_only():
+    assert resolve('IRC6_2017.table_7') is IRC6_2017.table_7
+    assert resolve('wind.table_12').__module__ == 'wind'
+    assert resolve('IRC5_2015.cl_104_1_3_4_design_life') is IRC5_2015.cl_104_1_3_4_design_life
+    for name in ('IRC6_2017._private', 'os.system', 'wind._integrate', 'IRC6_2017.missing', 'IRC6_2017.mro',
+                 'IRC6_2017.__init__', 'IRC5_2015.compute_safety_kerb_area'):
+        with pytest.raises(ValueError):
+            resolve(name)
+
+
+def test_call_reports_errors_instead_of_raising():
+    assert _call('IRC6_2017.table_7', [35.0], {}) == {'result': IRC6_2017.table_7(35.0)}
+    assert _call('IRC6_2017.table_7', [], {})['error'].startswith('TypeError')
+
+
+def test_vectorized_calls_match_separate_calls():
+    rows = [(20.0,), (35.0,), (60.0,)]
+    batched = _call_vectorized('rating.congestion_factor', rows, {})
+    assert batched == [_call('rating.congestion_factor', list(row), {}) for row in rows]
+    pressures = _call_vectorized('wind.table_12', [(12.0,), (40.0,)], {'terrain': 'obstructed'})
+    assert pressures[1] == _call('wind.table_12', [40.0], {'terrain': 'obstructed'})
+
+
+def test_metrics_snapshot():
+    metrics = Metrics()
+    metrics.record('/call', 0.01)
+    metrics.record('/call', 0.03, error=True)
+    metrics.record_batch(4)
+    snapshot = metrics.snapshot()
+    assert snapshot['endpoints']['/call']['requests'] == 2
+    assert snapshot['endpoints']['/call']['errors'] == 1
+    assert snapshot['mean_batch_size'] == 4.0
+
+
+@pytest.fixture(scope='module')
+def server():
+    server = DesignCheckServer(('127.0.0.1', 0), workers=1)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def _post(url, payload):
+    request = urllib.request.Request(url, json.dumps(payload).encode(), {'Content-Type': 'application/json'})
+    try:
+        with urllib.request.urlopen(request, timeout=30) as response:
+            return response.status, json.load(response)
+    except urllib.error.HTTPError as e:
+        return e.code, json.load(e)
+
+
+def test_http_endpoints(server):
+    assert _post(server + '/call', {'function': 'IRC6_2017.table_7', 'args': [35.0]}) == \
+        (200, {'result': IRC6_2017.table_7(35.0)})
+    status, body = _post(server + '/call', {'function': 'rating.impact_factor', 'args': [20.0]})
+    assert status == 200 and body['result'] == pytest.approx(9.0 / 33.5)
+    status, body = _post(server + '/batch', {'function': 'IRC6_2017.table_7',
+                                             'calls': [{'args': [35.0]}, {'args': []}]})
+    assert status == 200 and 'error' in body['results'][1]
+    assert _post(server + '/call', {'function': 'os.system', 'args': ['true']})[0] == 400
+    assert _post(server + '/call', {'function': 'IRC6_2017.mro'})[0] == 400
+    assert _post(server + '/call', {'function': 'IRC6_2017.table_7', 'args': []})[0] == 422
+    with urllib.request.urlopen(server + '/metrics', timeout=30) as response:
+        assert json.load(response)['endpoints']['/call']['requests'] >= 3
+
+
+def test_unserialisable_result_is_a_server_error():
+    server = DesignCheckServer(('127.0.0.1', 0), workers=1)
+    server.evaluate = lambda body: {'result': {1, 2}}
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        url = f"http://127.0.0.1:{server.server_address[1]}"
+        status, body = _post(url + '/call', {'function': 'IRC6_2017.table_7', 'args': [35.0]})
+        assert status == 500 and 'not JSON serialisable' in body['error']
+        # Metrics are recorded after the response is written
+        deadline = time.monotonic() + 5.0
+        while '/call' not in server.metrics.snapshot()['endpoints'] and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert server.metrics.snapshot()['endpoints']['/call']['errors'] == 1
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+
+from common import KEY_MAX_SKEW_ANGLE
+from irc6_2017 import IRC6_2017
+from moving_load import envelope, influence_line
+from skew import moment_reduction_factor, obtuse_corner_factor, skew_coordinates, skew_envelope, \
+    skewed_influence_surface
+
+SPANS = np.array([10.0, 18.0])
+FRACTIONS = np.array([0.1, 0.3, 0.5])
+
+
+@pytest.mark.parametrize('effect', ['moment', 'shear', 'reaction'])
+def test_zero_skew_equals_the_beam_envelope(effect):
+    vehicle = IRC6_2017.cl_204_1_ClassA_vehicle()
+    skewed = skew_envelope(vehicle, SPANS, 0.0, FRACTIONS, effect=effect)
+    beam = envelope(vehicle, SPANS, SPANS[:, None] * FRACTIONS, effect=effect)
+    np.testing.assert_allclose(skewed['max'], beam['max'])
+    np.testing.assert_allclose(skewed['min'], beam['min'])
+    np.testing.assert_allclose(skewed['factor'], 1.0)
+
+
+@pytest.mark.parametrize('effect', ['moment', 'shear'])
+def test_blocked_skew_envelope_equals_single_block(effect):
+    vehicle = IRC6_2017.cl_204_1_Class70R_vehicle_wheel()
+    whole = skew_envelope(vehicle, SPANS, [20.0, 40.0], FRACTIONS, effect=effect)
+    blocked = skew_envelope(vehicle, SPANS, [20.0, 40.0], FRACTIONS, effect=effect, memory_budget=1)
+    for key in ('max', 'min', 'max_corrected'):
+        np.testing.assert_allclose(blocked[key], whole[key], err_msg=key)
+
+
+def test_correction_factors_are_clamped_and_symmetric():
+    assert moment_reduction_factor(0.0) == 1.0
+    assert moment_reduction_factor(30.0) == pytest.approx(1.05 - 0.25 * np.tan(np.radians(30.0)))
+    assert moment_reduction_factor(-30.0) == moment_reduction_factor(30.0)
+    assert moment_reduction_factor(80.0) == moment_reduction_factor(KEY_MAX_SKEW_ANGLE)
+    assert obtuse_corner_factor(89.9) == obtuse_corner_factor(KEY_MAX_SKEW_ANGLE)
+    assert obtuse_corner_factor(-20.0) == obtuse_corner_factor(20.0) > 1.0
+    out = skew_envelope(IRC6_2017.cl_204_1_ClassA_vehicle(), 12.0, [30.0, 70.0], [0.5])
+    assert out['within_range'].tolist() == [True, False]
+    assert np.all(np.isfinite(out['max_corrected']))
+
+
+def test_shear_amplification_fades_to_midspan():
+    out = skew_envelope(IRC6_2017.cl_204_1_ClassA_vehicle(), 12.0, 30.0, [0.0, 0.25, 0.5], effect='shear')
+    c = obtuse_corner_factor(30.0) - 1.0
+    np.testing.assert_allclose(out['factor'][0], [1.0 + c, 1.0 + c / 2.0, 1.0])
+
+
+def test_skewed_surface_shifts_ordinates_along_the_strips():
+    grid_x, grid_z = np.linspace(0.0, 12.0, 25), np.array([-2.0, 0.0, 2.0])
+    surface = skewed_influence_surface(10.0, 30.0, 5.0, grid_x, grid_z)
+    xi = skew_coordinates(grid_x[:, None], grid_z[None, :], 30.0)
+    np.testing.assert_allclose(surface, influence_line(10.0, 5.0, xi))
+    np.testing.assert_allclose(surface[:, 1], influence_line(10.0, 5.0, grid_x))
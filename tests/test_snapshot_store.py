@@ -0,0 +1,73 @@
+import os
+
+import numpy as np
+import pytest
+
+from irc6_2017 import IRC6_2017
+from moving_load import envelope
+from snapshot_store import SnapshotStore, content_hash
+
+
+def test_content_hash_is_by_value():
+    assert content_hash('envelope', {'span': 30}) == content_hash('envelope', {'span': 30.0})
+    assert content_hash('envelope', {'span': 30}) != content_hash('influence_line', {'span': 30})
+    assert content_hash('envelope', {'span': 30}) != content_hash('envelope', {'span': 30.5})
+
+
+def test_content_hash_of_non_numeric_numpy_values():
+    assert content_hash('k', {'terrain': np.str_('plain')}) == content_hash('k', {'terrain': 'plain'})
+    assert content_hash('k', [np.bytes_(b'a'), np.bool_(True)]) == content_hash('k', [b'a', True])
+    assert content_hash('k', np.array(['a', 'b'])) != content_hash('k', np.array(['a', 'c']))
+    names = np.array(['x%d' % i for i in range(2000)])
+    changed = names.copy()
+    changed[1000] = 'y'
+    assert content_hash('k', names) != content_hash('k', changed)
+
+
+def test_put_get_round_trip_is_memory_mapped(tmp_path):
+    store = SnapshotStore(str(tmp_path))
+    assert store.get('table', {'n': 3}) is None
+    key = store.put('table', {'n': 3}, {'a': np.arange(3.0), 'b': np.eye(2)}, {'note': 'test'})
+    arrays = store.get('table', {'n': 3.0})
+    np.testing.assert_array_equal(arrays['a'], [0.0, 1.0, 2.0])
+    assert isinstance(arrays['b'], np.memmap) and not arrays['b'].flags.writeable
+    assert store.index()[key]['inputs'] == {'note': 'test'}
+    assert store.put('table', {'n': 3}, {'a': np.zeros(1)}) == key
+    np.testing.assert_array_equal(store.get('table', {'n': 3})['a'], [0.0, 1.0, 2.0])
+
+
+def test_get_or_compute_computes_once(tmp_path):
+    store = SnapshotStore(str(tmp_path), mmap=False)
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return {'value': np.array([42.0])}
+
+    for _ in range(3):
+        assert store.get_or_compute('answer', {}, compute)['value'][0] == 42.0
+    assert len(calls) == 1
+
+
+def test_envelope_entries_match_direct_computation(tmp_path):
+    store = SnapshotStore(str(tmp_path))
+    vehicle = IRC6_2017.cl_204_1_ClassA_vehicle()
+    spans = np.array([20.0, 30.0])
+    sections = spans[:, None] * np.array([0.25, 0.5])
+    stored = store.envelope(vehicle, spans, sections)
+    direct = envelope(vehicle, spans, sections)
+    for key in direct:
+        np.testing.assert_allclose(stored[key], direct[key])
+    assert store.influence_lines(20.0, [5.0, 10.0], np.linspace(0.0, 20.0, 5))['ordinates'].shape == (2, 5)
+
+
+def test_prune_and_rebuild_index(tmp_path):
+    store = SnapshotStore(str(tmp_path))
+    keep = store.put('table', {'n': 1}, {'a': np.ones(1)})
+    drop = store.put('table', {'n': 2}, {'a': np.ones(2)})
+    os.makedirs(tmp_path / '.tmp-interrupted')
+    assert store.prune(lambda key, meta: key == keep) == 1
+    assert not (tmp_path / drop).exists() and not (tmp_path / '.tmp-interrupted').exists()
+    os.remove(tmp_path / 'index.json')
+    assert list(store.rebuild_index()) == [keep]
+    assert store.prune() == 1 and store.index() == {}
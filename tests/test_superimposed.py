@@ -0,0 +1,69 @@
+import numpy as np
+import pytest
+
+from common import KEY_FOOTPATH, g
+from irc6_2017 import IRC6_2017
+from superimposed import barrier_outline, lever_rule, superimposed_loads
+
+GIRDERS = [1.5, 4.0, 6.5, 8.5]
+
+
+def test_clause_206_loads():
+    assert IRC6_2017.cl_206_1_footway_load() == 3.924
+    assert IRC6_2017.cl_206_1_footway_load(20.0, 1.5) == 3.379
+    assert IRC6_2017.cl_206_1_footway_load(40.0, 1.5) == 2.551
+    assert IRC6_2017.cl_206_5_railing_load() == 1.472
+    assert IRC6_2017.cl_206_2_kerb_load(600) == {'vertical_kN_m2': 3.924, 'lateral_kN_m': 7.357}
+    assert IRC6_2017.cl_206_2_kerb_load(500)['vertical_kN_m2'] == 0.0
+
+
+def test_lever_rule_shares():
+    shares = lever_rule(GIRDERS, [0.0, 1.5, 2.75, 9.5])
+    np.testing.assert_allclose(shares.sum(axis=-1), 1.0)
+    np.testing.assert_allclose(shares[1], [1.0, 0.0, 0.0, 0.0])
+    np.testing.assert_allclose(shares[2], [0.5, 0.5, 0.0, 0.0])
+    # Cantilever beyond the outer girders: the outer one carries more than the load
+    assert shares[0, 0] > 1.0 > 0.0 > shares[0, 1]
+    assert shares[3, 3] == pytest.approx(1.5)
+    np.testing.assert_allclose(lever_rule([5.0], [0.0, 9.0]), 1.0)
+
+
+def test_barrier_outline():
+    rigid = barrier_outline('Rigid', KEY_FOOTPATH[0])
+    assert rigid['barrier_width'] == pytest.approx(0.45) and rigid['railing_width'] == 0.0
+    assert rigid['barrier_weight'] > barrier_outline('Semi-Rigid', KEY_FOOTPATH[0])['barrier_weight'] > 0.0
+    assert barrier_outline('Rigid', KEY_FOOTPATH[1])['railing_width'] > 0.0
+    with pytest.raises(ValueError):
+        barrier_outline('Flexible', KEY_FOOTPATH[0])
+
+
+def test_line_loads_match_hand_calculation():
+    # Left: railing, 1.5 m footway, rigid barrier; right: rigid barrier and a 750 mm kerb
+    out = superimposed_loads(20.0, 10.0, GIRDERS, [0.5], barrier_type='Rigid', footpath_width=(1.5, 0.0),
+                             safety_kerb_width=(0.0, 750.0))
+    with_fp, without_fp = barrier_outline('Rigid', KEY_FOOTPATH[1]), barrier_outline('Rigid', KEY_FOOTPATH[0])
+    carriageway = 10.0 - (with_fp['railing_width'] + 1.5 + with_fp['barrier_width']) \
+        - (without_fp['barrier_width'] + 0.75)
+    loads = {case: value.sum() for case, value in out['line_loads'].items()}
+    assert loads['wearing_coat'] == pytest.approx(0.065 * 2.2 * g * carriageway)
+    assert loads['barrier'] == pytest.approx(with_fp['barrier_weight'] + without_fp['barrier_weight'])
+    assert loads['footway'] == pytest.approx(3.379 * 1.5)
+    assert loads['kerb'] == pytest.approx(3.379 * 0.75)
+    assert loads['railing_load'] == pytest.approx(1.472)
+    assert out['kerb_lateral'] == 7.357
+
+    # Dead loads over the whole span: midspan moment w L^2 / 8 on every girder
+    np.testing.assert_allclose(out['effects']['wearing_coat']['max'][..., 0],
+                               out['line_loads']['wearing_coat'] * 20.0 ** 2 / 8.0)
+    assert np.all(out['live']['max'] >= out['live']['min'])
+
+
+def test_batched_decks_and_invalid_input():
+    out = superimposed_loads([15.0, 25.0], [10.0, 12.0], GIRDERS, [0.25, 0.5], effect='shear',
+                             footpath_width=([1.5, 2.0], [0.0, 1.5]))
+    assert out['dead']['max'].shape == (2, 4, 2)
+    np.testing.assert_array_equal(out['effects']['barrier']['max'], out['effects']['barrier']['min'])
+    with pytest.raises(ValueError):
+        superimposed_loads(20.0, 10.0, [4.0, 1.5], [0.5])
+    with pytest.raises(ValueError):
+        superimposed_loads(20.0, 10.0, GIRDERS, [0.5], wearing_coat='gravel')
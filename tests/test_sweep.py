@@ -0,0 +1,72 @@
+import numpy as np
+import pytest
+
+from sweep import grid_points, main, merge_shards, run_shard, shard_range
+
+GRID = {'span': [10.0, 20.0, 30.0], 'lanes': [1, 2]}
+
+
+def _area(span, lanes):
+    return {'area': span * lanes, 'half': span / 2.0}
+
+
+def test_shard_ranges_are_contiguous_and_balanced():
+    ranges = [shard_range(10, k, 4) for k in range(4)]
+    assert ranges == [(0, 2), (2, 5), (5, 7), (7, 10)]
+    with pytest.raises(ValueError):
+        shard_range(10, 4, 4)
+
+
+def test_grid_points_in_mixed_radix_order():
+    points = grid_points(GRID, [0, 1, 5])
+    assert points['span'].tolist() == [10.0, 10.0, 30.0]
+    assert points['lanes'].tolist() == [1, 2, 2]
+
+
+@pytest.mark.parametrize('vectorized', [False, True])
+def test_merged_shards_match_the_full_grid(tmp_path, vectorized):
+    for k in range(4):
+        run_shard(GRID, _area, k, 4, str(tmp_path), vectorized=vectorized)
+    merged = merge_shards(GRID, 4, str(tmp_path), output=str(tmp_path / 'merged.npz'))
+    np.testing.assert_allclose(merged['area'], [10.0, 20.0, 20.0, 40.0, 30.0, 60.0])
+    with np.load(tmp_path / 'merged.npz') as data:
+        np.testing.assert_allclose(data['half'], merged['half'])
+
+
+def test_empty_shards_do_not_drop_result_columns(tmp_path):
+    # 6 points on 8 shards: shards 0 and 4 are empty, the first one included
+    for k in range(8):
+        run_shard(GRID, _area, k, 8, str(tmp_path))
+    merged = merge_shards(GRID, 8, str(tmp_path))
+    np.testing.assert_allclose(merged['area'], [10.0, 20.0, 20.0, 40.0, 30.0, 60.0])
+
+
+def test_merge_rejects_missing_and_inconsistent_shards(tmp_path):
+    run_shard(GRID, _area, 0, 2, str(tmp_path))
+    with pytest.raises(ValueError, match='Missing'):
+        merge_shards(GRID, 2, str(tmp_path))
+    run_shard(GRID, lambda span, lanes: span, 1, 2, str(tmp_path))
+    with pytest.raises(ValueError, match='disagree'):
+        merge_shards(GRID, 2, str(tmp_path))
+    with pytest.raises(ValueError, match='different grid'):
+        merge_shards({'span': [10.0], 'lanes': [1, 2, 3]}, 2, str(tmp_path))
+
+
+def test_existing_shards_are_kept_unless_overwritten(tmp_path):
+    path = run_shard(GRID, _area, 0, 1, str(tmp_path))
+    assert run_shard(GRID, lambda span, lanes: 0.0, 0, 1, str(tmp_path)) == path
+    assert 'area' in merge_shards(GRID, 1, str(tmp_path))
+    run_shard(GRID, lambda span, lanes: 0.0, 0, 1, str(tmp_path), overwrite=True)
+    assert 'value' in merge_shards(GRID, 1, str(tmp_path))
+    assert not list(tmp_path.glob('*.tmp'))
+
+
+def test_command_line_runs_and_merges(tmp_path, capsys):
+    grid_file = tmp_path / 'grid.json'
+    grid_file.write_text('{"span": [10.0, 20.0], "lanes": [1, 2]}')
+    out_dir = str(tmp_path / 'runs')
+    for k in range(2):
+        main([str(grid_file), 'tests.test_sweep:_area', '--shard-index', str(k), '--shard-count', '2',
+              '--out-dir', out_dir])
+    main([str(grid_file), '--merge', '--shard-count', '2', '--out-dir', out_dir])
+    assert "Merged 4 points from 2 shards" in capsys.readouterr().out
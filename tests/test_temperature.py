@@ -0,0 +1,88 @@
+import numpy as np
+import pytest
+
+from temperature import effective_bridge_temperature, read_climate_chunks, site_temperature_statistics
+
+CSV = """date,site,tmax,tmin
+1,Delhi,45.0,20.0
+2,Delhi,30.0,15.0
+3,Shimla,,2.0
+4,Shimla,18.0,-4.0
+
+5,Shimla,n/a,1.0
+6,Delhi,35.0,28.0
+7,Shimla,12.0,-6.0
+"""
+
+
+@pytest.fixture
+def climate_csv(tmp_path):
+    path = tmp_path / 'climate.csv'
+    path.write_text(CSV)
+    return str(path)
+
+
+def test_table_15_adjustment():
+    out = effective_bridge_temperature([45.0, 30.0], [20.0, 15.0])
+    np.testing.assert_allclose(out['mean'], [32.5, 22.5])
+    np.testing.assert_allclose(out['adjustment'], [10.0, 5.0])
+    np.testing.assert_allclose(out['max'], [42.5, 27.5])
+    np.testing.assert_allclose(out['min'], [22.5, 17.5])
+
+
+@pytest.mark.parametrize('chunk_rows', [1, 3, 100])
+def test_chunks_skip_blank_and_non_numeric_rows(climate_csv, chunk_rows):
+    chunks = list(read_climate_chunks(climate_csv, chunk_rows=chunk_rows))
+    assert all(len(sites) <= chunk_rows for sites, _, _ in chunks)
+    sites = np.concatenate([c[0] for c in chunks])
+    highs = np.concatenate([c[1] for c in chunks])
+    lows = np.concatenate([c[2] for c in chunks])
+    assert sites.tolist() == ['Delhi', 'Delhi', 'Shimla', 'Delhi', 'Shimla']
+    np.testing.assert_allclose(highs, [45.0, 30.0, 18.0, 35.0, 12.0])
+    np.testing.assert_allclose(lows, [20.0, 15.0, -4.0, 28.0, -6.0])
+
+
+@pytest.mark.parametrize('chunk_rows', [1, 4, 100])
+def test_chunks_skip_ragged_rows_and_keep_hashes(tmp_path, chunk_rows):
+    path = tmp_path / 'ragged.csv'
+    path.write_text("date,site,tmax,tmin\n"
+                    "1,Site #1,40.0,20.0\n"
+                    "2,Delhi,30.0\n"
+                    "3,Delhi,31.0,16.0,extra\n"
+                    "4,Delhi,n/a,15.0\n"
+                    "5,Delhi,32.0,17.0\n")
+    skipped = {}
+    chunks = list(read_climate_chunks(str(path), chunk_rows=chunk_rows, skipped=skipped))
+    assert np.concatenate([c[0] for c in chunks]).tolist() == ['Site #1', 'Delhi']
+    np.testing.assert_allclose(np.concatenate([c[1] for c in chunks]), [40.0, 32.0])
+    np.testing.assert_allclose(np.concatenate([c[2] for c in chunks]), [20.0, 17.0])
+    assert skipped == {'malformed': 2, 'invalid': 1}
+    counts = {}
+    assert site_temperature_statistics(str(path), skipped=counts)['Delhi']['days'] == 1
+    assert counts == skipped
+
+
+def test_missing_column_raises(climate_csv):
+    with pytest.raises(ValueError):
+        next(read_climate_chunks(climate_csv, max_column='t_high'))
+
+
+def test_site_statistics_are_independent_of_chunking(climate_csv):
+    whole = site_temperature_statistics(climate_csv, expansion_length=50.0, thermal_coefficient=1.2e-5)
+    streamed = site_temperature_statistics(climate_csv, expansion_length=50.0, thermal_coefficient=1.2e-5,
+                                           chunk_rows=2)
+    assert whole == streamed
+    delhi = whole['Delhi']
+    assert delhi['days'] == 3
+    assert delhi['max_effective'] == pytest.approx(42.5)
+    assert delhi['min_effective'] == pytest.approx(17.5)
+    assert delhi['mean_effective'] == pytest.approx((32.5 + 22.5 + 31.5) / 3.0)
+    assert delhi['total_movement'] == pytest.approx(1.2e-5 * 50.0 * 25.0)
+    assert delhi['expansion'] == pytest.approx(delhi['contraction'])
+    assert whole['Shimla']['days'] == 2
+
+
+def test_site_statistics_with_installation_temperature(climate_csv):
+    stats = site_temperature_statistics(climate_csv, installation_temperature=20.0, thermal_coefficient=1e-5)
+    assert stats['Delhi']['expansion'] == pytest.approx(1e-5 * 22.5)
+    assert stats['Delhi']['contraction'] == pytest.approx(1e-5 * 2.5)
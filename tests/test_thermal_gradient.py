@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+
+from thermal_gradient import gradient_stresses, layered_section, polygon_section, positive_profile, reverse_profile
+
+
+def _t_outline(flange=3.0, tf=0.25, web=0.5, depth=1.5):
+    return [(-flange / 2, 0.0), (flange / 2, 0.0), (flange / 2, tf), (web / 2, tf), (web / 2, depth),
+            (-web / 2, depth), (-web / 2, tf), (-flange / 2, tf)]
+
+
+def test_polygon_and_layered_sections_agree():
+    layered = layered_section([0.25, 1.25], [3.0, 0.5], n_fibres=300)
+    polygon = polygon_section(_t_outline(), n_fibres=300)
+    assert polygon['depth'] == pytest.approx(1.5)
+    assert polygon['area'].sum() == pytest.approx(3.0 * 0.25 + 0.5 * 1.25, rel=1e-3)
+    np.testing.assert_allclose(polygon['area'], layered['area'], atol=1e-12)
+
+
+def test_polygon_holes_follow_the_even_odd_rule():
+    box = [(0, 0), (4, 0), (4, 2), (0, 2), (0, 0), (1, 0.5), (1, 1.5), (3, 1.5), (3, 0.5), (1, 0.5)]
+    section = polygon_section(box, n_fibres=400)
+    assert section['area'].sum() == pytest.approx(8.0 - 2.0, rel=1e-3)
+
+
+def test_batched_layered_sections():
+    sections = layered_section([[0.2, 0.8], [0.3, 1.2]], [[2.0, 0.4], [2.5, 0.5]], n_fibres=50)
+    np.testing.assert_allclose(sections['depth'], [1.0, 1.5])
+    np.testing.assert_allclose(sections['area'].sum(axis=-1), [0.4 + 0.32, 0.75 + 0.6])
+
+
+def test_design_profiles_of_fig_10():
+    h = 1.5
+    y = np.array([0.0, 0.15, 0.40, 0.75, h])
+    np.testing.assert_allclose(positive_profile(y, h), [17.8, 4.0, 0.0, 0.0, 2.1])
+    y = np.array([0.0, 0.25, 0.75, h - 0.25, h])
+    np.testing.assert_allclose(reverse_profile(y, h), [-10.6, -0.7, 0.0, -0.8, -6.6])
+
+
+def test_linear_profile_locks_in_no_stress():
+    section = layered_section([0.25, 1.25], [3.0, 0.5], n_fibres=200)
+    temperature = 5.0 + 10.0 * section['y']
+    out = gradient_stresses(section, temperature, 30e9, thermal_coefficient=1e-5)
+    np.testing.assert_allclose(out['self_equilibrating'], 0.0, atol=1e-3)
+    assert out['curvature'] == pytest.approx(1e-4)
+    fixed = gradient_stresses(section, temperature, 30e9, curvature_restraint=1.0, axial_restraint=1.0,
+                              thermal_coefficient=1e-5)
+    np.testing.assert_allclose(fixed['total'], -0.5 * 30e9 * 1e-5 * temperature, rtol=1e-9)
+
+
+def test_self_equilibrating_stresses_have_no_resultant():
+    section = polygon_section(_t_outline(), n_fibres=200)
+    temperature = np.stack([positive_profile(section['y'], section['depth']),
+                            reverse_profile(section['y'], section['depth'])])
+    out = gradient_stresses({'y': section['y'][None], 'area': section['area'][None]}, temperature, 30e9,
+                            curvature_restraint=1.5)
+    stress, area, y = out['self_equilibrating'], section['area'], section['y']
+    np.testing.assert_allclose((stress * area).sum(axis=-1), 0.0, atol=1e-3)
+    np.testing.assert_allclose((stress * area * y).sum(axis=-1), 0.0, atol=1e-3)
+    arm = y - (area * y).sum() / area.sum()
+    np.testing.assert_allclose(-(out['continuity'] * area * arm).sum(axis=-1), out['restraint_moment'], rtol=1e-9)
+    assert out['curvature'][0] < 0.0 < out['curvature'][1]
@@ -0,0 +1,102 @@
+import json
+
+import numpy as np
+import pytest
+
+from common import g, kN
+from irc6_2017 import IRC6_2017
+from vehicle_registry import TRACK_SEGMENTS, VehicleRegistry, compile_vehicle, default_registry
+
+TRUCK = {'kind': 'wheeled', 'load_unit': 'tonne', 'front_gap': 0.5, 'axle_loads': [5.0, 10.0],
+         'axle_spacing': [3.0], 'wheel_z': [-0.9, 0.9], 'spacing': 12.0}
+
+
+@pytest.mark.parametrize('name, function', [('ClassA', IRC6_2017.cl_204_1_ClassA_vehicle),
+                                            ('Class70R', IRC6_2017.cl_204_1_Class70R_vehicle_wheel),
+                                            ('SpecialVehicle', IRC6_2017.cl_204_5_1_special_vehicle)])
+def test_registry_vehicles_equal_the_clause_functions(name, function):
+    compiled = default_registry().vehicle(name)
+    expected = function()
+    for key in ('x', 'z', 'wheel_loads'):
+        np.testing.assert_allclose(compiled[key], expected[key], err_msg=key)
+    spacing = f'spacing_{name}'
+    assert compiled.get(spacing) == expected.get(spacing)
+    if 'length' in expected:
+        assert compiled['length'] == pytest.approx(expected['length'])
+
+
+@pytest.mark.parametrize('name, x, loads', [
+    ('ClassB', [0.6, 1.7, 4.9, 6.1, 10.4, 13.4, 16.4, 19.4], [1.6, 1.6, 6.8, 6.8, 4.1, 4.1, 4.1, 4.1]),
+    ('ClassAA_W', [0.0, 1.2], [20.0, 20.0]),
+    ('Fatigue', [0.0, 4.5, 5.9], [12.0, 14.0, 14.0]),
+])
+def test_registry_vehicles_without_clause_functions_use_the_same_units(name, x, loads):
+    compiled = default_registry().vehicle(name)
+    np.testing.assert_allclose(compiled['x'], x)
+    np.testing.assert_allclose(compiled['wheel_loads'], np.array(loads) * kN)
+
+
+def test_tracked_class_aa_carries_70_tonnes():
+    compiled = default_registry().get('ClassAA_T')
+    assert compiled.axle_loads.sum() == pytest.approx(70.0 * kN)
+    assert compiled.length == pytest.approx(3.6)
+
+
+def test_kn_loads_compile_to_the_tonne_convention():
+    in_kn = compile_vehicle('Truck', dict(TRUCK, load_unit='kN', axle_loads=[5.0 * g, 10.0 * g]))
+    np.testing.assert_allclose(in_kn.axle_loads, compile_vehicle('Truck', TRUCK).axle_loads)
+    in_tonne_g = compile_vehicle('Truck', dict(TRUCK, load_unit='tonne_g'))
+    np.testing.assert_allclose(in_tonne_g.axle_loads, [5.0 * g, 10.0 * g])
+
+
+def test_compiled_wheeled_vehicle():
+    truck = compile_vehicle('Truck', TRUCK)
+    np.testing.assert_allclose(truck.x, [0.5, 3.5])
+    np.testing.assert_allclose(truck.axle_loads, [5.0 * kN, 10.0 * kN])
+    assert truck.length == 3.5 and truck.vehicle['spacing_Truck'] == 12.0
+    assert np.isnan(truck.contact_area).all()
+    with pytest.raises(ValueError):
+        truck.x[0] = 0.0
+
+
+def test_compiled_tracked_vehicle_spreads_the_track_load():
+    tank = compile_vehicle('Tank', {'kind': 'tracked', 'load_unit': 'tonne', 'track_length': 4.57,
+                                    'track_load': 70.0, 'wheel_z': [-1.0, 1.0]})
+    assert tank.x.size == TRACK_SEGMENTS and tank.x.max() < 4.57
+    assert tank.axle_loads.sum() == pytest.approx(70.0 * kN)
+    assert tank.vehicle['wheel_loads_udl'] == pytest.approx(70.0 * kN / 4.57)
+    assert np.isnan(tank.spacing)
+
+
+@pytest.mark.parametrize('change', [
+    {'kind': 'hover'},
+    {'load_unit': 'lb'},
+    {'axle_loads': [5.0, 'ten']},
+    {'axle_spacing': [3.0, 1.0]},
+    {'axle_loads': [5.0, -1.0]},
+    {'wheel_z': []},
+    {'contact_area': [[200, 300]]},
+])
+def test_invalid_definitions_are_rejected(change):
+    with pytest.raises(ValueError):
+        compile_vehicle('Truck', dict(TRUCK, **change))
+
+
+def test_json_files_load_whole_or_not_at_all(tmp_path):
+    good = tmp_path / 'good.json'
+    good.write_text(json.dumps({'Truck': TRUCK}))
+    bad = tmp_path / 'bad.json'
+    bad.write_text(json.dumps({'Van': TRUCK, 'Broken': dict(TRUCK, axle_spacing=[])}))
+
+    registry = VehicleRegistry([str(good)])
+    assert registry.names() == ['Truck'] and 'Truck' in registry
+    with pytest.raises(ValueError, match='Broken'):
+        registry.load(str(bad))
+    assert len(registry) == 1
+    with pytest.raises(ValueError, match='already registered'):
+        registry.load(str(good))
+    assert registry.load(str(good), replace=True) == ['Truck']
+    with pytest.raises(KeyError):
+        registry.get('Van')
+    with pytest.raises(ValueError):
+        registry.load(str(tmp_path / 'vehicles.yaml'))
@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from irc6_2017 import IRC6_2017
+from vehicle_arrays import axle_arrays
+from wheel_dispersion import alpha, dispersed_wheel_loads, merge_overlaps
+
+
+def test_alpha_interpolates_and_clamps():
+    assert alpha(5.0, 10.0) == pytest.approx(1.72)
+    assert alpha(4.5, 10.0, 'continuous') == pytest.approx((1.44 + 1.68) / 2.0)
+    assert alpha(50.0, 10.0) == pytest.approx(3.00)
+    with pytest.raises(ValueError):
+        alpha(5.0, 10.0, 'fixed')
+
+
+def test_merge_overlaps_groups_adjacent_widths():
+    left = np.array([0.0, 1.0, 5.0])
+    right = np.array([2.0, 3.0, 6.0])
+    merged_left, merged_right, merged_load = merge_overlaps(left, right, [10.0, 20.0, 5.0])
+    np.testing.assert_allclose(merged_left, [0.0, 0.0, 5.0])
+    np.testing.assert_allclose(merged_right, [3.0, 3.0, 6.0])
+    np.testing.assert_allclose(merged_load, [30.0, 30.0, 5.0])
+
+
+def test_merge_overlaps_batches_rows_independently():
+    left = np.array([[0.0, 1.0], [0.0, 3.0]])
+    right = np.array([[2.0, 3.0], [2.0, 4.0]])
+    _, merged_right, merged_load = merge_overlaps(left, right, 1.0)
+    np.testing.assert_allclose(merged_right, [[3.0, 3.0], [2.0, 4.0]])
+    np.testing.assert_allclose(merged_load, [[2.0, 2.0], [1.0, 1.0]])
+
+
+def test_wheels_merge_at_midspan_and_stay_apart_at_support():
+    vehicle = IRC6_2017.cl_204_1_ClassA_vehicle()
+    ax, ax_loads = axle_arrays(vehicle)
+    # first axle on the support, then the heavy axle at midspan
+    out = dispersed_wheel_loads(vehicle, 10.0, 7.5, [-ax[0], 5.0 - ax[2]], [0.3, 0.5], 0.065,
+                                contact_length=0.25, contact_width=0.5)
+    assert out['intensity'].shape == (2, 2, ax.size, 2)
+    np.testing.assert_allclose(out['merged_width'][0, 0], 0.5 + 2.0 * 0.065)
+    np.testing.assert_allclose(out['merged_load'][0, 0], ax_loads[0] / 2.0)
+    np.testing.assert_allclose(out['merged_width'][1, 2], 7.5)
+    np.testing.assert_allclose(out['merged_load'][1, 2], ax_loads[2])
+    off = ~out['on_span']
+    assert np.all(out['merged_width'][off] == 0.0) and np.all(out['intensity'][:, off] == 0.0)
+    np.testing.assert_allclose(out['dispersed_length'][1] - out['dispersed_length'][0], 0.4)
+
+
+def test_dispersed_loads_reject_unknown_wearing_coat():
+    vehicle = IRC6_2017.cl_204_1_ClassA_vehicle()
+    with pytest.raises(ValueError):
+        dispersed_wheel_loads(vehicle, 10.0, 7.5, [0.0], [0.3], 0.065, wearing_coat='gravel')
@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+from wind import drag_coefficient, table_12, transverse_wind_load
+
+
+def test_table_12_interpolates_scales_and_clamps():
+    out = table_12([5.0, 10.0, 25.0, 150.0], 'plain', 33)
+    np.testing.assert_allclose(out['Pz'], [463.70, 463.70, (550.60 + 590.20) / 2.0, 747.00])
+    scaled = table_12(25.0, 'obstructed', 44)
+    assert scaled['Vz'] == pytest.approx((21.00 + 22.80) / 2.0 * 44 / 33)
+    assert scaled['Pz'] == pytest.approx((265.30 + 312.20) / 2.0 * (44 / 33) ** 2)
+    with pytest.raises(ValueError):
+        table_12(10.0, 'coastal')
+
+
+def test_drag_coefficient_cases():
+    CD, valid = drag_coefficient(['plate', 'plate', 'plate', 'rolled', 'rolled', 'rolled'],
+                                 [1, 3, 3, 1, 1, 2],
+                                 [1.0, 1.0, 0.1, 0.5, 0.5, 0.5],
+                                 c_spacing=[np.nan, 2.0, 10.0, np.nan, np.nan, 3.0],
+                                 b_width=[np.nan, np.nan, np.nan, 1.0, 2.0, 1.5])
+    np.testing.assert_allclose(CD, [2.2, 2.2, 4.0, 1.5, 1.4, 1.5 * 1.45])
+    assert valid.all()
+
+
+def test_drag_coefficient_undefined_beyond_c_over_d_7():
+    CD, valid = drag_coefficient('rolled', 3, 0.5, c_spacing=4.0, b_width=1.0)
+    assert np.isnan(CD) and not valid
+    with pytest.raises(ValueError):
+        drag_coefficient('box', 1, 1.0)
+
+
+def test_transverse_wind_load_gathers_repeated_heights():
+    heights = np.array([[12.0, 30.0], [12.0, 45.0]])
+    out = transverse_wind_load(2.5, heights, 'plate', 4, 1.2, c_spacing=2.5)
+    Pz = table_12(heights)['Pz']
+    CD, _ = drag_coefficient('plate', 4, 1.2, c_spacing=2.5)
+    np.testing.assert_allclose(out['Pz'], Pz)
+    np.testing.assert_allclose(out['FT'], Pz * 2.5 * 2.0 * CD)
+    assert out['FT'].shape == heights.shape and out['valid'].all()
+
+
+def test_transverse_wind_load_clamps_negative_exposed_height():
+    out = transverse_wind_load(-1.0, 10.0, 'plate', 1, 1.0)
+    assert out['A1'] == 0.0 and out['FT'] == 0.0
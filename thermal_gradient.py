@@ -0,0 +1,196 @@
+"""
+Stresses from vertical temperature differences across deck cross-sections
+(IRC:6-2017 Clause 215.3, Fig. 10), vectorized over many sections and profiles.
+
+A cross-section is cut into horizontal fibres, from a polygon outline or from a
+stack of layers. A temperature profile T(y) over the depth would strain each
+fibre by alpha T; the plane-section part of that strain is free to develop and
+the remainder is locked in as self-equilibrating stress. Where the deck is
+continuous, the restrained part of the free curvature (and axial strain) adds
+continuity stresses.
+
+Depths y are measured down from the top of the section; tension is positive.
+"""
+
+import numpy as np
+from common import *
+from irc6_2017 import IRC6_2017
+
+
+def layered_section(thicknesses, widths, n_fibres=100):
+    """
+    Fibres of a section made of rectangular layers, top down.
+
+    Args:
+        thicknesses, widths (array): layer thickness and width (m), (..., n_layers);
+            a batch of sections with the same number of layers is cut in one call
+        n_fibres (int): fibres per section, of equal thickness
+
+    Returns:
+        dict: {'depth': total depth h (...), 'y': fibre mid-depths (..., n_fibres),
+               'area': fibre areas (..., n_fibres)}
+    """
+    thicknesses = np.asarray(thicknesses, dtype=float)
+    widths = np.broadcast_to(np.asarray(widths, dtype=float), thicknesses.shape)
+    bottoms = np.cumsum(thicknesses, axis=-1)
+    depth = bottoms[..., -1]
+
+    dy = depth / n_fibres
+    y = (np.arange(n_fibres) + 0.5) * dy[..., None]
+    layer = np.minimum(np.sum(y[..., :, None] >= bottoms[..., None, :], axis=-1), thicknesses.shape[-1] - 1)
+    width = np.take_along_axis(widths, layer, -1)
+    return {'depth': depth, 'y': y, 'area': width * dy[..., None]}
+
+
+def polygon_section(vertices, n_fibres=100):
+    """
+    Fibres of a section given by its outline.
+
+    Args:
+        vertices (array): outline (z, y) in m with y downwards, (n_vertices, 2) or
+            (n_sections, n_vertices, 2); holes may be traced as part of the
+            outline (even-odd rule)
+        n_fibres (int): fibres per section, of equal thickness
+
+    Returns:
+        dict: see `layered_section`, with 'depth' measured from the highest vertex
+    """
+    vertices = np.asarray(vertices, dtype=float)
+    z, y_v = vertices[..., 0], vertices[..., 1]
+    top = y_v.min(axis=-1)
+    y_v = y_v - top[..., None]
+    depth = y_v.max(axis=-1)
+
+    dy = depth / n_fibres
+    y = (np.arange(n_fibres) + 0.5) * dy[..., None]
+
+    # Crossings of every fibre line with every edge, NaN where the edge is missed
+    z0, y0 = z[..., None, :], y_v[..., None, :]
+    z1, y1 = np.roll(z, -1, -1)[..., None, :], np.roll(y_v, -1, -1)[..., None, :]
+    yq = y[..., :, None]
+    crosses = (y0 <= yq) != (y1 <= yq)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        zc = np.where(crosses, z0 + (yq - y0) * (z1 - z0) / (y1 - y0), np.nan)
+    zc = np.sort(zc, axis=-1)  # NaNs sort last
+    # Even-odd rule: width is the sum of (z[1] - z[0]) + (z[3] - z[2]) + ...
+    n_pairs = zc.shape[-1] // 2
+    pairs = zc[..., :2 * n_pairs].reshape(zc.shape[:-1] + (n_pairs, 2))
+    width = np.nansum(pairs[..., 1] - pairs[..., 0], axis=-1)
+    return {'depth': depth, 'y': y, 'area': width * dy[..., None]}
+
+
+def positive_profile(y, depth, surfacing=0.05):
+    """
+    Positive (heating) temperature difference of Fig. 10(a): T1 at the top falling
+    to T2 at h1 and to zero at h1 + h2, and T3 at the bottom falling to zero at h3
+    above it, with h1 = 0.3h <= 0.15 m, h2 = 0.3h between 0.10 m and 0.25 m and
+    h3 = 0.3h <= 0.10 m + surfacing depth.
+
+    Args:
+        y (array): depths below the top (m), (..., n)
+        depth (float or array): section depth h (m), (...)
+        surfacing (float): surfacing depth (m)
+
+    Returns:
+        array: temperature differences in °C, (..., n)
+    """
+    T1, T2, T3 = KEY_POSITIVE_TEMPERATURE_DIFFERENCE
+    y = np.asarray(y, dtype=float)
+    h = np.asarray(depth, dtype=float)[..., None]
+    h1 = np.minimum(0.3 * h, 0.15)
+    h2 = np.clip(0.3 * h, 0.10, 0.25)
+    h3 = np.minimum(0.3 * h, 0.10 + surfacing)
+
+    top = np.where(y <= h1, T1 + (T2 - T1) * y / h1, T2 * np.clip(1.0 - (y - h1) / h2, 0.0, 1.0))
+    bottom = T3 * np.clip(1.0 - (h - y) / h3, 0.0, 1.0)
+    return top + bottom
+
+
+def reverse_profile(y, depth):
+    """
+    Reverse (cooling) temperature difference of Fig. 10(b), negative throughout:
+    -T1 at the top to -T2 at h1 and zero at h1 + h2, and -T4 at the bottom to -T3
+    at h4 above it and zero at h3 further up, with h1 = h4 = 0.2h <= 0.25 m and
+    h2 = h3 = 0.25h <= 0.20 m.
+
+    Args:
+        y (array): depths below the top (m), (..., n)
+        depth (float or array): section depth h (m), (...)
+
+    Returns:
+        array: temperature differences in °C, (..., n)
+    """
+    T1, T2, T3, T4 = KEY_REVERSE_TEMPERATURE_DIFFERENCE
+    y = np.asarray(y, dtype=float)
+    h = np.asarray(depth, dtype=float)[..., None]
+    h1 = np.minimum(0.2 * h, 0.25)
+    h2 = np.minimum(0.25 * h, 0.20)
+    up = h - y  # height above the bottom
+
+    top = np.where(y <= h1, T1 + (T2 - T1) * y / h1, T2 * np.clip(1.0 - (y - h1) / h2, 0.0, 1.0))
+    bottom = np.where(up <= h1, T4 + (T3 - T4) * up / h1, T3 * np.clip(1.0 - (up - h1) / h2, 0.0, 1.0))
+    return -(top + bottom)
+
+
+def gradient_stresses(section, temperature, elastic_modulus, curvature_restraint=0.0, axial_restraint=0.0,
+                      modulus_factor=KEY_TEMPERATURE_MODULUS_FACTOR, thermal_coefficient=None):
+    """
+    Self-equilibrating and continuity stresses of temperature profiles.
+
+    The fibre strain is split into a plane part eps0 + kappa (y - yc), with
+    eps0 = sum(alpha T dA) / A and kappa = sum(alpha T (y - yc) dA) / I, and the
+    locked-in remainder. A restraint r of the curvature (or axial strain) adds the
+    stress -r E kappa (y - yc) (or -r E eps0): r = 0 for a simply supported span,
+    1 for full fixity, 1.5 at the interior support of two equal continuous spans.
+
+    Args:
+        section (dict): fibres from `layered_section` or `polygon_section`,
+            'y' and 'area' of shape (..., n)
+        temperature (array): temperature differences at the fibres (°C), broadcast
+            against the fibres, e.g. (n_sections, n_profiles, n) with the section
+            arrays expanded by [:, None, :]
+        elastic_modulus (float or array): Ec of the section (same units as the stresses)
+        curvature_restraint, axial_restraint (float or array): restraint factors r
+        modulus_factor (float): multiplier on Ec for temperature stresses
+        thermal_coefficient (float, optional): defaults to IRC6_2017.cl_215_4_material_properties
+
+    Returns:
+        dict: {
+            'axial_strain': eps0, 'curvature': kappa (...),
+            'self_equilibrating': locked-in fibre stresses (..., n),
+            'continuity': fibre stresses from the restraint (..., n),
+            'total': sum of both,
+            'restraint_moment': r E I kappa, 'restraint_force': r E A eps0 (...)
+        }
+    """
+    if thermal_coefficient is None:
+        thermal_coefficient = IRC6_2017.cl_215_4_material_properties()
+    y = np.asarray(section['y'], dtype=float)
+    area = np.asarray(section['area'], dtype=float)
+    free = thermal_coefficient * np.asarray(temperature, dtype=float)
+    y, area, free = np.broadcast_arrays(y, area, free)
+    E = modulus_factor * np.asarray(elastic_modulus, dtype=float)
+
+    A = area.sum(axis=-1)
+    yc = (area * y).sum(axis=-1) / A
+    arm = y - yc[..., None]
+    I = (area * arm ** 2).sum(axis=-1)
+
+    eps0 = (free * area).sum(axis=-1) / A
+    kappa = (free * arm * area).sum(axis=-1) / I
+    Ef = np.asarray(E)[..., None] if np.ndim(E) else E
+
+    self_equilibrating = Ef * (eps0[..., None] + kappa[..., None] * arm - free)
+    r_k = np.asarray(curvature_restraint, dtype=float)
+    r_a = np.asarray(axial_restraint, dtype=float)
+    continuity = -Ef * ((r_k * kappa)[..., None] * arm + (r_a * eps0)[..., None])
+
+    return {
+        'axial_strain': eps0,
+        'curvature': kappa,
+        'self_equilibrating': self_equilibrating,
+        'continuity': continuity,
+        'total': self_equilibrating + continuity,
+        'restraint_moment': r_k * E * I * kappa,
+        'restraint_force': r_a * E * A * eps0,
+    }
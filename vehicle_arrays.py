@@ -0,0 +1,79 @@
+"""
+Array form of the vehicle dictionaries returned by the IRC 6:2017 vehicle functions.
+"""
+
+import numpy as np
+from common import *
+
+
+def axle_arrays(vehicle):
+    """
+    Converts a vehicle dictionary (e.g. from IRC6_2017.cl_204_1_ClassA_vehicle)
+    into NumPy arrays of axle positions and axle loads.
+
+    Args:
+        vehicle (dict): vehicle with 'x' (axle positions, m) and 'wheel_loads'
+            (one load per longitudinal position, in the units of the vehicle function)
+
+    Returns:
+        tuple: (x, loads) as float arrays of equal length
+
+    Raises:
+        ValueError: If the vehicle has no point loads or the lengths do not match
+    """
+    if 'wheel_loads' not in vehicle:
+        raise ValueError("Vehicle has no point loads (track vehicles carry 'wheel_loads_udl')")
+
+    x = np.asarray(vehicle['x'], dtype=float)
+    loads = np.asarray(vehicle['wheel_loads'], dtype=float)
+    if x.shape != loads.shape:
+        raise ValueError("Axle count and position count mismatch")
+    return x, loads
+
+
+def wheel_arrays(vehicle):
+    """
+    Expands a vehicle dictionary into one entry per wheel.
+
+    Each load in 'wheel_loads' is the load of one longitudinal position and is
+    shared equally between the transverse wheel positions in 'z'.
+
+    Args:
+        vehicle (dict): vehicle with 'x', 'z' and 'wheel_loads'
+
+    Returns:
+        tuple: (x, z, loads) as flat float arrays of length len(x) * len(z)
+    """
+    ax, ax_loads = axle_arrays(vehicle)
+    z = np.asarray(vehicle['z'], dtype=float)
+
+    wheel_x = np.repeat(ax, z.size)
+    wheel_z = np.tile(z, ax.size)
+    wheel_loads = np.repeat(ax_loads / z.size, z.size)
+    return wheel_x, wheel_z, wheel_loads
+
+
+def class_a_contact_area(vehicle):
+    """
+    Returns the tyre contact area of every wheel of a Class A vehicle as per
+    IRC:6-2017 Fig. 3 (B along the direction of travel, W across it).
+
+    Args:
+        vehicle (dict): vehicle from IRC6_2017.cl_204_1_ClassA_vehicle
+
+    Returns:
+        tuple: (B, W) float arrays in m, one entry per wheel (same order as wheel_arrays)
+    """
+    ax, ax_loads = axle_arrays(vehicle)
+    n_z = len(vehicle['z'])
+
+    # Axle loads are stored in kN-scaled tonnes (11.4 t -> 11.4 * kN)
+    axle_tonne = np.round(ax_loads / kN, 1)
+    B = np.zeros(ax.size)
+    W = np.zeros(ax.size)
+    for axle_load, (b, w) in KEY_CLASS_A_CONTACT_AREA.items():
+        match = np.isclose(axle_tonne, axle_load)
+        B[match] = b * mm
+        W[match] = w * mm
+
+    return np.repeat(B, n_z), np.repeat(W, n_z)
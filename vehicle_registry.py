@@ -0,0 +1,208 @@
+"""
+Vehicle library loaded from JSON or TOML data files.
+
+Each file maps vehicle names to definitions (see vehicles/irc6_2017.toml for the
+fields). Definitions are validated and compiled into array form once, when the
+file is loaded; `VehicleRegistry.get` is then a dictionary lookup. The compiled
+vehicle dictionary has the layout of the IRC6_2017 vehicle functions ('x', 'z',
+'wheel_loads', 'spacing_<name>') with read-only arrays, so it can be passed to
+`vehicle_arrays`, `moving_load`, `braking` and the other array modules.
+
+Loads are compiled to the units of the IRC6_2017 vehicle functions. The Clause
+204.1 and 204.6 vehicles give tonnes scaled by common.kN (11.4 t -> 11.4 * kN),
+so 'tonne' loads are scaled by kN and 'kN' loads by kN / g. The Clause 204.5.1
+special vehicle gives tonnes times g (18 t -> 176.58); 'tonne_g' loads follow it.
+"""
+
+import json
+import os
+from typing import NamedTuple
+
+import numpy as np
+from common import *
+
+KEY_VEHICLE_KIND = ['wheeled', 'tracked']
+KEY_LOAD_UNIT = {'tonne': kN, 'kN': kN / g, 'tonne_g': g}
+DEFAULT_VEHICLE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'vehicles', 'irc6_2017.toml')
+
+# Point loads per track used to represent a tracked vehicle
+TRACK_SEGMENTS = 20
+
+
+class CompiledVehicle(NamedTuple):
+    name: str
+    clause: str
+    kind: str
+    x: np.ndarray             # longitudinal load positions from the vehicle nose (m)
+    z: np.ndarray             # transverse wheel or track positions (m)
+    axle_loads: np.ndarray    # load per longitudinal position, all wheels together (kN)
+    spacing: float            # clear spacing to the next vehicle of a train (m), NaN if none
+    length: float             # overall length, nose to tail (m)
+    contact_area: np.ndarray  # (B, W) per longitudinal position (m), NaN where not given
+    vehicle: dict             # IRC6_2017 vehicle dictionary layout
+
+
+def _read_only(values):
+    array = np.array(values, dtype=float)
+    array.flags.writeable = False
+    return array
+
+
+def _numbers(definition, key, name, length=None):
+    values = definition.get(key)
+    if not isinstance(values, list) or not all(isinstance(v, (int, float)) and not isinstance(v, bool)
+                                                for v in values):
+        raise ValueError(f"Vehicle {name!r}: '{key}' must be a list of numbers")
+    if length is not None and len(values) != length:
+        raise ValueError(f"Vehicle {name!r}: '{key}' must have {length} entries, got {len(values)}")
+    return np.array(values, dtype=float)
+
+
+def _positive(definition, key, name, default=None):
+    value = definition.get(key, default)
+    if not isinstance(value, (int, float)) or isinstance(value, bool) or value <= 0:
+        raise ValueError(f"Vehicle {name!r}: '{key}' must be a positive number")
+    return float(value)
+
+
+def compile_vehicle(name, definition):
+    """
+    Validates one vehicle definition and compiles it into array form.
+
+    Raises:
+        ValueError: If a field is missing, has the wrong type or inconsistent lengths
+    """
+    kind = definition.get('kind', KEY_VEHICLE_KIND[0])
+    if kind not in KEY_VEHICLE_KIND:
+        raise ValueError(f"Vehicle {name!r}: kind must be one of {KEY_VEHICLE_KIND}")
+    unit = definition.get('load_unit', 'kN')
+    if unit not in KEY_LOAD_UNIT:
+        raise ValueError(f"Vehicle {name!r}: load_unit must be one of {list(KEY_LOAD_UNIT)}")
+    scale = KEY_LOAD_UNIT[unit]
+
+    z = _numbers(definition, 'wheel_z', name)
+    if z.size == 0:
+        raise ValueError(f"Vehicle {name!r}: 'wheel_z' must not be empty")
+
+    if kind == 'wheeled':
+        loads = _numbers(definition, 'axle_loads', name)
+        if loads.size == 0 or np.any(loads < 0):
+            raise ValueError(f"Vehicle {name!r}: 'axle_loads' must be non-empty and non-negative")
+        gaps = _numbers(definition, 'axle_spacing', name, loads.size - 1)
+        if np.any(gaps < 0):
+            raise ValueError(f"Vehicle {name!r}: 'axle_spacing' must be non-negative")
+        front_gap = float(definition.get('front_gap', 0.0))
+        x = front_gap + np.concatenate([[0.0], np.cumsum(gaps)])
+        loads = loads * scale
+        length = float(x[-1]) + float(definition.get('rear_gap', 0.0))
+    else:
+        track_length = _positive(definition, 'track_length', name)
+        track_load = _positive(definition, 'track_load', name)
+        # Each track is represented by equal point loads at segment midpoints
+        x = (np.arange(TRACK_SEGMENTS) + 0.5) * track_length / TRACK_SEGMENTS
+        loads = np.full(TRACK_SEGMENTS, track_load * scale / TRACK_SEGMENTS)
+        length = track_length
+
+    contact_area = np.full((x.size, 2), np.nan)
+    if 'contact_area' in definition:
+        area = np.array(definition['contact_area'], dtype=float)
+        if area.shape != (x.size, 2):
+            raise ValueError(f"Vehicle {name!r}: 'contact_area' must give (B, W) for every axle")
+        contact_area = area * mm
+
+    spacing = float(definition['spacing']) if 'spacing' in definition else np.nan
+
+    x, z, loads, contact_area = (_read_only(a) for a in (x, z, loads, contact_area))
+    vehicle = {'x': x, 'z': z, 'wheel_loads': loads, 'length': length}
+    if kind == 'tracked':
+        vehicle['track_length'] = length
+        vehicle['wheel_loads_udl'] = float(loads.sum() / length)
+    if not np.isnan(spacing):
+        vehicle[f'spacing_{name}'] = spacing
+
+    return CompiledVehicle(name, definition.get('clause', ''), kind, x, z, loads, spacing, length,
+                           contact_area, vehicle)
+
+
+def read_vehicle_file(path):
+    """Raw vehicle definitions of a .toml or .json file: name -> definition."""
+    if path.endswith('.toml'):
+        import tomllib  # Python 3.11+, only needed for TOML files
+        with open(path, 'rb') as f:
+            return tomllib.load(f)
+    if path.endswith('.json'):
+        with open(path) as f:
+            return json.load(f)
+    raise ValueError("Vehicle files must be .toml or .json")
+
+
+class VehicleRegistry:
+    """
+    Compiled vehicles by name.
+
+    Args:
+        paths (list of str, optional): vehicle files to load, in order
+    """
+
+    def __init__(self, paths=()):
+        self._vehicles = {}
+        for path in paths:
+            self.load(path)
+
+    def load(self, path, replace=False):
+        """
+        Validates and compiles every vehicle of a file. The file is added as a
+        whole or not at all.
+
+        Raises:
+            ValueError: If a definition is invalid or a name is already registered
+                and `replace` is False
+        """
+        compiled = {}
+        for name, definition in read_vehicle_file(path).items():
+            if not isinstance(definition, dict):
+                raise ValueError(f"{path}: vehicle {name!r} must be a table of fields")
+            if name in self._vehicles and not replace:
+                raise ValueError(f"{path}: vehicle {name!r} is already registered")
+            try:
+                compiled[name] = compile_vehicle(name, definition)
+            except (TypeError, ValueError) as e:
+                raise ValueError(f"{path}: {e}") from e
+        self._vehicles.update(compiled)
+        return list(compiled)
+
+    def get(self, name):
+        """
+        Compiled vehicle by name.
+
+        Raises:
+            KeyError: If the vehicle is not registered
+        """
+        try:
+            return self._vehicles[name]
+        except KeyError:
+            raise KeyError(f"Unknown vehicle {name!r}; registered: {sorted(self._vehicles)}") from None
+
+    def vehicle(self, name):
+        """Vehicle dictionary in the IRC6_2017 layout (shared, read-only arrays)."""
+        return self.get(name).vehicle
+
+    def names(self):
+        return list(self._vehicles)
+
+    def __contains__(self, name):
+        return name in self._vehicles
+
+    def __len__(self):
+        return len(self._vehicles)
+
+
+_default = None
+
+
+def default_registry():
+    """Registry of the IRC:6-2017 vehicles in vehicles/irc6_2017.toml, loaded once."""
+    global _default
+    if _default is None:
+        _default = VehicleRegistry([DEFAULT_VEHICLE_FILE])
+    return _default
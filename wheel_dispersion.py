@@ -0,0 +1,159 @@
+"""
+Dispersion of wheel loads through the wearing coat and slab, and effective width
+of one-way slabs under concentrated loads (IRC:112-2011 Annex B3).
+
+All wheels of a vehicle are treated as one (axle row x transverse wheel) grid and
+evaluated for many longitudinal placements and slab depths in one pass.
+Transverse positions z are measured from the deck centreline.
+"""
+
+import numpy as np
+from common import *
+from irc5_2015 import IRC5_2015
+from vehicle_arrays import axle_arrays
+
+
+def alpha(deck_width, span, support='simply_supported'):
+    """
+    Returns the effective width constant alpha for the ratio b / l0.
+
+    Args:
+        deck_width (float or array): width of the slab b (m)
+        span (float or array): effective span l0 (m)
+        support (str): 'simply_supported' or 'continuous'
+
+    Returns:
+        float or array: alpha, constant beyond the tabulated ratios
+    """
+    if support not in KEY_EFFECTIVE_WIDTH_ALPHA:
+        raise ValueError("support must be 'simply_supported' or 'continuous'")
+    ratio = np.asarray(deck_width, dtype=float) / np.asarray(span, dtype=float)
+    return np.interp(ratio, KEY_EFFECTIVE_WIDTH_B_L0, KEY_EFFECTIVE_WIDTH_ALPHA[support])
+
+
+def merge_overlaps(left, right, loads):
+    """
+    Merges overlapping effective widths along the last axis.
+
+    Intervals must be sorted by their left edge along the last axis. Where the
+    widths of adjacent wheels overlap, the combined width runs from the outer
+    edge of the first to the outer edge of the last and carries their total load.
+
+    Args:
+        left, right (array): interval edges, shape (..., n)
+        loads (array): load of each interval, broadcastable to (..., n)
+
+    Returns:
+        tuple: (merged_left, merged_right, merged_load) for every interval, each of
+            shape (..., n); members of one merged group share the same values
+    """
+    left, right = np.broadcast_arrays(np.asarray(left, dtype=float), np.asarray(right, dtype=float))
+    loads = np.broadcast_to(np.asarray(loads, dtype=float), left.shape)
+    n = left.shape[-1]
+    idx = np.broadcast_to(np.arange(n), left.shape)
+
+    reach = np.maximum.accumulate(right, axis=-1)
+    start = np.ones(left.shape, dtype=bool)
+    start[..., 1:] = left[..., 1:] > reach[..., :-1]
+    end = np.ones(left.shape, dtype=bool)
+    end[..., :-1] = start[..., 1:]
+
+    first = np.maximum.accumulate(np.where(start, idx, 0), axis=-1)
+    last = np.flip(np.minimum.accumulate(np.flip(np.where(end, idx, n - 1), -1), axis=-1), -1)
+
+    cum = np.cumsum(loads, axis=-1)
+    before = np.take_along_axis(cum, first, -1) - np.take_along_axis(loads, first, -1)
+    merged_load = np.take_along_axis(cum, last, -1) - before
+    merged_left = np.take_along_axis(left, first, -1)
+    merged_right = np.take_along_axis(reach, last, -1)
+    return merged_left, merged_right, merged_load
+
+
+def dispersed_wheel_loads(vehicle, span, deck_width, placements, slab_depths, wearing_coat_thickness,
+                          wearing_coat='bituminous', contact_length=0.0, contact_width=0.0,
+                          support='simply_supported', lane_offsets=(0.0,)):
+    """
+    Disperses every wheel load through the wearing coat and slab depth and
+    computes merged effective widths for all placements and slab depths at once.
+
+    Dispersion is taken at 45 degrees: across the span through the wearing coat
+    only (b1 = W + 2 t_wc), along the span through wearing coat and slab
+    (B + 2 (t_wc + d)). The effective width is b_ef = alpha a (1 - a / l0) + b1,
+    limited by the deck edges, and overlapping widths of wheels on the same axle
+    row are merged.
+
+    Args:
+        vehicle (dict): vehicle from the IRC6_2017 vehicle functions
+        span (float): effective span l0 (m)
+        deck_width (float): slab width b (m), edges at +-b/2
+        placements (array): positions of the vehicle origin along the span (m), (n_p,)
+        slab_depths (array): overall slab depths d (m), (n_d,)
+        wearing_coat_thickness (float): wearing coat thickness t_wc (m)
+        wearing_coat (str): wearing coat type, see IRC5_2015.cl_109_5_wearing_coat
+        contact_length, contact_width (float or array): tyre contact B and W (m),
+            scalar or one value per axle
+        support (str): 'simply_supported' or 'continuous'
+        lane_offsets (array): transverse positions of the vehicle centreline (m)
+
+    Returns:
+        dict: {
+            'x': axle positions on the span, (n_p, n_a),
+            'z': sorted transverse wheel positions, (n_w,),
+            'on_span': mask of axles on the span, (n_p, n_a),
+            'effective_width': b_ef of each wheel before merging, (n_p, n_a, n_w),
+            'merged_width': merged effective width, (n_p, n_a, n_w),
+            'merged_load': load carried by the merged width, (n_p, n_a, n_w),
+            'dispersed_length': length along the span, (n_d, n_a),
+            'intensity': merged load per unit area, (n_d, n_p, n_a, n_w)
+        }
+
+    Raises:
+        ValueError: If the wearing coat type is not recognised
+    """
+    if not IRC5_2015.cl_109_5_wearing_coat(wearing_coat):
+        raise ValueError(f"wearing_coat must be one of {KEY_WEARING_COAT}")
+
+    ax, ax_loads = axle_arrays(vehicle)
+    z_vehicle = np.asarray(vehicle['z'], dtype=float)
+    placements = np.atleast_1d(np.asarray(placements, dtype=float))
+    slab_depths = np.atleast_1d(np.asarray(slab_depths, dtype=float))
+    lane_offsets = np.atleast_1d(np.asarray(lane_offsets, dtype=float))
+    B = np.broadcast_to(np.asarray(contact_length, dtype=float), ax.shape)
+    W = np.broadcast_to(np.asarray(contact_width, dtype=float), ax.shape)
+
+    # Transverse wheel positions, sorted so that merging can run along the last axis
+    z = np.sort((lane_offsets[:, None] + z_vehicle[None, :]).ravel())
+    wheel_load = ax_loads / z_vehicle.size
+
+    # Axle positions and distance to the nearer support
+    x = placements[:, None] + ax[None, :]
+    on_span = (x >= 0.0) & (x <= span)
+    a = np.clip(np.minimum(x, span - x), 0.0, None)
+
+    b1 = W + 2.0 * wearing_coat_thickness
+    b_ef = alpha(deck_width, span, support) * a * (1.0 - a / span) + b1[None, :]
+    b_ef = np.where(on_span, b_ef, 0.0)
+
+    half_deck = deck_width / 2.0
+    left = np.clip(z[None, None, :] - b_ef[..., None] / 2.0, -half_deck, half_deck)
+    right = np.clip(z[None, None, :] + b_ef[..., None] / 2.0, -half_deck, half_deck)
+    loads = np.where(on_span, wheel_load[None, :], 0.0)[..., None]
+
+    merged_left, merged_right, merged_load = merge_overlaps(left, right, loads)
+    merged_width = merged_right - merged_left
+
+    dispersed_length = B[None, :] + 2.0 * (wearing_coat_thickness + slab_depths[:, None])
+    area = merged_width[None, ...] * dispersed_length[:, None, :, None]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        intensity = np.where(area > 0.0, merged_load[None, ...] / area, 0.0)
+
+    return {
+        'x': x,
+        'z': z,
+        'on_span': on_span,
+        'effective_width': np.broadcast_to(b_ef[..., None], merged_width.shape),
+        'merged_width': merged_width,
+        'merged_load': merged_load,
+        'dispersed_length': dispersed_length,
+        'intensity': intensity,
+    }
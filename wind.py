@@ -0,0 +1,229 @@
+"""
+Vectorized wind loads as per IRC:6-2017 Clause 209 for sweeps over many heights
+and girder configurations. Heights, wind speeds and girder dimensions may be
+`dual.Dual` numbers to get their derivatives along with the values.
+"""
+
+import numpy as np
+from common import *
+from dual import Dual, as_float
+
+
+# Table 12 for Vb = 33 m/s: height (m) -> hourly mean speed Vz (m/s), pressure Pz (N/m2)
+TABLE_12_HEIGHTS = np.array([10.0, 15.0, 20.0, 30.0, 50.0, 60.0, 70.0, 80.0, 100.0])
+TABLE_12 = {
+    'plain': (
+        np.array([27.80, 29.20, 30.30, 31.40, 33.10, 33.60, 34.00, 34.40, 35.30]),
+        np.array([463.70, 512.50, 550.60, 590.20, 659.20, 676.30, 693.60, 711.20, 747.00]),
+    ),
+    'obstructed': (
+        np.array([17.80, 19.60, 21.00, 22.80, 24.90, 25.60, 26.20, 26.90, 28.20]),
+        np.array([190.50, 230.50, 265.30, 312.20, 373.40, 392.90, 412.80, 433.30, 475.60]),
+    ),
+}
+
+
+def table_12(height, terrain='plain', basic_wind_speed=33):
+    """
+    Vectorized IRC:6-2017 Table 12: wind speed Vz and pressure Pz at any number of
+    heights, interpolated linearly and scaled to the basic wind speed.
+
+    Args:
+        height (float or array): height H in metres, constant below 10 m
+        terrain (str): "plain" or "obstructed"
+        basic_wind_speed (float or array): local basic wind speed Vb (m/s)
+
+    Returns:
+        dict: {"Vz": array, "Pz": array} broadcast over height and basic_wind_speed
+    """
+    if terrain not in KEY_TERRAIN:
+        raise ValueError("terrain must be 'plain' or 'obstructed'")
+
+    Vz_table, Pz_table = TABLE_12[terrain]
+    height = as_float(height)
+    scale = as_float(basic_wind_speed) / 33.0
+
+    Vz = np.interp(height, TABLE_12_HEIGHTS, Vz_table) * scale
+    Pz = np.interp(height, TABLE_12_HEIGHTS, Pz_table) * scale ** 2
+    return {"Vz": Vz, "Pz": Pz}
+
+
+def _single_rolled_drag(b_width, d_depth):
+    # 1.5 at b/d = 2 falling linearly to 1.3 at b/d >= 6
+    bd = b_width / d_depth
+    return np.where(bd >= 6.0, 1.3, 1.5 + (bd - 2.0) * (1.3 - 1.5) / (6.0 - 2.0))
+
+
+def drag_coefficient(girder_section, number_of_girders, d_depth, c_spacing=np.nan, b_width=np.nan):
+    """
+    Drag coefficient CD of the superstructure for arrays of girder configurations.
+
+    - plate girder, single: 2.2
+    - plate girders, n >= 2: 2 (1 + c / 20d), not more than 4.0
+    - rolled beam, single: 1.5 at b/d = 2 to 1.3 at b/d >= 6
+    - rolled beams, n >= 2: 1.5 x single beam value, only defined for c/d <= 7
+
+    Args:
+        girder_section (str or array): "plate" or "rolled"
+        number_of_girders (int or array)
+        d_depth (float or array): girder depth d (m)
+        c_spacing (float or array): centre-to-centre girder spacing c (m)
+        b_width (float or array): overall width b for rolled beams (m)
+
+    Returns:
+        tuple: (CD, valid) arrays; CD is NaN where `valid` is False
+
+    Raises:
+        ValueError: If a girder section is not "plate" or "rolled"
+    """
+    section = np.char.lower(np.asarray(girder_section, dtype=str))
+    if not np.all(np.isin(section, KEY_GIRDER_SECTION)):
+        raise ValueError("Invalid girder section input.")
+
+    section, n, d, c, b = np.broadcast_arrays(
+        section, np.asarray(number_of_girders), as_float(d_depth), as_float(c_spacing), as_float(b_width))
+    plate = section == KEY_GIRDER_SECTION[0]
+    multiple = n >= 2
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cd_plate = np.where(multiple, np.minimum(2.0 * (1.0 + c / (20.0 * d)), 4.0), 2.2)
+        cd_rolled_single = _single_rolled_drag(b, d)
+        cd_rolled = np.where(multiple, 1.5 * cd_rolled_single, cd_rolled_single)
+        valid = plate | ~multiple | (c / d <= 7.0)
+
+    CD = np.where(plate, cd_plate, cd_rolled)
+    valid = valid & np.isfinite(CD)
+    return np.where(valid, CD, np.nan), valid
+
+
+def transverse_wind_load(exposed_height, height_for_pz, girder_section, number_of_girders, d_depth,
+                         c_spacing=np.nan, b_width=np.nan, terrain='plain', basic_wind_speed=33):
+    """
+    Transverse wind force FT = Pz A1 G CD per metre length of deck as per
+    IRC:6-2017 Clause 209.3.3, for arrays of configurations.
+
+    Pz is evaluated once per distinct deck height and gathered back, so sweeping
+    girder layouts at a few deck levels costs one Table 12 lookup per level
+    (per element for Dual heights).
+
+    Args:
+        exposed_height (float or array): solid exposed depth of deck, railing and
+            crash barrier less openings (m); A1 per metre length
+        height_for_pz (float or array): height at which Pz is evaluated (m)
+        girder_section, number_of_girders, d_depth, c_spacing, b_width: see `drag_coefficient`
+        terrain (str): "plain" or "obstructed"
+        basic_wind_speed (float): basic wind speed Vb (m/s)
+
+    Returns:
+        dict: {"A1", "Pz", "G", "CD", "FT", "valid"} arrays broadcast over the inputs;
+            CD and FT are NaN where the drag coefficient is not defined (c/d > 7)
+    """
+    A1 = np.maximum(as_float(exposed_height), 0.0)
+
+    if isinstance(height_for_pz, Dual):
+        Pz = table_12(height_for_pz, terrain, basic_wind_speed)["Pz"]
+    else:
+        heights, inverse = np.unique(np.asarray(height_for_pz, dtype=float), return_inverse=True)
+        Pz = table_12(heights, terrain, basic_wind_speed)["Pz"][inverse].reshape(np.shape(height_for_pz))
+
+    # Gust factor G = 2.0 for spans up to 150 m
+    G = 2.0
+    CD, valid = drag_coefficient(girder_section, number_of_girders, d_depth, c_spacing, b_width)
+
+    A1, Pz, CD, valid = np.broadcast_arrays(A1, Pz, CD, valid)
+    return {
+        "A1": A1,
+        "Pz": Pz,
+        "G": G,
+        "CD": CD,
+        "FT": Pz * A1 * G * CD,
+        "valid": valid,
+    }
+
+
+def _integrate(values, spacing, rule):
+    # Integral along the last axis of equally spaced samples
+    if rule == 'trapezoidal':
+        return spacing * (values[..., 1:].sum(axis=-1) + values[..., :-1].sum(axis=-1)) / 2.0
+    if rule == 'simpson':
+        if (values.shape[-1] - 1) % 2:
+            raise ValueError("Simpson's rule needs an odd number of stations")
+        return spacing * (values[..., 0] + values[..., -1] + 4.0 * values[..., 1:-1:2].sum(axis=-1)
+                          + 2.0 * values[..., 2:-1:2].sum(axis=-1)) / 3.0
+    raise ValueError("rule must be 'trapezoidal' or 'simpson'")
+
+
+def pier_wind_load(pier_height, profile_z, profile_width, drag_coefficient, base_level=0.0,
+                   terrain='plain', basic_wind_speed=33, n_stations=41, rule='simpson'):
+    """
+    Wind force and overturning moment at the base of a batch of piers, integrated
+    along the pier height with Pz varying as per IRC:6-2017 Table 12.
+
+    Each pier is discretized into `n_stations` equally spaced stations, its width is
+    interpolated from a piecewise linear profile (repeat a level to model a step)
+    and Pz is evaluated for all stations of all piers in one Table 12 call.
+    The load per metre height is Pz G CD b(z) with G = 2.0.
+
+    Args:
+        pier_height (float or array): pier heights H above the base (m), (n_piers,)
+        profile_z (array): increasing levels of the width profile measured from the
+            pier base (m), (k,) shared or (n_piers, k)
+        profile_width (array): pier width facing the wind at those levels (m)
+        drag_coefficient (float or array): CD of each pier (IRC:6-2017 Table 13)
+        base_level (float or array): height of the pier base above ground or bed (m)
+        terrain (str): "plain" or "obstructed"
+        basic_wind_speed (float or array): basic wind speed Vb of each pier (m/s)
+        n_stations (int): stations per pier
+        rule (str): 'simpson' or 'trapezoidal'
+
+    Returns:
+        dict: {
+            'z': station levels above the pier base, (n_piers, n_stations),
+            'width': pier width at the stations,
+            'Pz': wind pressure at the stations,
+            'load_per_m': wind load per metre height at the stations,
+            'force': total wind force per pier, (n_piers,),
+            'moment': overturning moment about the pier base, (n_piers,),
+            'lever_arm': height of the resultant above the pier base, (n_piers,)
+        }
+    """
+    pier_height = np.atleast_1d(np.asarray(pier_height, dtype=float))
+    n_piers = pier_height.size
+    profile_z = np.broadcast_to(np.asarray(profile_z, dtype=float), (n_piers, np.shape(profile_z)[-1]))
+    profile_width = np.broadcast_to(np.asarray(profile_width, dtype=float), profile_z.shape)
+
+    fraction = np.linspace(0.0, 1.0, n_stations)
+    z = pier_height[:, None] * fraction[None, :]
+
+    # Batched piecewise linear interpolation of the width profile
+    k = profile_z.shape[-1]
+    seg = np.clip((profile_z[:, None, :] <= z[:, :, None]).sum(axis=-1) - 1, 0, k - 2)
+    z0 = np.take_along_axis(profile_z, seg, -1)
+    z1 = np.take_along_axis(profile_z, seg + 1, -1)
+    w0 = np.take_along_axis(profile_width, seg, -1)
+    w1 = np.take_along_axis(profile_width, seg + 1, -1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t = np.where(z1 > z0, np.clip((z - z0) / (z1 - z0), 0.0, 1.0), 1.0)
+    width = w0 + t * (w1 - w0)
+
+    level = np.asarray(base_level, dtype=float).reshape(-1, 1) + z
+    Pz = table_12(level, terrain, np.asarray(basic_wind_speed, dtype=float).reshape(-1, 1))["Pz"]
+
+    G = 2.0
+    load_per_m = Pz * G * np.asarray(drag_coefficient, dtype=float).reshape(-1, 1) * width
+
+    spacing = pier_height / (n_stations - 1)
+    force = _integrate(load_per_m, spacing, rule)
+    moment = _integrate(load_per_m * z, spacing, rule)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        lever_arm = np.where(force > 0.0, moment / force, 0.0)
+
+    return {
+        'z': z,
+        'width': width,
+        'Pz': Pz,
+        'load_per_m': load_per_m,
+        'force': force,
+        'moment': moment,
+        'lever_arm': lever_arm,
+    }